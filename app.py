@@ -1,14 +1,19 @@
 import streamlit as st
 
+from sonic import figure_cache, metrics
+
 st.set_page_config(
     page_title="Sonic Py-tagoras",
     page_icon="🎵",
     layout="wide",
     initial_sidebar_state="expanded"
 )
+metrics.begin("home")
 
 # --- HEADER COM ESTILO ---
 st.title("🎵 Sonic Py-tagoras")
+# Desenha todas as figuras fixas em segundo plano (se SONIC_PREWARM=1)
+figure_cache.prewarm_async()
 st.subheader("Enciclopédia Interativa de Acústica e Musicologia")
 
 st.markdown("""
@@ -73,4 +78,6 @@ with c_cred:
     st.caption("Focado em visualização de dados musicais.")
 
 # Dica visual para o sidebar
-st.sidebar.info("👆 Comece pelo módulo 01 para seguir a ordem cronológica do aprendizado!")
\ No newline at end of file
+st.sidebar.info("👆 Comece pelo módulo 01 para seguir a ordem cronológica do aprendizado!")
+
+metrics.finish()
@@ -0,0 +1,4 @@
+"""Benchmarks dos caminhos quentes (rodar com `python -m bench.<nome>`).
+
+`python -m bench` roda os que passam ou falham (ver `bench/__main__.py`).
+"""
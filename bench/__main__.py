@@ -0,0 +1,55 @@
+"""Roda os testes de regressão da pasta (os benchmarks que passam ou falham).
+
+    python -m bench [-k figure_memory]
+
+Cada teste roda num Python novo, como `python -m bench.<nome>`; o comando
+sai com código 1 se algum falhar. `client_audio` precisa do `node` e
+`hotpaths` de uma baseline gravada nesta máquina (`--save`): sem eles, o
+teste é pulado (e aparece como pulado no resumo). `bench.load` e
+`bench.oscillator` só medem, não entram aqui.
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+from bench.hotpaths import BASELINE
+from bench.pages import ROOT
+
+# (nome, motivo para pular ou None)
+CHECKS = [
+    ("importtime", None),
+    ("figure_memory", None),
+    ("client_audio", None if shutil.which("node") else "sem node no PATH"),
+    ("hotpaths", None if os.path.exists(BASELINE) else "sem baseline (python -m bench.hotpaths --save)"),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="pattern", default="", help="só os testes cujo nome contém este texto")
+    opts = parser.parse_args()
+
+    summary = []
+    for name, skip in CHECKS:
+        if opts.pattern not in name:
+            continue
+        if skip:
+            summary.append((name, f"pulado: {skip}"))
+            continue
+        print(f"\n=== bench.{name} ===", flush=True)
+        start = time.perf_counter()
+        code = subprocess.call([sys.executable, "-m", f"bench.{name}"], cwd=ROOT)
+        summary.append((name, f"{'ok' if code == 0 else 'FALHOU'} ({time.perf_counter() - start:.0f} s)"))
+
+    print()
+    for name, status in summary:
+        print(f"{name:16} {status}")
+    if any(status.startswith("FALHOU") for _, status in summary):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
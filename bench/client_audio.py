@@ -0,0 +1,114 @@
+"""Equivalência entre a síntese no navegador (`SONIC_AUDIO=client`) e a do servidor.
+
+    python -m bench.client_audio [--tolerance 1e-3]
+
+Para uma grade de clipes reais das páginas (os `Clip` de `sonic.clips`, que o
+`sonic.player` recebe), compara o sinal de referência do servidor
+(`synth.stream`, com o ganho de `audio_cache.encode`, antes do dither) com o de
+`Sonic.renderClip` de `frontend/synth.js`, rodado no Node com a mesma
+especificação JSON que vai para o navegador.
+
+Mostra o erro máximo (em fração do fundo de escala) e a relação sinal/erro.
+Sai com código 1 se algum clipe passar de `--tolerance` (1e-3 ≈ 33 LSB de 16
+bits, bem abaixo do audível) ou se os tamanhos não baterem. Precisa do `node`
+no PATH.
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+from bench.pages import ROOT
+from sonic import audio_cache, clips as page_clips, player, synth
+
+SYNTH_JS = os.path.join(ROOT, "sonic", "frontend", "synth.js")
+
+# Lê [[nome, spec], ...] do stdin e grava <dir>/<i>.f32 com o sinal de cada clipe
+NODE = """
+const fs = require('fs'), vm = require('vm'), path = require('path');
+const [file, dir] = process.argv.slice(1);
+const ctx = { Sonic: { views: {} }, Math, Float32Array };
+vm.runInNewContext(fs.readFileSync(file, 'utf8'), ctx);
+JSON.parse(fs.readFileSync(0, 'utf8')).forEach(([name, spec], i) => {
+    const out = ctx.Sonic.renderClip(spec);
+    fs.writeFileSync(path.join(dir, i + '.f32'), Buffer.from(out.buffer, out.byteOffset, out.byteLength));
+});
+"""
+
+
+def clips():
+    grid = {
+        # Página 3: escala pelas quintas, notas em sequência
+        "escala[7 quintas]": page_clips.fifths_scale(7),
+        "coma[puro, 3 s]": page_clips.tone(100.0, duration=3),
+        "coma[mix, 3 s]": page_clips.tone(100.0, 101.36, duration=3),
+        # Acima de STREAM_SECONDS: ganho fixo pelo limite de pico
+        "coma[mix, 30 s]": page_clips.tone(100.0, 101.36, duration=30),
+        "lobo[Pitagórico, C]": page_clips.wolf_chord(False, "Pitagórico", 3.0),
+        "lobo[Mesotônico, lobo, 10 s]": page_clips.wolf_chord(True, "Mesotônico", 10.0),
+        "acorde[C2 maior]": page_clips.chord(page_clips.chord_notes("C", 2, [0, 4, 7])[0]),
+        "acorde[F#5 maj7]": page_clips.chord(page_clips.chord_notes("F#", 5, [0, 4, 7, 11])[0]),
+    }
+    for osc in ["additive", "wavetable"]:
+        # Página 9: mistura da referência com a resposta, e o desafio
+        grid[f"treino[{osc}, mistura]"] = page_clips.tuner_mix(440.0, 447.5, "electric_piano", "soft_string", osc)
+        grid[f"treino[{osc}, desafio]"] = page_clips.beat_quiz(3, osc)
+    return grid
+
+
+def server(clip):
+    """Sinal do servidor em [-1, 1], com o mesmo ganho que `audio_cache.encode` aplica."""
+    out = np.concatenate(list(synth.stream(clip))) if synth.frames(clip) else np.zeros(0, np.float32)
+    if synth.frames(clip) > audio_cache.STREAM_SECONDS * clip.sr:
+        peak = synth.peak_bound(clip)
+    else:
+        peak = np.max(np.abs(out)) if out.size else 0
+    return out / peak if peak > 0 else out
+
+
+def client(grid):
+    with tempfile.TemporaryDirectory() as tmp:
+        specs = json.dumps([[name, player.spec(clip)] for name, clip in grid.items()])
+        subprocess.run(["node", "-e", NODE, SYNTH_JS, tmp], input=specs, text=True, check=True)
+        return [np.fromfile(os.path.join(tmp, f"{i}.f32"), dtype=np.float32) for i in range(len(grid))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tolerance", type=float, default=1e-3, help="erro máximo aceito (fração do fundo de escala)")
+    opts = parser.parse_args()
+
+    if not shutil.which("node"):
+        sys.exit("node não encontrado: a comparação roda o synth.js no Node")
+
+    grid = clips()
+    failed = []
+    print(f"{'clipe':34} {'sr':>6} {'amostras':>9} {'erro máx':>10} {'sinal/erro dB':>14}")
+    for (name, clip), got in zip(grid.items(), client(grid)):
+        ref = server(clip)
+        if got.size != ref.size:
+            print(f"{name:34} {clip.sr:6d} tamanhos diferentes: {ref.size} (servidor) x {got.size} (navegador)")
+            failed.append(name)
+            continue
+        err = np.abs(got.astype(np.float64) - ref)
+        worst = float(err.max()) if err.size else 0.0
+        noise = float(np.sqrt(np.mean(err**2))) if err.size else 0.0
+        snr = 20 * np.log10(np.sqrt(np.mean(ref.astype(np.float64) ** 2)) / noise) if noise > 0 else np.inf
+        flag = "  <-- DIFERENTE" if worst > opts.tolerance else ""
+        print(f"{name:34} {clip.sr:6d} {ref.size:9d} {worst:10.2e} {snr:14.1f}{flag}")
+        if worst > opts.tolerance:
+            failed.append(name)
+
+    if failed:
+        print(f"\nFora da tolerância: {', '.join(failed)}")
+        sys.exit(1)
+    print(f"\nNavegador e servidor equivalentes (erro máximo <= {opts.tolerance:g})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Teste de regressão: as figuras matplotlib não acumulam memória ao longo dos reruns.
+
+    python -m bench.figure_memory [--reruns 1000] [--max-growth-kb 256]
+
+Cada "rerun" faz o que as páginas fazem: desenha a interferência da página 7
+e o osciloscópio da página 9 (figuras recicladas de `sonic.scope`) e uma
+figura estática de `sonic.plots` sem passar pelo cache (o pior caso de
+`sonic.figure_cache`), em rodízio por toda a `plots.GRID`.
+
+Depois do aquecimento (imports e caches de fonte do matplotlib), os reruns
+rodam sob `tracemalloc` em duas metades iguais (500 + 500 por padrão, cada
+uma passando pela grade inteira várias vezes). O teste falha (código 1) se:
+
+* a memória Python alocada na 2ª metade passar de `--max-growth-kb`;
+* o número de `Figure` vivas mudar entre as metades;
+* algum pool de `sonic.scope` tiver mais de uma figura (os reruns aqui são
+  sequenciais: uma figura por pool, sempre a mesma).
+
+O RSS também é mostrado, mas só como informação: ele oscila dezenas de MB
+com o alocador, sem vazamento nenhum. Os 1000 reruns levam de 15 a 20 minutos (o
+`tracemalloc` deixa o matplotlib bem mais lento); para uma olhada rápida
+durante o desenvolvimento, `--reruns 66` cobre a grade duas vezes em ~1 min.
+Roda com os outros testes em `python -m bench`.
+"""
+import argparse
+import gc
+import os
+import resource
+import sys
+import tracemalloc
+import warnings
+
+import numpy as np
+
+from sonic import figure_cache, plots, scope, tuning
+
+WARMUP = 50
+STATIC = [(name, args) for name, grid in plots.GRID.items() for args in grid]
+
+
+def rss_mb():
+    try:
+        with open("/proc/self/statm") as fp:
+            return int(fp.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:  # Sem /proc (macOS): pico em vez do atual, ainda serve para detectar crescimento
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+
+def rerun(i, rng):
+    # Página 7: acorde de 3 ou 4 notas (a legenda muda de tamanho)
+    root = int(rng.integers(48, 72))
+    notes = [root, root + 4, root + 7] + ([root + 10] if i % 2 else [])
+    freqs = tuning.table("12-EDO")[notes]
+    t = np.linspace(0, 0.04, int(44100 * 0.04), endpoint=False)
+    waves = [np.sin(2 * np.pi * f * t) for f in freqs]
+    scope.chord_waves(t, waves, [f"{f:.1f} Hz" for f in freqs], np.sum(waves, axis=0))
+
+    # Página 9: alvo e usuário em frequências aleatórias
+    t_vis = np.linspace(0, 0.02, 1000)
+    ft, fu = rng.uniform(430, 450, size=2)
+    scope.oscilloscope(t_vis, np.sin(2 * np.pi * ft * t_vis), np.sin(2 * np.pi * fu * t_vis))
+
+    # Figura estática sem cache: cria, salva e libera
+    name, args = STATIC[i % len(STATIC)]
+    figure_cache._draw(name, args, "png")
+
+
+def live_figures():
+    from matplotlib.figure import Figure
+
+    gc.collect()
+    # type() e não isinstance(): isinstance lê `__class__`, e alguns proxies
+    # preguiçosos do Streamlit importam módulos (e alocam) quando lido
+    return sum(type(o) is Figure for o in gc.get_objects())
+
+
+def traced_kb():
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0] / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reruns", type=int, default=1000, help="reruns medidos (duas metades)")
+    parser.add_argument("--max-growth-kb", type=float, default=256.0, help="crescimento aceito na 2ª metade")
+    opts = parser.parse_args()
+
+    # Emojis sem glifo na fonte padrão geram um aviso por figura
+    warnings.filterwarnings("ignore", message="Glyph")
+
+    rng = np.random.default_rng(0)
+    for i in range(WARMUP):
+        rerun(i, rng)
+    print(f"RSS após {WARMUP} reruns de aquecimento: {rss_mb():.1f} MB")
+
+    half = max(opts.reruns // 2, 1)
+    live_figures()  # Fora da medição: a 1ª varredura do gc ainda pode carregar algo
+    tracemalloc.start()
+    checkpoints = []
+    for part in range(2):
+        for i in range(half):
+            rerun(WARMUP + part * half + i, rng)
+        checkpoints.append((traced_kb(), live_figures(), rss_mb()))
+        print(f"  rerun {(part + 1) * half:5d}: {checkpoints[-1][0]:9.1f} KB alocados, "
+              f"{checkpoints[-1][1]} figuras vivas, RSS {checkpoints[-1][2]:.1f} MB")
+    tracemalloc.stop()
+
+    (mid_kb, mid_figs, _), (end_kb, end_figs, _) = checkpoints
+    growth = end_kb - mid_kb
+    pools = {"CHORD_WAVES": scope.CHORD_WAVES.created, "OSCILLOSCOPE": scope.OSCILLOSCOPE.created}
+    print(f"Crescimento na 2ª metade: {growth:+.1f} KB (limite {opts.max_growth_kb:.0f} KB)")
+    print(f"Figuras vivas: {mid_figs} -> {end_figs}; figuras por pool: {pools}")
+
+    failures = []
+    if growth > opts.max_growth_kb:
+        failures.append(f"a memória cresce com os reruns ({growth:+.1f} KB)")
+    if end_figs != mid_figs:
+        failures.append(f"figuras vivas mudaram de {mid_figs} para {end_figs}")
+    failures += [f"pool {name} com {n} figuras (esperado 1)" for name, n in pools.items() if n != 1]
+    if failures:
+        for failure in failures:
+            print(f"FALHOU: {failure}")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
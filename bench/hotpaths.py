@@ -0,0 +1,242 @@
+"""Suíte de micro-benchmarks dos caminhos quentes das páginas, com baseline.
+
+    python -m bench.hotpaths --save           # 1º passo: grava a baseline desta máquina
+    python -m bench.hotpaths                  # compara com bench/baseline.json
+    python -m bench.hotpaths -k play_system --threshold 0.1 --repeat 9
+
+Chama as funções reais das páginas: os clipes de `sonic.clips` (o tom da
+página 4, o acorde do Lobo da 5 e o da 7), `draw_piano` (5) e, carregadas do
+código-fonte por `bench.pages`, `generate_wave` (9) e a tabela de trastes (8),
+numa grade de parâmetros parecida com o uso real. Os clipes viram WAV como no
+modo servidor. O cache de áudio é esvaziado antes de cada chamada, então o tempo é
+o de síntese + codificação.
+
+Por caso: melhor tempo e mediana de `--rounds` rodadas intercaladas de
+`--repeat` chamadas (ou mais, até somar `MIN_SECONDS` por rodada) e, numa
+chamada sob `tracemalloc`, o pico de memória, o que ficou alocado depois e as
+alocações: o `tracemalloc` não conta alocações passageiras, então o número
+registrado é o de blocos alocados pela chamada e ainda vivos quando ela
+retorna (resultado incluído). Um caso regride quando o melhor tempo ou o pico
+passam da baseline por mais que `--threshold` (fração), e o tempo também por
+mais que o ruído do caso (mediana - melhor, no mínimo `MIN_DELTA_MS`); aí o
+script sai com código 1. Antes disso os casos acima da baseline são medidos
+de novo (`--confirm`): num servidor compartilhado, uma rajada de lentidão
+pode cobrir todas as rodadas de um caso.
+
+A baseline só vale para a máquina que a gravou (tempos de outra máquina dão
+regressões falsas), por isso não vai para o git (`.gitignore`): grave a sua
+com `--save` antes de comparar.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+import warnings
+
+import numpy as np
+
+from bench.pages import load
+from sonic import audio_cache, clips, figure_cache, tuning
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+MIN_SECONDS = 0.1
+# Diferenças de tempo abaixo disso são ruído do agendador, não regressão
+MIN_DELTA_MS = 0.5
+# Chave da baseline com o tempo do núcleo de calibração (não é um caso)
+CALIBRATION = "_calibracao"
+
+
+def calibration():
+    # Trabalho fixo, sem código do sonic (NumPy + laço Python), para medir a
+    # velocidade da máquina agora: a baseline é escalada por ele na comparação
+    x = np.arange(200_000, dtype=np.float32)
+    np.sin(x, out=x)
+    return sum(range(50_000))
+
+
+def cases():
+    fret_table, fret_diff = load(8, "fret_table", "fret_diff")
+    (generate_wave,) = load(9, "generate_wave")
+
+    grid = {}
+    for freqs in [(100.0,), (100.0, 101.36)]:
+        for duration in [3, 10, 30]:
+            name = f"gen_tone[{len(freqs)} nota(s), {duration} s]"
+            grid[name] = lambda f=freqs, d=duration: audio_cache.wav(clips.tone(*f, duration=d))
+
+    for system in clips.WOLF_SYSTEMS:
+        for wolf in [False, True]:
+            for duration in [3, 10]:
+                name = f"play_system[{system}, {'lobo' if wolf else 'C'}, {duration} s]"
+                grid[name] = lambda s=system, w=wolf, d=duration: audio_cache.wav(clips.wolf_chord(w, s, d))
+
+    for wolf in [True, False]:
+        # Desenho + PNG sem passar pelo cache de figuras
+        grid[f"draw_piano[lobo={wolf}]"] = lambda w=wolf: figure_cache._draw("draw_piano", (w,), "png")
+
+    for timbre in ["flute", "soft_string", "electric_piano"]:
+        # Osciloscópio do spoiler (20 ms a 50 kHz) e uma nota de 3 s
+        grid[f"generate_wave[{timbre}, 20 ms]"] = lambda w=timbre: generate_wave(440.0, 0.02, w, 50000)
+        grid[f"generate_wave[{timbre}, 3 s]"] = lambda w=timbre: generate_wave(440.0, 3.0, w)
+
+    for root in ["C", "F#"]:
+        for octave in [2, 5]:
+            for intervals in [[0, 4, 7], [0, 3, 6], [0, 4, 7, 11]]:
+                name = f"acorde[{root}{octave}, {'-'.join(map(str, intervals))}]"
+                grid[name] = lambda r=root, o=octave, i=intervals: audio_cache.wav(clips.chord(clips.chord_notes(r, o, i)[0]))
+
+    for scale in [630, 650, 864]:
+        grid[f"trastes[{scale} mm]"] = lambda c=scale: fret_diff(fret_table(c))
+
+    return grid
+
+
+def timings(fn, repeat):
+    # Pelo menos `repeat` chamadas e MIN_SECONDS de medição: casos rápidos repetem mais
+    times = []
+    while len(times) < repeat or sum(times) < MIN_SECONDS:
+        audio_cache.CACHE.clear()
+        t = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t)
+    return times
+
+
+def memory(fn):
+    """(pico KB, retido KB, blocos) de uma chamada, pelo `tracemalloc`."""
+    audio_cache.CACHE.clear()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = fn()
+    # Tudo no snapshot foi alocado depois do `start`, ou seja, pela chamada
+    blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    del result
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (peak - before) / 1024, (after - before) / 1024, blocks
+
+
+def compare(result, base, threshold, speed=1.0):
+    """Lista das métricas que passaram da baseline.
+
+    `speed`: calibração de agora / da baseline (> 1 = máquina mais lenta agora);
+    os tempos da baseline são escalados por ele.
+    """
+    if base is None:
+        return []
+    base = {**base, "best_ms": base["best_ms"] * speed}
+    # Piso de ruído do tempo: o espalhamento do próprio caso nesta execução
+    # (mediana - melhor), que cresce com o tempo do caso e com a carga da máquina
+    noise = max(MIN_DELTA_MS, result["median_ms"] - result["best_ms"])
+    return [
+        f"{key} {base[key]:.1f} -> {result[key]:.1f}"
+        for key in ("best_ms", "peak_kb")
+        if result[key] > base[key] * (1 + threshold)
+        and (key != "best_ms" or result[key] - base[key] > noise)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="pattern", default="", help="só os casos cujo nome contém este texto")
+    parser.add_argument("--repeat", type=int, default=5, help="chamadas por caso em cada rodada")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--threshold", type=float, default=0.25, help="regressão tolerada (0.25 = +25%%)")
+    parser.add_argument("--confirm", type=int, default=2, help="novas medições dos casos acima da baseline")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--save", action="store_true", help="grava os resultados como nova baseline")
+    opts = parser.parse_args()
+
+    warnings.filterwarnings("ignore", message="Glyph")
+    tuning.table("12-EDO")  # Tabelas prontas antes de medir
+
+    baseline = {}
+    if os.path.exists(opts.baseline) and not opts.save:
+        with open(opts.baseline) as fp:
+            baseline = json.load(fp)
+
+    selected = {name: fn for name, fn in cases().items() if opts.pattern in name}
+    mem = {}
+    for name, fn in selected.items():
+        fn()  # Aquecimento (imports, tabelas de wavetable, fontes do matplotlib)
+        mem[name] = memory(fn)
+
+    # Rodadas intercaladas: uma rajada de ruído da máquina não pega só um caso.
+    # A calibração roda entre os casos, para pegar a mesma velocidade da máquina.
+    times = {name: [] for name in selected}
+    calib = []
+
+    def measure(names, rounds):
+        for _ in range(rounds):
+            for name in names:
+                calib.extend(timings(calibration, opts.repeat))
+                times[name] += timings(selected[name], opts.repeat)
+
+    def summary(name):
+        return {
+            "best_ms": round(min(times[name]) * 1e3, 3),
+            "median_ms": round(statistics.median(times[name]) * 1e3, 3),
+            "peak_kb": round(mem[name][0], 1),
+            "retained_kb": round(mem[name][1], 1),
+            "blocks": mem[name][2],
+        }
+
+    base_calib = baseline.pop(CALIBRATION, None)
+    measure(selected, opts.rounds)
+    # Uma rajada de lentidão pode cobrir todas as rodadas de um caso: os suspeitos
+    # são medidos de novo (`--confirm` vezes) e só contam se continuarem acima
+    for _ in range(opts.confirm):
+        calib_ms = round(min(calib) * 1e3, 3)
+        speed = calib_ms / base_calib["best_ms"] if base_calib else 1.0
+        suspects = [name for name in selected if compare(summary(name), baseline.get(name), opts.threshold, speed)]
+        if not suspects:
+            break
+        measure(suspects, opts.rounds)
+    calib_ms = round(min(calib) * 1e3, 3)
+    speed = calib_ms / base_calib["best_ms"] if base_calib else 1.0
+
+    results, regressions = {}, {}
+    print(f"{'caso':44} {'melhor ms':>10} {'mediana':>9} {'pico KB':>10} {'retido KB':>10} {'blocos':>7}")
+    for name in selected:
+        result = results[name] = summary(name)
+        worse = compare(result, baseline.get(name), opts.threshold, speed)
+        if worse:
+            regressions[name] = worse
+        print(
+            f"{name:44} {result['best_ms']:10.2f} {result['median_ms']:9.2f} "
+            f"{result['peak_kb']:10.1f} {result['retained_kb']:10.1f} {result['blocks']:7d}"
+            + ("  <-- REGRESSÃO" if worse else "")
+        )
+
+    print(f"\ncalibração: {calib_ms:.2f} ms" + (f" ({speed:.2f}x a da baseline)" if base_calib else ""))
+    if opts.save:
+        if opts.pattern and os.path.exists(opts.baseline):
+            with open(opts.baseline) as fp:
+                results = {**json.load(fp), **results}
+        results[CALIBRATION] = {"best_ms": calib_ms}
+        with open(opts.baseline, "w") as fp:
+            json.dump(results, fp, indent=1, ensure_ascii=False, sort_keys=True)
+            fp.write("\n")
+        print(f"\nBaseline gravada em {opts.baseline}")
+        return
+
+    if not baseline:
+        print(f"\nSem baseline em {opts.baseline}: grave a desta máquina com --save")
+        return
+
+    missing = [name for name in results if name not in baseline]
+    if missing:
+        print(f"\nSem baseline para {len(missing)} caso(s): {', '.join(missing)}")
+    if regressions:
+        print(f"\n{len(regressions)} regressão(ões) acima de {opts.threshold:.0%}:")
+        for name, worse in regressions.items():
+            print(f"  {name}: {'; '.join(worse)}")
+        sys.exit(1)
+    print(f"\nSem regressões acima de {opts.threshold:.0%} ({len(results)} casos)")
+
+
+if __name__ == "__main__":
+    main()
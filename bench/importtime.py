@@ -0,0 +1,118 @@
+"""Custo de import da primeira visita a cada página, contra um orçamento.
+
+    python -m bench.importtime [--scale 1.5] [--verbose]
+
+Para cada script (app.py e as páginas) sobe um Python novo com
+`-X importtime`, aquece o Streamlit (o servidor já tem tudo dele carregado) e
+roda o script uma vez pelo `AppTest`. Conta só os imports feitos durante essa
+primeira execução, como na primeira visita de um aluno a um contêiner novo.
+Mostra o total, os imports mais pesados e o tempo do primeiro rerun.
+
+Sai com código 1 se alguma página passar do seu orçamento em `BUDGET_MS`.
+`--scale` multiplica todos os orçamentos (máquinas mais lentas). A regra da
+casa: import pesado só no caminho que precisa dele. pandas/altair só onde há
+tabela ou gráfico, e matplotlib só quando uma figura é de fato desenhada
+(com `SONIC_PREWARM=1` nem isso: as figuras já estão no cache).
+"""
+import argparse
+import glob
+import os
+import subprocess
+import sys
+
+from bench.pages import ROOT
+
+SCRIPTS = [os.path.join(ROOT, "app.py")] + sorted(glob.glob(os.path.join(ROOT, "pages", "*.py")))
+MARK = "--- sonic: primeira execução ---"
+
+# ms de import na primeira visita, com folga sobre o medido (figuras sem prewarm)
+BUDGET_MS = {
+    "app": 50,     # nada pesado: o prewarm carrega o matplotlib na thread de fundo
+    "1": 1700,    # matplotlib (modos da corda) + altair/pandas (barras), os dois na Aula Teórica
+    "2": 200,     # só numpy: o componente recebe JSON em texto
+    "3": 900,     # matplotlib (círculo das quintas)
+    "4": 900,     # matplotlib (espiral do coma)
+    "5": 1400,    # matplotlib (teclado) + pandas (tabela comparativa)
+    "6": 200,     # só numpy: a latência das notas fica no navegador
+    "7": 900,     # matplotlib (interferência); pandas só na seção da matemática
+    "8": 1800,    # altair + pandas + Styler da tabela colorida (o módulo puxa o pyplot)
+    "9": 900,     # matplotlib (osciloscópio)
+}
+
+CHILD = f"""
+import os, sys, tempfile, time
+from streamlit.testing.v1 import AppTest
+
+# Aquece o Streamlit com um script trivial: esses imports o servidor já pagou
+with tempfile.NamedTemporaryFile("w", suffix=".py", delete=False) as fp:
+    fp.write("import streamlit as st\\nst.set_page_config(page_icon='🎵')\\nst.write('ok')\\n")
+AppTest.from_file(fp.name).run()
+os.unlink(fp.name)
+
+sys.stderr.write({MARK!r} + "\\n")
+sys.stderr.flush()
+t = time.perf_counter()
+at = AppTest.from_file(sys.argv[1], default_timeout=300).run()
+print(time.perf_counter() - t, len(at.exception))
+"""
+
+
+def profile(script):
+    """(ms de import na primeira execução, [(ms, módulo)] de topo, s do rerun, erros)."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD, script],
+        capture_output=True, text=True, cwd=ROOT, env={**os.environ, "PYTHONPATH": ROOT},
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{script}: {proc.stderr[-2000:]}")
+    seconds, errors = proc.stdout.split()[-2:]
+
+    top = []
+    lines = proc.stderr.split(MARK, 1)[1].splitlines()
+    for line in lines:
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Só os imports de topo (os aninhados já estão no cumulativo do pai)
+        if name.startswith("  "):
+            continue
+        top.append((int(cumulative) / 1e3, name.strip()))
+    return sum(ms for ms, _ in top), sorted(top, reverse=True), float(seconds), int(errors)
+
+
+def key(script):
+    name = os.path.basename(script)
+    return "app" if name == "app.py" else name.split("_", 1)[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplica os orçamentos")
+    parser.add_argument("--verbose", action="store_true", help="lista os 5 imports mais pesados de cada página")
+    opts = parser.parse_args()
+
+    over = []
+    print(f"{'script':34} {'import ms':>10} {'orçamento':>10} {'1º rerun ms':>12}  mais pesado")
+    for script in SCRIPTS:
+        total, top, seconds, errors = profile(script)
+        budget = BUDGET_MS[key(script)] * opts.scale
+        heaviest = f"{top[0][1]} ({top[0][0]:.0f} ms)" if top else "-"
+        flag = "  <-- ESTOUROU" if total > budget else ""
+        name = os.path.basename(script)[:-3]
+        print(f"{name:34} {total:10.0f} {budget:10.0f} {seconds * 1e3:12.0f}  {heaviest}{flag}")
+        if errors:
+            print(f"  (o script terminou com {errors} exceção(ões))")
+        if opts.verbose:
+            for ms, module in top[:5]:
+                print(f"    {ms:8.1f} ms  {module}")
+        if total > budget:
+            over.append(name)
+
+    if over:
+        print(f"\nAcima do orçamento: {', '.join(over)}")
+        sys.exit(1)
+    print("\nTodas as páginas dentro do orçamento de import")
+
+
+if __name__ == "__main__":
+    main()
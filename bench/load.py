@@ -0,0 +1,228 @@
+"""Teste de carga headless: N alunos simultâneos mexendo nas páginas (AppTest).
+
+    python -m bench.load --sessions 30 --duration 60
+    python -m bench.load --sessions 10,30,60,100 --page 7 --slo-ms 1000
+
+Cada sessão simulada é uma thread com o seu `AppTest` (estado de sessão
+próprio), como as sessões de um servidor Streamlit dentro de um único processo.
+A sessão abre a página e, até acabar o tempo, repete: espera um "tempo de
+leitura" aleatório (média `--think` s), mexe num widget sorteado da página
+(botão, slider, selectbox, rádio, checkbox, number input) e mede o rerun.
+As sessões se distribuem entre todas as páginas ou ficam numa só (`--page`),
+como numa turma seguindo a mesma aula.
+
+Relata, para cada N: latência do rerun (p50/p95/p99, geral e por página),
+vazão (reruns/s), erros e o RSS do processo. Com vários N (`--sessions
+10,30,60`), diz qual foi o maior N com p95 dentro de `--slo-ms`: uma
+estimativa de quantos alunos um contêiner (um processo) aguenta.
+
+Limitações: o AppTest não tem WebSocket nem navegador. O tempo medido é o do
+script no servidor (síntese, figuras, serialização dos elementos), sem rede.
+Todas as sessões do AppTest usam o mesmo id de sessão, então a mídia fica
+registrada só para a última sessão. Por isso o RSS sai otimista em relação a
+um servidor real.
+"""
+import argparse
+import glob
+import logging
+import os
+import re
+import threading
+import time
+import warnings
+from collections import Counter
+from contextlib import nullcontext
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from bench.figure_memory import rss_mb
+from bench.pages import ROOT
+
+PAGES = sorted(glob.glob(os.path.join(ROOT, "pages", "*.py")))
+WIDGETS = ("button", "slider", "select_slider", "selectbox", "radio", "checkbox", "toggle", "number_input")
+
+
+def shared_runtime():
+    """Runtime simulado único para todas as sessões.
+
+    O `AppTest` instala um `Runtime` falso no início de cada run e o remove no
+    fim, além de remendar o `config` global. Com várias sessões em threads,
+    o fim de um run derruba o runtime de outro que ainda roda ("Runtime
+    hasn't been created!"). Aqui um runtime e o remendo do config valem para o
+    processo inteiro, e as trocas feitas pelo `AppTest` viram inócuas.
+    """
+    from streamlit import config
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+    from streamlit.runtime.media_file_manager import MediaFileManager
+    from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+    from streamlit.testing.v1 import app_test
+    from streamlit.testing.v1.util import build_mock_config_get_option
+
+    runtime = MagicMock(spec=Runtime)
+    runtime.media_file_mgr = MediaFileManager(MemoryMediaFileStorage("/mock/media"))
+    runtime.cache_storage_manager = MemoryCacheStorageManager()
+    Runtime._instance = runtime
+
+    # `app_test` faz `Runtime._instance = ...`: numa subclasse, não mexe no singleton real
+    app_test.Runtime = type("SessionRuntime", (Runtime,), {})
+    app_test.patch_config_options = lambda overrides: nullcontext()
+    patch.object(config, "get_option", new=build_mock_config_get_option({"global.appTest": True})).start()
+    return runtime
+
+
+def _numbers(text):
+    for m in re.findall(r"-?\d+(?:\.\d+)?", text):
+        yield float(m) if "." in m else int(m)
+
+
+def choices(widget):
+    """Valores aceitos por um widget de opções (o AppTest só vê as opções já formatadas)."""
+    fmt = widget.format_func
+    found = []
+    for text in widget.options:
+        for value in (text, *_numbers(text)):
+            try:
+                if fmt(value) == text:
+                    found.append(value)
+                    break
+            except Exception:
+                continue
+    return found
+
+
+def interact(at, rng):
+    """Uma ação de aluno: mexe num widget sorteado da página e reroda."""
+    widgets = [w for kind in WIDGETS for w in getattr(at, kind) if not w.disabled]
+    if not widgets:
+        return at.run()
+    w = widgets[rng.integers(len(widgets))]
+    kind = type(w).__name__
+
+    if kind == "Button":
+        w.click()
+    elif kind in ("Checkbox", "Toggle"):
+        w.set_value(not w.value)
+    elif kind in ("Selectbox", "Radio", "SelectSlider"):
+        options = choices(w)
+        if options:
+            w.set_value(options[rng.integers(len(options))])
+    elif kind == "Slider" and not isinstance(w.value, (tuple, list)):
+        steps = int(round((w.max - w.min) / w.step))
+        w.set_value(type(w.value)(w.min + w.step * rng.integers(steps + 1)))
+    elif kind == "NumberInput":
+        # Até 10 passos para cada lado (sem limite declarado o proto traz ±1.8e308)
+        lo = max(w.value - 10 * w.step, w.min if w.min is not None else -np.inf)
+        hi = min(w.value + 10 * w.step, w.max if w.max is not None else np.inf)
+        w.set_value(type(w.value)(lo + w.step * rng.integers(int((hi - lo) / w.step) + 1)))
+    return at.run()
+
+
+class Session(threading.Thread):
+    def __init__(self, page, stop_at, think, seed, timeout, on_rerun):
+        super().__init__(daemon=True)
+        self.page = page
+        self.stop_at = stop_at
+        self.think = think
+        self.rng = np.random.default_rng(seed)
+        self.timeout = timeout
+        self.on_rerun = on_rerun
+
+    def run(self):
+        from streamlit.testing.v1 import AppTest
+
+        # Chegadas espalhadas, não todos no mesmo milissegundo
+        time.sleep(self.rng.uniform(0, self.think))
+        at = AppTest.from_file(self.page, default_timeout=self.timeout)
+        action = at.run
+        while time.monotonic() < self.stop_at:
+            t = time.perf_counter()
+            try:
+                action()
+                error = at.exception[0].value if at.exception else None
+            except Exception as e:
+                error = repr(e)
+            self.on_rerun(self.page, time.perf_counter() - t, error)
+            time.sleep(self.rng.exponential(self.think))
+            action = lambda: interact(at, self.rng)
+
+
+def percentiles(samples):
+    return np.percentile(np.array(samples) * 1e3, [50, 95, 99])
+
+
+def step(n, opts, runtime):
+    pages = [PAGES[opts.page - 1]] if opts.page else PAGES
+    latencies = {page: [] for page in pages}
+    errors = Counter()
+    peak = [rss_mb()]
+    lock = threading.Lock()
+
+    def on_rerun(page, seconds, error):
+        with lock:
+            latencies[page].append(seconds)
+            if error:
+                errors[(os.path.basename(page), error.splitlines()[0][:120])] += 1
+            peak[0] = max(peak[0], rss_mb())
+        # O servidor real limpa a mídia órfã ao fim de cada run
+        runtime.media_file_mgr.remove_orphaned_files()
+
+    start = time.monotonic()
+    stop_at = start + opts.duration
+    sessions = [
+        Session(pages[i % len(pages)], stop_at, opts.think, opts.seed + i, opts.timeout, on_rerun) for i in range(n)
+    ]
+    for s in sessions:
+        s.start()
+    for s in sessions:
+        s.join()
+    elapsed = time.monotonic() - start
+
+    every = [x for page in pages for x in latencies[page]]
+    p50, p95, p99 = percentiles(every)
+    print(f"\n=== {n} sessões, {elapsed:.0f} s ===")
+    print(f"{'página':34} {'reruns':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for page in pages:
+        if not latencies[page]:
+            continue  # N menor que o número de páginas
+        q = percentiles(latencies[page])
+        name = os.path.basename(page)[:-3]
+        print(f"{name:34} {len(latencies[page]):7d} {q[0]:8.0f} {q[1]:8.0f} {q[2]:8.0f}")
+    print(f"{'TOTAL':34} {len(every):7d} {p50:8.0f} {p95:8.0f} {p99:8.0f}")
+    print(f"Vazão: {len(every) / elapsed:.1f} reruns/s | erros: {sum(errors.values())} | RSS pico: {peak[0]:.0f} MB")
+    for (page, message), count in errors.most_common(5):
+        print(f"  {count}x {page}: {message}")
+    return p95
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", default="30", help="N simultâneos; vários separados por vírgula (ex.: 10,30,60)")
+    parser.add_argument("--duration", type=float, default=60.0, help="segundos de carga por N")
+    parser.add_argument("--think", type=float, default=2.0, help="tempo médio entre ações de um aluno (s)")
+    parser.add_argument("--page", type=int, default=0, help="só a página N (0 = todas, em rodízio)")
+    parser.add_argument("--slo-ms", type=float, default=1000.0, help="p95 aceitável para a estimativa de capacidade")
+    parser.add_argument("--timeout", type=float, default=120.0, help="limite de um rerun (s)")
+    parser.add_argument("--seed", type=int, default=0)
+    opts = parser.parse_args()
+
+    warnings.filterwarnings("ignore", message="Glyph")
+    logging.disable(logging.WARNING)  # Avisos de depreciação do Streamlit saem a cada rerun
+    runtime = shared_runtime()
+
+    ok = []
+    for n in (int(x) for x in opts.sessions.split(",")):
+        p95 = step(n, opts, runtime)
+        if p95 <= opts.slo_ms:
+            ok.append(n)
+
+    print()
+    if ok:
+        print(f"Capacidade estimada: {max(ok)} sessões simultâneas com p95 <= {opts.slo_ms:.0f} ms")
+    else:
+        print(f"Nenhum N testado ficou com p95 <= {opts.slo_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
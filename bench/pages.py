@@ -0,0 +1,76 @@
+"""Carrega funções de uma página do Streamlit sem rodar a página.
+
+As páginas são scripts: importar o arquivo executaria os widgets. Aqui o
+código-fonte é lido com `ast` e só entra o que as funções pedidas usam: os
+imports, as `def` de nível de módulo e as atribuições simples das quais elas
+dependem (também as de dentro de blocos `with`). Atribuições que chamam o
+`st` (valores de widgets) ficam de fora: quem usa a função passa esses
+valores como argumento.
+"""
+import ast
+import glob
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def path(number):
+    (found,) = glob.glob(os.path.join(ROOT, "pages", f"{number}_*.py"))
+    return found
+
+
+def _names(node):
+    return {n.id for n in ast.walk(node) if isinstance(n, ast.Name)}
+
+
+def _free(node):
+    """Nomes que `node` lê de fora (numa `def`, descontando parâmetros e locais)."""
+    if isinstance(node, ast.Assign):
+        return _names(node.value)
+    local = {a.arg for a in ast.walk(node.args) if isinstance(a, ast.arg)}
+    local |= {n.id for n in ast.walk(node) if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Store)}
+    used = set().union(*(_names(d) for d in node.decorator_list + node.args.defaults + node.args.kw_defaults if d))
+    return used | (_names(node) - local)
+
+
+def _definitions(tree):
+    """Nome -> nó, para `def` e atribuições simples (no topo ou dentro de `with`)."""
+    found = {}
+    body = list(tree.body)
+    while body:
+        node = body.pop(0)
+        if isinstance(node, ast.With):
+            body[:0] = node.body
+        elif isinstance(node, ast.FunctionDef):
+            found[node.name] = node
+        elif isinstance(node, ast.Assign) and "st" not in _names(node.value):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    found[target.id] = node
+    return found
+
+
+def load(number, *names):
+    """Devolve as funções `names` da página `number` (ex.: `load(4, "gen_tone")`)."""
+    with open(path(number), encoding="utf-8") as fp:
+        tree = ast.parse(fp.read())
+    defs = _definitions(tree)
+
+    # Fecho das dependências: cada definição puxa os nomes que ela lê
+    needed, pending = set(), list(names)
+    while pending:
+        name = pending.pop()
+        if name in needed or name not in defs:
+            continue
+        needed.add(name)
+        pending.extend(_free(defs[name]))
+
+    keep = {id(defs[name]) for name in needed}
+    imports = [n for n in tree.body if isinstance(n, (ast.Import, ast.ImportFrom))]
+    nodes = [n for n in ast.walk(tree) if id(n) in keep]
+    nodes.sort(key=lambda n: n.lineno)
+
+    module = ast.Module(body=imports + nodes, type_ignores=[])
+    namespace = {"__name__": f"page{number}"}
+    exec(compile(module, path(number), "exec"), namespace)
+    return tuple(namespace[name] for name in names)
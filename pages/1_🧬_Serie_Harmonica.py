@@ -1,12 +1,9 @@
 import streamlit as st
-import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-import altair as alt
-import streamlit.components.v1 as components # Importante para a animação lisa
-import json
+
+from sonic import canvas, figure_cache, live, metrics, plots
 
 st.set_page_config(page_title="Série Harmônica Viva", page_icon="🎻", layout="wide")
+metrics.begin("serie_harmonica")
 
 # --- CSS ---
 st.markdown("""
@@ -32,6 +29,7 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 st.title("🎻 Série Harmônica: A Física da Música")
+figure_cache.prewarm_async()
 
 # --- ESTADO GLOBAL ---
 if 'amplitudes' not in st.session_state:
@@ -59,6 +57,12 @@ def apply_preset(name):
         if f"sl_{i}" in st.session_state:
             st.session_state[f"sl_{i}"] = val
 
+def extend_series(amps, n):
+    amps = list(amps)
+    for h in range(len(amps) + 1, n + 1):
+        amps.append(amps[h - 3] * (h - 2) / h)
+    return amps
+
 # =========================================
 # CONTEÚDO 1: TEORIA
 # =========================================
@@ -66,26 +70,10 @@ if menu == "📚 Aula Teórica":
     st.header("📚 Fundamentos da Acústica")
     st.subheader("1. Como a corda se divide?")
     
-    fig_theory, axs = plt.subplots(4, 1, figsize=(10, 8))
-    fig_theory.patch.set_facecolor('#0e1117')
-    plt.subplots_adjust(hspace=0.6)
-    
-    for i in range(4):
-        h = i + 1
-        x_t = np.linspace(0, 1, 400)
-        y_t = np.sin(h * np.pi * x_t)
-        
-        ax = axs[i]
-        ax.set_facecolor('#0e1117')
-        ax.set_title(f"H{h} (Frequência = {h}x) - Divide a corda em {h} partes", color='white', fontsize=12, pad=10)
-        ax.plot(x_t, y_t, color='#4CAF50', lw=2)
-        ax.plot(x_t, -y_t, color='#4CAF50', lw=2, alpha=0.3, ls='--')
-        ax.axis('off')
-        
-        nodes = np.linspace(0, 1, h+1)
-        ax.scatter(nodes, np.zeros_like(nodes), color='white', s=30, zorder=5)
-
-    st.pyplot(fig_theory)
+    if canvas.enabled():
+        canvas.string_modes()
+    else:
+        st.image(figure_cache.image("string_modes"), width="stretch")
     
     st.divider()
     
@@ -113,6 +101,9 @@ if menu == "📚 Aula Teórica":
         """, unsafe_allow_html=True)
         
     with col_chart:
+        import pandas as pd  # Só nesta seção: a Corda Viva e o Violão não pagam o import
+        import altair as alt
+
         st.markdown("#### 🎹 O 'DNA' do Som")
         dados_harmonicos = []
         nomes_notas = ["Tônica (1x)", "Oitava (2x)", "Quinta (3x)", "Oitava (4x)", "Terça Maior (5x)", "Quinta (6x)", "7ª Menor (7x)", "Oitava (8x)"]
@@ -202,127 +193,23 @@ elif menu == "🎻 Corda Viva (Visualizador)":
         
         show_sum = st.checkbox("Mostrar Soma (Linha Branca)", value=True)
 
+        # Série estendida: do H7 em diante cada harmônico continua a queda 1/n do
+        # harmônico de mesma paridade (ímpares a partir do H5, pares a partir do H6)
+        n_harm = st.select_slider("Harmônicos na animação", options=[6, 16, 32, 64], value=6)
+
     with col_vis:
         st.subheader("Interferência em Tempo Real")
         
-        # --- PREPARAÇÃO DOS DADOS PRO JAVASCRIPT ---
-        # Enviamos agora o "speed" junto com o resto
-        js_data = json.dumps({
-            "amps": st.session_state.amplitudes[:6],
-            "showSum": show_sum,
-            "isPaused": not st.session_state.animating,
-            "speed": speed # <--- O valor do slider vai aqui
-        })
-
-        # --- HTML/JS ---
-        html_code = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body {{ margin: 0; background-color: #0e1117; overflow: hidden; }}
-                canvas {{ width: 100%; height: 400px; border-radius: 8px; border: 1px solid #333; }}
-            </style>
-        </head>
-        <body>
-            <canvas id="waveCanvas"></canvas>
-            <script>
-                const canvas = document.getElementById('waveCanvas');
-                const ctx = canvas.getContext('2d');
-                
-                const data = {js_data};
-                
-                const colors = ['#ff00ff', '#ffff00', '#00ff00', '#00ffff', '#ff9900', '#ff3333'];
-                
-                if (typeof window.time === 'undefined') window.time = 0;
-                
-                function resize() {{
-                    canvas.width = window.innerWidth;
-                    canvas.height = 400;
-                }}
-                window.addEventListener('resize', resize);
-                resize();
-
-                function draw() {{
-                    const w = canvas.width;
-                    const h = canvas.height;
-                    const centerY = h / 2;
-                    const scaleY = h / 5;
-                    
-                    ctx.clearRect(0, 0, w, h);
-                    
-                    // Eixo
-                    ctx.beginPath(); ctx.strokeStyle = '#333'; ctx.lineWidth = 1;
-                    ctx.moveTo(0, centerY); ctx.lineTo(w, centerY); ctx.stroke();
-
-                    const numPoints = 300;
-                    const sumY = new Float32Array(numPoints);
-                    
-                    for (let hIdx = 0; hIdx < 6; hIdx++) {{
-                        const amp = data.amps[hIdx];
-                        if (amp < 0.01) continue;
-                        
-                        const hNum = hIdx + 1;
-                        const color = colors[hIdx];
-                        
-                        ctx.beginPath();
-                        ctx.strokeStyle = color;
-                        ctx.lineWidth = 1.5;
-                        ctx.globalAlpha = 0.6;
-                        
-                        for (let i = 0; i < numPoints; i++) {{
-                            const xNorm = i / (numPoints - 1);
-                            const xPix = xNorm * w;
-                            
-                            // Usa window.time para animar
-                            const yVal = amp * Math.sin(hNum * Math.PI * xNorm) * Math.cos(window.time * hNum);
-                            
-                            sumY[i] += yVal;
-                            const yPix = centerY - (yVal * scaleY);
-                            if (i === 0) ctx.moveTo(xPix, yPix); else ctx.lineTo(xPix, yPix);
-                        }}
-                        ctx.stroke();
-                        
-                        // Fantasma
-                        ctx.beginPath();
-                        ctx.setLineDash([2, 4]); ctx.lineWidth = 0.5; ctx.globalAlpha = 0.3;
-                        for (let i = 0; i < numPoints; i++) {{
-                            const xNorm = i / (numPoints - 1);
-                            const xPix = xNorm * w;
-                            const yVal = amp * Math.sin(hNum * Math.PI * xNorm);
-                            const yPix = centerY - (yVal * scaleY);
-                            if (i === 0) ctx.moveTo(xPix, yPix); else ctx.lineTo(xPix, yPix);
-                        }}
-                        ctx.stroke();
-                        ctx.setLineDash([]);
-                    }}
-
-                    if (data.showSum) {{
-                        ctx.beginPath(); ctx.strokeStyle = '#ffffff'; ctx.lineWidth = 3; ctx.globalAlpha = 1.0;
-                        for (let i = 0; i < numPoints; i++) {{
-                            const xNorm = i / (numPoints - 1);
-                            const xPix = xNorm * w;
-                            const yPix = centerY - (sumY[i] * scaleY);
-                            if (i === 0) ctx.moveTo(xPix, yPix); else ctx.lineTo(xPix, yPix);
-                        }}
-                        ctx.stroke();
-                    }}
-                    
-                    // --- LÓGICA DE VELOCIDADE ---
-                    if (!data.isPaused) {{
-                        // Agora soma o valor vindo do Slider (data.speed)
-                        window.time += data.speed;
-                    }}
-                    
-                    requestAnimationFrame(draw);
-                }}
-                
-                draw();
-            </script>
-        </body>
-        </html>
-        """
-        components.html(html_code, height=410)
+        # --- ANIMAÇÃO (JS, sonic/frontend/string.js) ---
+        # Componente persistente: montado uma vez, recebe só os parâmetros que mudaram.
+        # O tempo da animação continua correndo entre um slider e outro.
+        live.view(
+            "string", key="corda_viva", height=410,
+            amps=extend_series(st.session_state.amplitudes[:6], n_harm),
+            showSum=show_sum,
+            isPaused=not st.session_state.animating,
+            speed=speed,
+        )
         
         # --- LEGENDA DE CORES ---
         st.markdown("""
@@ -333,6 +220,7 @@ elif menu == "🎻 Corda Viva (Visualizador)":
             <div style="display: flex; align-items: center;"><span style="background: #00ffff; width: 10px; height: 10px; border-radius: 50%; margin-right: 5px; display:inline-block;"></span><b>H4</b> (2ª Oitava)</div>
             <div style="display: flex; align-items: center;"><span style="background: #ff9900; width: 10px; height: 10px; border-radius: 50%; margin-right: 5px; display:inline-block;"></span><b>H5</b> (Terça Maior)</div>
             <div style="display: flex; align-items: center;"><span style="background: #ff3333; width: 10px; height: 10px; border-radius: 50%; margin-right: 5px; display:inline-block;"></span><b>H6</b> (Quinta Alta)</div>
+            <div style="display: flex; align-items: center;"><span style="background: #888888; width: 10px; height: 10px; border-radius: 50%; margin-right: 5px; display:inline-block;"></span><b>H7+</b> (Série Estendida)</div>
             <div style="display: flex; align-items: center; margin-left: 10px; padding-left: 10px; border-left: 1px solid #555;"><span style="background: #ffffff; width: 15px; height: 4px; margin-right: 5px; display:inline-block;"></span><b>SOMA</b> (Resultado)</div>
         </div>
         """, unsafe_allow_html=True)
@@ -358,34 +246,10 @@ elif menu == "🎸 No Violão":
     
     escolha = st.select_slider("Posição do Dedo:", options=casas_opcoes, value="12ª (H2 - Oitava)")
     
-    harm_map = {"12ª":2, "7ª":3, "5ª":4, "9ª":5, "4ª":5, "3ª":6}
-    node_pos_map = {"12ª":0.5, "7ª":0.333, "5ª":0.25, "9ª":0.4, "4ª":0.2, "3ª":0.166}
-    
     selected_key = escolha.split(' ')[0]
-    h_val = harm_map[selected_key]
-    finger_pos = node_pos_map[selected_key]
+    h_val, finger_pos = plots.GUITAR_NODES[selected_key]
 
-    fig, ax = plt.subplots(figsize=(12, 3), dpi=100)
-    fig.patch.set_facecolor('#222'); ax.set_facecolor('#222')
-    
-    x_v = np.linspace(0, 1, 800)
-    y_v = np.sin(h_val * np.pi * x_v)
-    
-    ax.axhline(0, color='#666', lw=1)
-    ax.plot(x_v, y_v, color='#00ff00', lw=2.5, label='Vibração')
-    ax.plot(x_v, -y_v, color='#00ff00', lw=2.5, alpha=0.3, ls='--')
-    
-    for i in range(1, 13):
-        fret_pos = 1 - (1 / (2 ** (i / 12)))
-        ax.axvline(fret_pos, color='#444', lw=1.5, zorder=1)
-        ax.text(fret_pos, -1.3, str(i), color='#888', ha='center', fontsize=9, fontweight='bold')
-    ax.axvline(0, color='#888', lw=3)
-    
-    ax.scatter([finger_pos], [0], s=250, color='white', edgecolor='red', lw=2, zorder=10)
-    ax.text(finger_pos, 0.7, "👇 Dedo aqui", color='white', ha='center', fontweight='bold', fontsize=10)
-    
-    ax.axis('off'); ax.set_ylim(-1.4, 1.4); ax.set_xlim(-0.02, 1.02)
-    st.pyplot(fig)
+    st.image(figure_cache.image("guitar_string", h_val, finger_pos), width="stretch")
     
     st.markdown("---")
     
@@ -411,4 +275,6 @@ elif menu == "🎸 No Violão":
             <p>{msg_body}</p>
             <p style="font-size:0.9em; opacity:0.8;">Lembre-se: H4, H5 e H6 juntos formam o Acorde Maior Perfeito.</p>
         </div>
-        """, unsafe_allow_html=True)
\ No newline at end of file
+        """, unsafe_allow_html=True)
+
+metrics.finish()
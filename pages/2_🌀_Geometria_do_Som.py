@@ -1,8 +1,9 @@
 import streamlit as st
-import json
-import streamlit.components.v1 as components
+
+from sonic import live, metrics, tuning
 
 st.set_page_config(page_title="Geometria de Lissajous (Animada)", page_icon="🌀", layout="wide")
+metrics.begin("geometria_do_som")
 
 st.title("🌀 Geometria do Som: Lissajous em Tempo Real")
 
@@ -82,13 +83,13 @@ with col_setup:
     
     if modo == "🎵 Notas Musicais":
         sistema = st.selectbox("Afinação:", ["Natural (Just)", "Temperado (Equal)"])
-        notas = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
-        ratios_justos = [1/1, 16/15, 9/8, 6/5, 5/4, 4/3, 45/32, 3/2, 8/5, 5/3, 9/5, 15/8]
+        notas = tuning.NOTE_NAMES
         c4 = 261.63
 
         def get_freq(idx, oitava, sys):
-            if sys.startswith("Natural"): return c4 * ratios_justos[idx] * (2 ** (oitava - 4))
-            else: return c4 * (2 ** ((idx + ((oitava - 4) * 12)) / 12))
+            # Tabela pré-calculada (Justa ou Temperada) com C4 = 261.63 Hz
+            table = tuning.table("just" if sys.startswith("Natural") else "12-EDO", c4, 60)
+            return float(table[tuning.midi(idx, oitava)])
 
         c1, c2 = st.columns(2)
         with c1:
@@ -145,132 +146,19 @@ with col_setup:
     ratio = freq_y / freq_x if freq_x else 0
     st.info(f"Ratio Matemático: {ratio:.5f}")
 
-# --- JSON PARA O JAVASCRIPT ---
-dados_json = json.dumps({
-    "freqX": freq_x,
-    "freqY": freq_y,
-    "delta": delta,
-    "speed": velocidade,
-    "lineWidth": espessura,
-    "glow": brilho,
-    "fade": rastro
-})
-
-# --- VISUALIZADOR ANIMADO (JS) ---
+# --- VISUALIZADOR ANIMADO (JS, sonic/frontend/lissajous.js) ---
+# Componente persistente: cada slider manda só o parâmetro novo; o rastro, o tempo
+# e o som (se estiver tocando, é só reafinado) continuam vivos.
 with col_vis:
-    html_code = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-    <style>
-        body {{ margin: 0; background: #000; overflow: hidden; color: white; font-family: sans-serif; }}
-        .container {{ display: flex; flex-direction: column; align-items: center; justify-content: center; height: 500px; }}
-        canvas {{ background: #000; border: 1px solid #333; border-radius: 8px; }}
-        .btn {{
-            margin-top: 15px; padding: 10px 25px; font-size: 16px; 
-            background: #4CAF50; color: white; border: none; border-radius: 5px; cursor: pointer;
-            transition: 0.2s; font-weight: bold;
-        }}
-        .btn:hover {{ background: #45a049; transform: scale(1.05); }}
-    </style>
-    </head>
-    <body>
-    <div class="container">
-        <canvas id="canvas" width="600" height="400"></canvas>
-        <button class="btn" id="playBtn" onclick="toggleAudio()">🔊 Tocar / Parar Som</button>
-    </div>
-
-    <script>
-        const data = {dados_json};
-        const canvas = document.getElementById('canvas');
-        const ctx = canvas.getContext('2d');
-        const btn = document.getElementById('playBtn');
-
-        let audioCtx = null;
-        let oscX = null;
-        let oscY = null;
-        let isPlaying = false;
-        let gainNode = null;
-
-        const width = canvas.width;
-        const height = canvas.height;
-        const centerX = width / 2;
-        const centerY = height / 2;
-        const scale = 150; 
-
-        const trail = [];
-        const maxTrail = 1000; 
-        let time = 0;
-
-        function draw() {{
-            ctx.fillStyle = `rgba(0, 0, 0, ${{data.fade}})`; 
-            ctx.fillRect(0, 0, width, height);
-
-            time += data.speed;
-
-            const x = centerX + Math.sin(data.freqX * time + data.delta) * scale;
-            const y = centerY + Math.sin(data.freqY * time) * scale;
-
-            trail.push({{x, y}});
-            if (trail.length > maxTrail) trail.shift();
-
-            ctx.beginPath();
-            ctx.strokeStyle = '#00ff00';
-            ctx.lineWidth = data.lineWidth;
-            ctx.shadowBlur = data.glow; 
-            ctx.shadowColor = '#00ff00';
-
-            for (let i = 0; i < trail.length - 1; i++) {{
-                ctx.moveTo(trail[i].x, trail[i].y);
-                ctx.lineTo(trail[i+1].x, trail[i+1].y);
-            }}
-            ctx.stroke();
-
-            ctx.beginPath();
-            ctx.shadowBlur = 0; 
-            ctx.fillStyle = '#fff';
-            ctx.arc(x, y, data.lineWidth + 2, 0, Math.PI * 2);
-            ctx.fill();
-
-            requestAnimationFrame(draw);
-        }}
-        
-        draw();
-
-        function toggleAudio() {{
-            if (!isPlaying) {{
-                audioCtx = new (window.AudioContext || window.webkitAudioContext)();
-                gainNode = audioCtx.createGain();
-                gainNode.gain.value = 0.1; 
-                gainNode.connect(audioCtx.destination);
-
-                oscX = audioCtx.createOscillator();
-                oscX.type = 'sine';
-                oscX.frequency.value = data.freqX;
-                
-                oscY = audioCtx.createOscillator();
-                oscY.type = 'sine';
-                oscY.frequency.value = data.freqY;
-
-                oscX.connect(gainNode);
-                oscY.connect(gainNode);
-
-                oscX.start();
-                oscY.start();
-                
-                isPlaying = true;
-                btn.innerText = "🛑 Parar Som";
-                btn.style.background = "#e74c3c";
-            }} else {{
-                if(oscX) oscX.stop();
-                if(oscY) oscY.stop();
-                isPlaying = false;
-                btn.innerText = "🔊 Tocar / Parar Som";
-                btn.style.background = "#4CAF50";
-            }}
-        }}
-    </script>
-    </body>
-    </html>
-    """
-    components.html(html_code, height=550)
\ No newline at end of file
+    live.view(
+        "lissajous", key="lissajous", height=550,
+        freqX=freq_x,
+        freqY=freq_y,
+        delta=delta,
+        speed=velocidade,
+        lineWidth=espessura,
+        glow=brilho,
+        fade=rastro,
+    )
+
+metrics.finish()
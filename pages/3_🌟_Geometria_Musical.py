@@ -1,8 +1,9 @@
 import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
+
+from sonic import clips, figure_cache, metrics, player
 
 st.set_page_config(page_title="Geometria Musical", page_icon="🌟", layout="wide")
+metrics.begin("geometria_musical")
 
 # --- CSS ---
 st.markdown("""
@@ -27,6 +28,7 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 st.title("🌟 A Geometria da Música: Por que 12 notas?")
+figure_cache.prewarm_async()
 
 # --- INTRODUÇÃO ---
 with st.expander("📚 O Resumo da Ópera (Leia Primeiro)", expanded=True):
@@ -49,7 +51,7 @@ with col_ctrl:
     st.write("Vamos empilhar Quintas (x1.5) e ver o desenho que forma.")
     
     # Controle de Passos (Quantas quintas?)
-    passos = st.slider("Quantas notas gerar?", 1, 12, 1)
+    passos = st.slider("Quantas notas gerar?", clips.FIFTH_STEPS[0], clips.FIFTH_STEPS[-1], 1)
     
     # Explicação Dinâmica baseada no vídeo
     if passos == 1:
@@ -75,100 +77,17 @@ with col_ctrl:
 with col_vis:
     st.subheader("🕸️ O Círculo das Quintas (Visual)")
     
-    # Configuração do Gráfico Polar
-    fig, ax = plt.subplots(figsize=(8, 8), subplot_kw={'projection': 'polar'})
-    fig.patch.set_facecolor('#0e1117')
-    ax.set_facecolor('#0e1117')
-    
-    # As 12 posições do relógio (Notas Cromáticas)
-    # C=0, G=1, D=2... (Seguindo o Círculo das Quintas para visualização geométrica)
-    # Mas para facilitar a visão de "Estrela", vamos plotar na ordem cromática e desenhar as linhas de conexão.
-    
-    # Notas Cromáticas (Posições fixas no círculo)
-    chromatic_notes = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
-    angles = np.linspace(0, 2*np.pi, 12, endpoint=False)
-    
-    # Vamos rotacionar para C ficar no topo (pi/2)
-    angles = np.roll(angles, 0) # Ajuste visual se precisar
-    
-    # Plota os pontos base (As 12 notas possíveis)
-    ax.scatter(angles, [1]*12, color='#333', s=100, zorder=1)
-    
-    # Adiciona rótulos
-    for ang, note in zip(angles, chromatic_notes):
-        # Ajuste de rotação para leitura
-        ax.text(ang, 1.15, note, color='white', ha='center', va='center', fontweight='bold', fontsize=12)
-
-    # --- LÓGICA DE GERAÇÃO (A Mágica) ---
-    # Começamos em C (Indice 0)
-    # A cada passo, somamos 7 semitons (Uma Quinta Justa)
-    
-    current_idx = 0 # C
-    visited_indices = [0]
-    
-    lines_x = []
-    lines_y = []
-    
-    path_angles = [angles[0]]
-    path_radii = [1.0]
-    
-    for _ in range(passos - 1):
-        # Pula 7 semitons (A Quinta)
-        next_idx = (current_idx + 7) % 12
-        visited_indices.append(next_idx)
-        
-        # Guardar coordenadas para linha
-        path_angles.append(angles[next_idx])
-        path_radii.append(1.0)
-        
-        current_idx = next_idx
-
-    # Desenhar as LINHAS de conexão (A Geometria)
-    # Se passos > 1, desenhamos a teia
-    if passos > 1:
-        # Desenha a linha conectando na ordem de geração
-        ax.plot(path_angles, path_radii, color='#FFC107', linewidth=2, linestyle='-', marker='o', markersize=8, zorder=10)
-        
-        # Se for 12, fecha o círculo visualmente
-        if passos == 12:
-            ax.plot([path_angles[-1], path_angles[0]], [1, 1], color='#FFC107', linewidth=2)
-
-    # Destacar as notas ativas (tocadas)
-    active_angles = [angles[i] for i in visited_indices]
-    ax.scatter(active_angles, [1]*len(active_angles), color='#4CAF50', s=250, zorder=20, edgecolors='white')
-
-    ax.set_ylim(0, 1.2)
-    ax.axis('off')
-    st.pyplot(fig)
+    # As 12 posições do relógio (Notas Cromáticas), com as linhas de conexão
+    # na ordem de geração: começamos em C e a cada passo somamos 7 semitons (Uma Quinta Justa)
+    st.image(figure_cache.image("circle_of_fifths", passos), width="stretch")
 
 # --- ÁUDIO GERADO ---
 st.divider()
 st.subheader("🎹 Ouça a Escala Gerada")
 
 if st.button("🔊 Tocar Notas Selecionadas"):
-    # Gerar som
-    sr = 44100
-    wave_total = np.array([])
-    
-    # Ordenar as frequências para tocar em escala (do grave pro agudo) e não na ordem de geração (quintas)
-    # Isso faz soar "musical" (Dó, Ré, Mi...) em vez de "técnico" (Dó, Sol, Ré...)
-    visited_indices.sort()
-    
-    for note_idx in visited_indices:
-        # Fórmula do Temperamento Igual explicada no vídeo
-        # f = f0 * (2^(n/12))
-        freq = 261.63 * (2 ** (note_idx / 12))
-        
-        t = np.linspace(0, 0.4, int(sr*0.4), endpoint=False)
-        # Som suave (Seno + Harmônico)
-        tone = 0.5 * np.sin(2*np.pi*freq*t) + 0.2*np.sin(4*np.pi*freq*t)
-        
-        # Envelope curto
-        tone *= np.concatenate([np.linspace(0,1,500), np.ones(len(tone)-1000), np.linspace(1,0,500)])
-        
-        wave_total = np.concatenate([wave_total, tone])
-        
-    st.audio(wave_total, sample_rate=sr)
+    # As notas geradas em ordem de escala (do grave pro agudo), montadas em sonic.clips
+    player.audio(clips.fifths_scale(passos))
 
 # --- CONTEÚDO EDUCACIONAL EXTRA ---
 with st.expander("🧠 Por que 5 e 7 funcionam e 6 não? (Simetria)"):
@@ -187,4 +106,6 @@ with st.expander("🧠 Por que 5 e 7 funcionam e 6 não? (Simetria)"):
         Se você fizer 6 quintas, você cai exatamente no lado oposto do círculo (Trítono).
         Isso cria uma simetria tão perfeita que se torna monótona e ambígua (Escala de Tons Inteiros).
         Não tem "centro" gravitacional (Tônica).
-        """)
\ No newline at end of file
+        """)
+
+metrics.finish()
@@ -1,9 +1,9 @@
 import streamlit as st
-import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
+
+from sonic import clips, figure_cache, metrics, player
 
 st.set_page_config(page_title="O Coma Pitagórico", page_icon="📐", layout="wide")
+metrics.begin("coma_pitagorico")
 
 # --- CSS (Mesmo estilo da Geometria Musical) ---
 st.markdown("""
@@ -38,6 +38,7 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 st.title("📐 O Coma Pitagórico: O Erro Matemático")
+figure_cache.prewarm_async()
 
 # --- INTRODUÇÃO ---
 with st.expander("📚 O Paradoxo das Réguas (Contexto)", expanded=True):
@@ -61,32 +62,15 @@ with col_ctrl:
     st.subheader("🛠️ O Experimento")
     st.write("Vamos empilhar Quintas e ver se conseguimos chegar num Dó perfeito.")
     
-    passos = st.slider("Número de Quintas (Passos):", 1, 12, 12)
+    passos = st.slider("Número de Quintas (Passos):", clips.FIFTH_STEPS[0], clips.FIFTH_STEPS[-1], 12)
     
     # --- CÁLCULOS ---
-    freq_base = 100.0
-    
-    # 1. Caminho das Quintas (Natural / Pitagórico)
-    # Fórmula: f * 1.5^n
-    freq_natural = freq_base * (1.5 ** passos)
+    freq_base = clips.COMMA_BASE
     
-    # 2. Caminho Temperado (Moderno)
-    # No sistema moderno, "trapaceamos" mudando 1.5 para 1.498 (raiz 12 de 2 ^ 7)
-    # 2^(7/12) é a quinta temperada
-    freq_temperada = freq_base * ((2**(7/12)) ** passos)
-
-    # 3. Normalização (Trazer para a oitava 100-200Hz para comparar)
-    # Natural
-    val_nat = freq_natural
-    divs_nat = 0
-    while val_nat >= freq_base * 2:
-        val_nat /= 2
-        divs_nat += 1
-        
-    # Temperada
-    val_temp = freq_temperada
-    while val_temp >= freq_base * 2:
-        val_temp /= 2
+    # Quintas puras (f * 1.5^n) contra temperadas (no sistema moderno, "trapaceamos"
+    # mudando 1.5 para 1.498 = 2^(7/12)), as duas trazidas para a oitava 100-200Hz.
+    # A conta fica em sonic.clips: os botões e o build (sonic.prerender) usam a mesma.
+    val_nat, divs_nat, val_temp = clips.comma(passos, freq_base)
     
     # Cálculo do Erro (Cents)
     import math
@@ -117,110 +101,52 @@ with col_ctrl:
 with col_vis:
     st.subheader("🌀 Visualização do Erro")
     
-    # Gráfico Polar (Estilo Radar)
-    fig, ax = plt.subplots(figsize=(8, 8), subplot_kw={'projection': 'polar'})
-    fig.patch.set_facecolor('#0e1117')
-    ax.set_facecolor('#0e1117')
-    
-    # Ângulo de uma Quinta Justa (Pura)
-    # log2(1.5) da oitava. Em radianos: log2(1.5) * 2pi
-    quinta_pura_rad = np.log2(1.5) * 2 * np.pi
-    
-    # Ângulo de uma Quinta Temperada (Moderna)
-    # 7 semitons de 12. Em radianos: (7/12) * 2pi
-    quinta_temp_rad = (7/12) * 2 * np.pi
-    
-    angles_nat = [0]
-    radii_nat = [1.5]
-    
-    angles_temp = [0]
-    radii_temp = [1.5] # Um pouco mais para fora para diferenciar
-    
-    for i in range(passos):
-        angles_nat.append(angles_nat[-1] + quinta_pura_rad)
-        radii_nat.append(1.5 + (i * 0.1))
-        
-        angles_temp.append(angles_temp[-1] + quinta_temp_rad)
-        # Temperado fica no mesmo raio para comparação visual
-    
-    # 1. Alvo (Verde) - Sempre no topo
-    ax.plot([0, 0], [0, radii_nat[-1]+0.5], color='#4CAF50', linestyle='--', linewidth=2, label='Alvo (Oitava Perfeita)')
-    ax.text(0, radii_nat[-1]+0.6, "DÓ\n(Puro)", color='#4CAF50', ha='center', fontweight='bold')
-    
-    # 2. Caminho Natural (Vermelho/Azul)
-    ax.plot(angles_nat, radii_nat, color='#e74c3c', marker='o', linewidth=1.5, label='Pitagórico (Natural)')
-    
-    # 3. Caminho Temperado (Branco/Cinza - Pontilhado)
-    # Só desenha se tivermos mais de 1 passo, para não poluir
-    if passos > 1:
-        # Plotamos apenas o ponto final para mostrar que ele "certa"
-        final_temp_angle = angles_temp[-1] % (2*np.pi)
-        # ax.scatter([final_temp_angle], [radii_nat[-1]], color='white', s=100, marker='x', label='Temperado (Moderno)', zorder=10)
-
-    # Lógica de Fechamento
-    if passos > 0:
-        final_angle_nat = angles_nat[-1] % (2*np.pi)
-        
-        # Linha Vermelha (Onde chegamos no natural)
-        ax.plot([0, final_angle_nat], [0, radii_nat[-1]], color='#e74c3c', linewidth=3)
-        
-        if passos == 12:
-            # Preenche o ERRO
-            theta = np.linspace(0, final_angle_nat, 50)
-            ax.fill_between(theta, 0, radii_nat[-1], color='#e74c3c', alpha=0.3)
-            ax.text(final_angle_nat, radii_nat[-1]+0.2, f"COMA\n(O Excesso)", color='#e74c3c', fontweight='bold')
-            
-            # Marca o acerto do temperado
-            ax.text(0.1, radii_nat[-1]-0.5, "Temperado\nfecha aqui!", color='white', fontsize=8, alpha=0.7)
-
-    ax.set_rticks([])
-    ax.set_xticks([])
-    ax.grid(False)
-    ax.legend(loc='lower right', facecolor='#222', labelcolor='white')
-    st.pyplot(fig)
+    # Gráfico Polar (Estilo Radar): o caminho das Quintas Puras contra o Alvo
+    st.image(figure_cache.image("comma_spiral", passos), width="stretch")
 
 # --- ÁUDIO COMPARATIVO ---
 st.divider()
 st.subheader("🎹 Comparação Auditiva")
 st.write("Ouça a diferença entre a matemática pura (que dá erro) e a moderna (que corrige).")
 
+# Drones longos deixam o batimento bem evidente (renderizados em blocos, memória constante)
+duracao = st.select_slider("Duração do som:", options=clips.DURATIONS, value=3, format_func=lambda s: f"{s} s")
+
 col_snd1, col_snd2, col_snd3 = st.columns(3)
 
-def gen_tone(f):
-    sr = 44100
-    t = np.linspace(0, 3, int(sr*3), endpoint=False)
-    # Som rico (Dente de Serra suave)
-    return 0.5 * (np.sin(2*np.pi*f*t) + 0.25*np.sin(4*np.pi*f*t))
+def gen_tone(*freqs):
+    # Som rico (Dente de Serra suave), ver sonic.clips.tone
+    return clips.tone(*freqs, duration=duracao)
 
 with col_snd1:
     st.markdown("**1. Dó Puro (Alvo)**")
     st.caption("Frequência: 100.00 Hz")
     if st.button("▶️ Tocar Puro"):
-        st.audio(gen_tone(100.0), sample_rate=44100)
+        player.audio(gen_tone(100.0))
 
 with col_snd2:
     st.markdown("**2. Dó Pitagórico (Natural)**")
     st.caption(f"Frequência: {val_nat:.2f} Hz (Desafinado)")
     if st.button("▶️ Tocar Pitagórico"):
-        st.audio(gen_tone(val_nat), sample_rate=44100)
+        player.audio(gen_tone(val_nat))
 
 with col_snd3:
     st.markdown("**3. Dó Temperado (Moderno)**")
     st.caption(f"Frequência: {val_temp:.2f} Hz (Corrigido)")
     if st.button("▶️ Tocar Temperado"):
-        st.audio(gen_tone(val_temp), sample_rate=44100)
+        player.audio(gen_tone(val_temp))
 
 # --- CAIXA FINAL ---
 st.divider()
 if st.button("💀 Tocar Puro + Pitagórico (Ouvir o Erro)"):
-    mix = gen_tone(100.0) + gen_tone(val_nat)
-    st.audio(mix, sample_rate=44100)
+    player.audio(gen_tone(100.0, val_nat))
     st.error("Ouviu o 'Waw-waw'? Esse é o som do Coma Pitagórico.")
     
 if st.button("✅ Tocar Puro + Temperado (Ouvir a Solução)"):
     # Nota: No temperado ideal, seria 100 com 100, sem batimento.
     # Mas na prática, o temperamento muda todas as OUTRAS notas para que a oitava bata.
     # Aqui, a oitava temperada bate perfeitamente com a pura.
-    mix = gen_tone(100.0) + gen_tone(val_temp)
-    st.audio(mix, sample_rate=44100)
-    st.success("Som liso! Sem batimento. A matemática foi 'domada'.")
\ No newline at end of file
+    player.audio(gen_tone(100.0, val_temp))
+    st.success("Som liso! Sem batimento. A matemática foi 'domada'.")
+
+metrics.finish()
@@ -1,9 +1,9 @@
 import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
+
+from sonic import clips, figure_cache, metrics, player
 
 st.set_page_config(page_title="O Intervalo do Lobo", page_icon="🐺", layout="wide")
+metrics.begin("intervalo_do_lobo")
 
 # --- CSS ---
 st.markdown("""
@@ -35,6 +35,7 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 st.title("🐺 Arqueologia Musical: A Saga das Afinações")
+figure_cache.prewarm_async()
 st.markdown("### Por que seu piano nunca está 100% afinado?")
 
 # --- INTRODUÇÃO (WIKI) ---
@@ -97,87 +98,6 @@ with col_info:
         </div>
         """, unsafe_allow_html=True)
 
-# --- FUNÇÕES DE ÁUDIO E CÁLCULO ---
-def get_freqs(root, system):
-    # Frequências baseadas em C4 = 261.63
-    # Retorna: [Freq Fundamental, Freq Terça, Freq Quinta]
-    
-    if "Pitagórico" in system:
-        # Quinta = 1.5 (Pura)
-        # Terça = 1.2656 (81/64 - O Ditono Pitagórico, muito brilhante/áspero)
-        # Lobo (se for a tecla G#)
-        if root > 400: # Simulando G#
-            return [root, root * 1.2656, root * 1.479] # Quinta do lobo encurtada
-        return [root, root * 1.2656, root * 1.5]
-
-    elif "Mesotônico" in system:
-        # Quinta = 1.4953 (Encurtada propositalmente para consertar a terça)
-        # Terça = 1.25 (Pura/Natural 5:4 - O "Doce" da Renascença)
-        if root > 400: # Simulando G# (O Lobo Mesotônico é feroz)
-            return [root, root * 1.25, root * 1.531] # Quinta do lobo muito larga!
-        return [root, root * 1.25, root * 1.4953]
-
-    else: # Temperado
-        # Quinta = 1.4983 (Quase pura)
-        # Terça = 1.2599 (Um meio termo aceitável)
-        return [root, root * 1.2599, root * 1.4983]
-
-def play_system(is_wolf, system_name):
-    base = 415.30 if is_wolf else 261.63 # G# (Lobo) ou C (Puro)
-    freqs = get_freqs(base, system_name)
-    
-    sr = 44100
-    t = np.linspace(0, 3, sr*3, endpoint=False)
-    wave = np.zeros_like(t)
-    
-    # Sintetizar Acorde
-    for f in freqs:
-        wave += 0.3 * np.sin(2 * np.pi * f * t)
-        
-    # Envelope
-    env = np.concatenate([np.linspace(0, 1, 2000), np.ones(len(wave)-4000), np.linspace(1, 0, 2000)])
-    return wave * env
-
-# --- FUNÇÃO DE DESENHO DO PIANO ---
-def draw_piano(system_name):
-    fig, ax = plt.subplots(figsize=(10, 3))
-    fig.patch.set_facecolor('#0e1117')
-    ax.set_facecolor('#0e1117')
-
-    # Teclas Brancas
-    for i in range(8):
-        rect = patches.Rectangle((i, 0), 1, 1, facecolor='white', edgecolor='black')
-        ax.add_patch(rect)
-        ax.text(i+0.5, 0.1, "CDEFGABC"[i], ha='center')
-
-    # Teclas Pretas e Destaques
-    black_pos = [1, 2, 4, 5, 6] # C#, D#, F#, G#, A#
-    labels = ["C#", "D#/Eb", "F#", "G#", "A#"]
-    
-    for i, pos in enumerate(black_pos):
-        color = 'black'
-        lbl = labels[i]
-        
-        # Lógica de Cores por Sistema
-        if "Temperado" not in system_name:
-            if lbl == "G#" or "D#" in lbl:
-                color = '#800000' # Vermelho escuro (Perigo)
-        
-        rect = patches.Rectangle((pos-0.3, 0.4), 0.6, 0.6, facecolor=color, edgecolor='black', zorder=2)
-        ax.add_patch(rect)
-        
-        # Ícones
-        if "Temperado" not in system_name and (lbl == "G#" or "D#" in lbl):
-            ax.text(pos, 0.5, "🐺", ha='center', va='center', fontsize=12, zorder=3)
-            
-    # Conexão do Lobo
-    if "Temperado" not in system_name:
-        ax.annotate("", xy=(2, 0.9), xytext=(5, 0.9), arrowprops=dict(arrowstyle="<->", color='red', lw=2))
-        ax.text(3.5, 0.95, "INTERVALO DO LOBO\n(G# a Eb)", ha='center', color='red', fontweight='bold', backgroundcolor='#0e1117')
-
-    ax.set_xlim(0, 8); ax.set_ylim(0, 1.3); ax.axis('off')
-    return fig
-
 # --- LABORATÓRIO INTERATIVO ---
 st.divider()
 st.header("🎹 Laboratório Comparativo")
@@ -185,15 +105,20 @@ st.header("🎹 Laboratório Comparativo")
 col_piano, col_buttons = st.columns([3, 2])
 
 with col_piano:
-    st.pyplot(draw_piano(era))
+    # Desenho em sonic.plots.draw_piano: no Temperado o Lobo some
+    st.image(figure_cache.image("draw_piano", "Temperado" not in era), width="stretch")
 
 with col_buttons:
     st.markdown("### Ouça a Diferença")
     
+    # Drone longo: o "uivo" do Lobo fica impossível de ignorar
+    duracao = st.select_slider("Duração do acorde:", options=clips.DURATIONS, value=3, format_func=lambda s: f"{s} s")
+    
+    # Acordes montados em sonic.clips.wolf_chord (as tabelas de cada era e onde cai o Lobo)
     # Botão 1: Acorde Bom
     st.markdown("#### 1. Tocar em Dó Maior (Seguro)")
     if st.button("🎵 Tocar Dó Maior (C-E-G)"):
-        st.audio(play_system(False, era), sample_rate=44100)
+        player.audio(clips.wolf_chord(False, era, duracao))
     
     if "Mesotônico" in era:
         st.caption("✅ Note como este acorde é calmo e 'doce'. A Terça é pura!")
@@ -205,7 +130,7 @@ with col_buttons:
     # Botão 2: O Lobo
     st.markdown("#### 2. Tocar no Lobo (Proibido)")
     if st.button("🐺 Tocar G# Maior (O Acorde Quebrado)"):
-        st.audio(play_system(True, era), sample_rate=44100)
+        player.audio(clips.wolf_chord(True, era, duracao))
         
     if "Temperado" in era:
         st.success("Tudo certo! Soa igual ao Dó Maior. O Lobo foi domesticado.")
@@ -224,4 +149,6 @@ with st.expander("📊 Tabela Comparativa (Resumo Técnico)", expanded=True):
         "O Lobo": ["Sim (Uiva)", "Sim (Feroz)", "Não (Distribuído)"],
         "Pode modular?": ["Não (Só tons simples)", "Não (Só tons centrais)", "Sim (Qualquer tom)"]
     }
-    st.table(data)
\ No newline at end of file
+    st.table(data)
+
+metrics.finish()
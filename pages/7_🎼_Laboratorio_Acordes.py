@@ -1,9 +1,10 @@
 import streamlit as st
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
+
+from sonic import canvas, clips, figure_cache, metrics, player, scope, tuning
 
 st.set_page_config(page_title="Laboratório de Acordes", page_icon="🎼", layout="wide")
+metrics.begin("laboratorio_acordes")
 
 # --- CSS Customizado ---
 st.markdown("""
@@ -42,20 +43,12 @@ with col_ctrl:
     st.subheader("🎹 Monte seu Acorde")
     
     # Fundamental
-    notas = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
+    notas = tuning.NOTE_NAMES
     root_note = st.selectbox("Nota Fundamental (Raiz):", notas, index=0)
-    octave = st.number_input("Oitava:", 2, 5, 4)
+    octave = st.number_input("Oitava:", clips.CHORD_OCTAVES[0], clips.CHORD_OCTAVES[-1], 4)
     
     # Tipo de Acorde
-    tipos_acorde = {
-        "Maior (Feliz/Estável)": [0, 4, 7],
-        "Menor (Triste/Melancólico)": [0, 3, 7],
-        "Diminuto (Tenso/Assustador)": [0, 3, 6],
-        "Aumentado (Misterioso/Onírico)": [0, 4, 8],
-        "Sus4 (Suspenso/Aberto)": [0, 5, 7],
-        "Maior com 7ª (Jazzy/Sofisticado)": [0, 4, 7, 11],
-        "Menor com 7ª (Soul/Profundo)": [0, 3, 7, 10]
-    }
+    tipos_acorde = clips.CHORD_TYPES
     
     chord_type_name = st.selectbox("Qualidade do Acorde:", list(tipos_acorde.keys()))
     intervals = tipos_acorde[chord_type_name]
@@ -66,35 +59,8 @@ with col_ctrl:
     if "Diminuto" in chord_type_name or "Aumentado" in chord_type_name: style_class = "tense"
     if "7ª" in chord_type_name: style_class = "complex"
 
-# --- LÓGICA DE CÁLCULO ---
-def get_freq(note_name, oct):
-    # Dicionário de distancias a partir de C
-    semitones_from_c = {n: i for i, n in enumerate(notas)}
-    
-    # --- CORREÇÃO AQUI ---
-    # Antes estava usando semitones_from_c[root_note], o que travava tudo na raiz.
-    # Agora usa semitones_from_c[note_name], que é a nota atual do loop.
-    midi_note = semitones_from_c[note_name] + ((oct + 1) * 12)
-    
-    # Cálculo da frequência baseado no padrão MIDI (A4 = 69 = 440Hz)
-    return 440.0 * (2 ** ((midi_note - 69) / 12))
-
-# Calcular frequencias do acorde
-chord_freqs = []
-chord_notes_names = []
-
-for interval in intervals:
-    # Achar o nome da nota
-    root_idx = notas.index(root_note)
-    note_idx = (root_idx + interval) % 12
-    note_name = notas[note_idx]
-    
-    # Calcular frequencia real (considerando virada de oitava)
-    current_octave = octave + ((root_idx + interval) // 12)
-    f = get_freq(note_name, current_octave)
-    
-    chord_freqs.append(f)
-    chord_notes_names.append(f"{note_name}{current_octave}")
+# Calcular frequencias do acorde (a conta e o som do acorde ficam em sonic.clips)
+chord_freqs, chord_notes_names = clips.chord_notes(root_note, octave, intervals)
 
 # --- 2. PAINEL INFORMATIVO ---
 with col_info:
@@ -119,85 +85,47 @@ with col_info:
     """, unsafe_allow_html=True)
 
 # --- 3. VISUALIZAÇÃO E ÁUDIO ---
-tab_wave, tab_math = st.tabs(["🌊 O Raio-X da Onda", "🧮 A Matemática dos Intervalos"])
+# Um rádio no lugar das abas: o `st.tabs` roda o conteúdo de todas as abas a cada
+# rerun, e aqui só a seção aberta é calculada (figura, áudio ou tabela).
+secoes = ["🌊 O Raio-X da Onda", "🧮 A Matemática dos Intervalos"]
+view = st.radio("Seção:", secoes, horizontal=True, label_visibility="collapsed", key="lab_view")
 
-with tab_wave:
+def wave_data(chord_freqs, chord_notes_names):
+    # Gerar Ondas
+    duration = 0.04 # 40ms para ver o detalhe da forma de onda
+    sr = 44100
+    t = np.linspace(0, duration, int(sr*duration), endpoint=False)
+
+    # Ondas individuais ("fantasmas") e a Soma (a "Forma" do Acorde)
+    waves = [np.sin(2 * np.pi * f * t) for f in chord_freqs]
+    y_sum = np.sum(waves, axis=0)
+    labels = [f'{chord_notes_names[i]} ({f:.1f} Hz)' for i, f in enumerate(chord_freqs)]
+    return t, waves, labels, y_sum
+
+if view == secoes[0]:
     c_plot, c_audio = st.columns([3, 1])
     
     with c_plot:
-        # Gerar Ondas
-        duration = 0.04 # 40ms para ver o detalhe da forma de onda
-        sr = 44100
-        t = np.linspace(0, duration, int(sr*duration), endpoint=False)
-        
-        y_sum = np.zeros_like(t)
-        
-        fig, ax = plt.subplots(figsize=(10, 4))
-        fig.patch.set_facecolor('#0e1117')
-        ax.set_facecolor('#0e1117')
-        
-        colors = ['#FFC107', '#03A9F4', '#4CAF50', '#E91E63']
-        
-        # Plotar ondas individuais (fantasmas)
-        for i, f in enumerate(chord_freqs):
-            wave = np.sin(2 * np.pi * f * t)
-            y_sum += wave
-            ax.plot(t, wave, alpha=0.3, linestyle='--', color=colors[i % len(colors)], label=f'{chord_notes_names[i]} ({f:.1f} Hz)')
-            
-        # Plotar a Soma (A "Forma" do Acorde)
-        ax.plot(t, y_sum, color='white', linewidth=3, label='Soma Resultante')
-        
-        ax.set_title("Interferência das Ondas (Zoom de 40ms)", color='white')
-        ax.axis('off')
-        ax.legend(loc='upper right', facecolor='#222', labelcolor='white')
-        st.pyplot(fig)
+        # No modo canvas (SONIC_PLOTS=canvas) quem desenha é o navegador. No modo
+        # imagem, o PNG fica no cache de figuras por (raiz, oitava, tipo): voltar a um
+        # acorde já visto não desenha nada (sonic.scope recicla a figura nos outros).
+        if canvas.enabled():
+            canvas.chord_waves(*wave_data(chord_freqs, chord_notes_names))
+        else:
+            png = figure_cache.cached(
+                ("chord_waves", root_note, octave, tuple(intervals)),
+                lambda: scope.chord_waves(*wave_data(chord_freqs, chord_notes_names)),
+            )
+            st.image(png, width="stretch")
         
         st.caption("As linhas coloridas são as notas individuais. A linha grossa branca é o que seu ouvido recebe: uma onda complexa resultante da soma.")
 
     with c_audio:
         st.markdown("### 🔊 Ouça")
         
-        # Gerar áudio mais longo para tocar
-        dur_audio = 2.0
-        t_audio = np.linspace(0, dur_audio, int(sr*dur_audio), endpoint=False)
-        
-        # Inicializa o array vazio
-        final_wave = np.zeros_like(t_audio)
-        
-        # SINTESE: Soma todas as notas do acorde
-        num_notas = len(chord_freqs)
-        
-        for f in chord_freqs:
-            # Para cada nota do acorde, adicionamos a fundamental + um harmônico leve (timbre de orgão/piano)
-            tone = 0.6 * np.sin(2 * np.pi * f * t_audio)          # Fundamental
-            tone += 0.2 * np.sin(2 * np.pi * (f * 2) * t_audio)   # 2º Harmônico (Oitava)
-            tone += 0.1 * np.sin(2 * np.pi * (f * 3) * t_audio)   # 3º Harmônico (Quinta)
-            
-            # Soma ao mix final
-            final_wave += tone
-        
-        # Envelope ADSR Simples para não dar "pop" no começo nem no fim
-        # Attack (100ms), Sustain (durante), Release (300ms)
-        attack = int(sr * 0.1)
-        release = int(sr * 0.3)
-        
-        env = np.ones_like(final_wave)
-        env[:attack] = np.linspace(0, 1, attack)
-        env[-release:] = np.linspace(1, 0, release)
-        
-        final_wave = final_wave * env
-        
-        # NORMALIZAÇÃO IMPORTANTE:
-        # Divide pelo valor máximo absoluto para garantir que fique entre -1.0 e 1.0
-        # Adiciona um pequeno epsilon para evitar divisão por zero se for silêncio
-        max_val = np.max(np.abs(final_wave))
-        if max_val > 0:
-            final_wave = final_wave / max_val
-            
-        # Reduz um pouco o ganho final para evitar distorção nos alto-falantes
-        final_wave = final_wave * 0.8
-        
-        st.audio(final_wave, sample_rate=sr)
+        # Só sintetiza no clique (e o clipe fica no cache de áudio por conteúdo)
+        if st.button("▶️ Tocar Acorde"):
+            player.audio(clips.chord(chord_freqs))
         
         if "Maior" in chord_type_name and "7ª" not in chord_type_name:
             st.success("Sente a estabilidade?")
@@ -206,7 +134,9 @@ with tab_wave:
         else:
             st.info("Percebe a cor desse som?")
 
-with tab_math:
+else:
+    import pandas as pd  # Só nesta seção
+
     st.markdown("### Por que essas notas?")
     st.write("Um acorde é definido pela distância (em semitons) a partir da nota raiz.")
     
@@ -237,4 +167,6 @@ with tab_math:
     > **Dica de Ouro:** A nota mais importante para definir se o acorde é "Feliz" ou "Triste" é a **Terça** (a segunda nota da lista).
     > * Se a distância for 4 semitons -> **Maior** (Alegre).
     > * Se a distância for 3 semitons -> **Menor** (Triste).
-    """)
\ No newline at end of file
+    """)
+
+metrics.finish()
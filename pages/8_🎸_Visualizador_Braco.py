@@ -3,7 +3,10 @@ import numpy as np
 import pandas as pd
 import altair as alt
 
+from sonic import metrics, tuning
+
 st.set_page_config(page_title="Visualizador de Braço", page_icon="🎸", layout="wide")
+metrics.begin("visualizador_braco")
 
 st.title("🎸 Luthieria: O Braço da Física vs. O Braço Real")
 
@@ -27,22 +30,32 @@ comprimento_corda = st.sidebar.number_input("Escala (mm)", value=650, step=10, h
 zoom_mode = st.sidebar.checkbox("Modo Microscópio (Zoom)", value=False, help="Foca nas diferenças pequenas")
 
 # --- Lógica ---
-# Ratios Justos
-just_ratios = [1/1, 16/15, 9/8, 6/5, 5/4, 4/3, 45/32, 3/2, 8/5, 5/3, 9/5, 15/8, 2/1]
+# Ratios (Justo e Temperado) das 12 notas + a Oitava
+just_ratios = np.append(tuning.ratios("just"), 2.0)
+temp_ratios = np.append(tuning.ratios("12-EDO"), 2.0)
 nomes = ["Tônica", "2ªm", "2ªM", "3ªm", "3ªM", "4ªJ", "Tri", "5ªJ", "6ªm", "6ªM", "7ªm", "7ªM", "Oitava"]
 
-dados = []
-for i in range(13):
-    # Temperado (Fórmula de Luthier)
-    pos_temp = comprimento_corda * (1 - (1 / (2 ** (i / 12))))
-    
-    # Justo (Fração Simples)
-    pos_just = comprimento_corda * (1 - (1 / just_ratios[i]))
-    
-    dados.append({"Semitom": i, "Nome": nomes[i], "Sistema": "Temperado (Moderno)", "mm": pos_temp})
-    dados.append({"Semitom": i, "Nome": nomes[i], "Sistema": "Natural (Justo)", "mm": pos_just})
+def fret_table(comprimento_corda):
+    # Posição de cada traste (mm da pestana) nos dois sistemas, em formato longo
+    dados = []
+    for i in range(13):
+        # Temperado (Fórmula de Luthier)
+        pos_temp = comprimento_corda * (1 - (1 / temp_ratios[i]))
+
+        # Justo (Fração Simples)
+        pos_just = comprimento_corda * (1 - (1 / just_ratios[i]))
 
-df = pd.DataFrame(dados)
+        dados.append({"Semitom": i, "Nome": nomes[i], "Sistema": "Temperado (Moderno)", "mm": pos_temp})
+        dados.append({"Semitom": i, "Nome": nomes[i], "Sistema": "Natural (Justo)", "mm": pos_just})
+    return pd.DataFrame(dados)
+
+def fret_diff(df):
+    # Tabela comparativa pivotada: quanto o traste temperado se afasta do justo
+    df_pivot = df.pivot(index="Nome", columns="Sistema", values="mm")
+    df_pivot["Diferença (mm)"] = df_pivot["Temperado (Moderno)"] - df_pivot["Natural (Justo)"]
+    return df_pivot.sort_values("Diferença (mm)", ascending=False)
+
+df = fret_table(comprimento_corda)
 
 # --- Visualização ---
 st.divider()
@@ -68,10 +81,11 @@ st.altair_chart((corda + trastes + texto).properties(height=300), use_container_
 st.subheader("📏 A Diferença na Madeira")
 st.write("Se você serrasse o braço no lugar errado, essa seria a diferença:")
 
-# Criar tabela comparativa pivotada
-df_pivot = df.pivot(index="Nome", columns="Sistema", values="mm")
-df_pivot["Diferença (mm)"] = df_pivot["Temperado (Moderno)"] - df_pivot["Natural (Justo)"]
-df_pivot = df_pivot.sort_values("Diferença (mm)", ascending=False)
+df_pivot = fret_diff(df)
 
+# O Styler importa o matplotlib.pyplot ao carregar (~0,5 s na primeira visita):
+# é o preço do degradê, e o orçamento da página em bench/importtime já o inclui
 st.dataframe(df_pivot.style.format("{:.2f}").background_gradient(subset=["Diferença (mm)"], cmap="RdBu_r"))
-st.info("💡 Note como o Tritono (Tri) e as Terças tem as maiores discrepâncias físicas.")
\ No newline at end of file
+st.info("💡 Note como o Tritono (Tri) e as Terças tem as maiores discrepâncias físicas.")
+
+metrics.finish()
@@ -1,8 +1,10 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
+
+from sonic import canvas, clips, metrics, player, prefetch, scope, synth
 
 st.set_page_config(page_title="Treino Auditivo Pro", page_icon="👂", layout="wide")
+metrics.begin("treino_auditivo")
 
 # --- CSS ---
 st.markdown("""
@@ -35,35 +37,17 @@ st.markdown("""
 
 st.title("👂 Desafio do Afinador: Timbres Musicais")
 
-# --- NOVO MOTOR DE SÍNTESE (Sons Confortáveis) ---
-def generate_wave(freq, duration, wave_type="flute", sr=44100):
-    t = np.linspace(0, duration, int(sr*duration), endpoint=False)
-    
-    if wave_type == "flute": 
-        # TIPO 1: FLAUTA (Seno Puro)
-        # Extremamente suave, sem harmônicos.
-        return 0.4 * np.sin(2 * np.pi * freq * t)
-    
-    elif wave_type == "electric_piano":
-        # TIPO 2: PIANO ELÉTRICO (Tipo Rhodes)
-        # Em vez de onda quadrada estridente, somamos harmônicos suaves.
-        # Fundamental + 2º Harmônico (fraco) + 4º Harmônico (fraco)
-        w = 0.4 * np.sin(2 * np.pi * freq * t)
-        w += 0.2 * np.sin(2 * np.pi * (freq * 2) * t)
-        w += 0.1 * np.sin(2 * np.pi * (freq * 4) * t)
-        return w
-    
-    elif wave_type == "soft_string":
-        # TIPO 3: CORDA SUAVE (Onda Triangular)
-        # A triangular é rica como a dente de serra, mas muito menos "abelhuda".
-        # Fórmula da Triangular: 
-        return 0.4 * (2 * np.abs(2 * (t * freq - np.floor(t * freq + 0.5))) - 1)
-    
-    return np.zeros_like(t)
+# --- MOTOR DE SÍNTESE (Sons Confortáveis) ---
+# Os timbres "flute" (seno puro), "electric_piano" (tipo Rhodes: fundamental + 2º e 4º
+# harmônicos fracos) e "soft_string" (triangular) estão declarados em sonic.synth.TIMBRES.
+# Aqui tocamos por wavetable: tabelas limitadas em banda, sem aliasing na triangular.
+OSCILLATOR = "wavetable"
+
+@metrics.timed("generate_wave")
+def generate_wave(freq, duration, wave_type="flute", sr=synth.SAMPLE_RATE):
+    return synth.render(synth.chord([freq], duration, wave_type, sr=sr, oscillator=OSCILLATOR))
 
 # --- ESTADO DO JOGO ---
-if 'target_freq' not in st.session_state:
-    st.session_state.target_freq = np.random.randint(430, 450)
 if 'show_result' not in st.session_state:
     st.session_state.show_result = False
 
@@ -91,6 +75,14 @@ with st.expander("⚙️ Configuração de Timbres", expanded=True):
             target_instr = "electric_piano"
             user_instr = "soft_string"
 
+def mix_clip(target, user):
+    # As duas ondas mixadas num único render (envelope suave, 50% do volume), ver sonic.clips
+    return clips.tuner_mix(target, user, target_instr, user_instr, OSCILLATOR)
+
+# O alvo sai do banco do nível (sonic.prefetch): o som dele já está sendo renderizado
+if 'target_freq' not in st.session_state:
+    st.session_state.target_freq = prefetch.TARGETS.next(difficulty, lambda f: mix_clip(f, 440.0))
+
 st.divider()
 
 # --- O JOGO ---
@@ -102,28 +94,15 @@ with col_game:
     
     # 1. Slider
     user_freq = st.slider("Ajuste a frequência (Hz):", 420.0, 460.0, 440.0, 0.5)
+    # Em segundo plano: lado do alvo, do slider atual e dos vizinhos (um passo para cada lado)
+    prefetch.warm(*(mix_clip(st.session_state.target_freq, f)
+                    for f in (user_freq - 0.5, user_freq, user_freq + 0.5) if 420.0 <= f <= 460.0))
     
     st.markdown("---")
 
-    # 2. Botão de Ouvir
+    # 2. Botão de Ouvir (a mistura é montada dos lados já prontos)
     if st.button("🔊 Tocar Mistura (Som Suave)", type="primary"):
-        sr = 44100
-        # Gerar as duas ondas
-        w_target = generate_wave(st.session_state.target_freq, 3.0, target_instr, sr)
-        w_user = generate_wave(user_freq, 3.0, user_instr, sr)
-        
-        # Mixagem
-        mix = w_target + w_user
-        
-        # Envelope suave (Fade In/Out para não dar estalo)
-        env = np.concatenate([np.linspace(0, 1, 2000), np.ones(len(mix)-4000), np.linspace(1, 0, 2000)])
-        
-        # Normalização para garantir volume confortável
-        max_val = np.max(np.abs(mix))
-        if max_val > 0:
-            mix = mix / max_val * 0.5 # 50% do volume máximo para segurança
-            
-        st.audio(mix * env, sample_rate=sr)
+        player.audio(prefetch.ready(mix_clip(st.session_state.target_freq, user_freq)))
 
     st.caption(f"Referência: {target_instr.replace('_', ' ').title()} | Você: {user_instr.replace('_', ' ').title()}")
     st.markdown("---")
@@ -150,7 +129,7 @@ with col_game:
         st.markdown(f"**Alvo:** {st.session_state.target_freq} Hz | **Você:** {user_freq} Hz")
         
         if st.button("🔄 Novo Desafio"):
-            st.session_state.target_freq = np.random.randint(430, 450)
+            st.session_state.target_freq = prefetch.TARGETS.next(difficulty, lambda f: mix_clip(f, user_freq))
             st.session_state.show_result = False
             st.rerun()
 
@@ -162,26 +141,18 @@ with col_spoiler:
     with st.expander("👀 Ver Spoiler Visual", expanded=False):
         st.subheader("Osciloscópio")
         
-        fig, ax = plt.subplots(figsize=(6, 4))
-        fig.patch.set_facecolor('#0e1117')
-        ax.set_facecolor('#0e1117')
-        
         # Zoom de 20ms para ver o formato da onda
         t_vis = np.linspace(0, 0.02, 1000) 
         
         wt = generate_wave(st.session_state.target_freq, 0.02, target_instr, 50000)
         wu = generate_wave(user_freq, 0.02, user_instr, 50000)
         
-        # Plota ondas individuais
-        ax.plot(t_vis, wt, color='#4CAF50', alpha=0.3, label='Alvo')
-        ax.plot(t_vis, wu, color='#FFC107', alpha=0.3, label='Você')
-        
-        # Plota mix
-        ax.plot(t_vis, wt+wu, color='white', lw=1.5, label='Mix')
-        
-        ax.legend(facecolor='#222', labelcolor='white')
-        ax.axis('off')
-        st.pyplot(fig)
+        # Ondas individuais + mix, numa figura reciclada entre reruns (sonic.scope)
+        # ou desenhadas no navegador (SONIC_PLOTS=canvas)
+        if canvas.enabled():
+            canvas.oscilloscope(t_vis, wt, wu)
+        else:
+            st.image(scope.oscilloscope(t_vis, wt, wu), width="stretch")
         
         envelope_freq = abs(user_freq - st.session_state.target_freq)
         st.caption(f"Batimento: {envelope_freq:.1f} Hz")
@@ -190,24 +161,23 @@ with col_spoiler:
 st.divider()
 st.subheader("🧠 Nível 2: Ouvido Absoluto (Velocidade)")
 
+quiz_rates = clips.QUIZ_RATES
 if 'quiz_diff' not in st.session_state:
-    st.session_state.quiz_diff = np.random.choice([1, 2, 4, 8])
+    st.session_state.quiz_diff = np.random.choice(quiz_rates)
+
+def quiz_clip(diff):
+    # 440 Hz (corda suave) contra 440 + diff (flauta), com ganho de segurança
+    return clips.beat_quiz(diff, OSCILLATOR)
+
+# Só 4 desafios possíveis: os 5 lados (440 Hz + 4 batimentos) ficam prontos em segundo plano
+prefetch.warm(*(quiz_clip(d) for d in quiz_rates))
 
 col_q1, col_q2 = st.columns([1, 2])
 
 with col_q1:
     st.write("Ouça o batimento. Qual a velocidade?")
     if st.button("🔊 Tocar Desafio"):
-        f_base = 440
-        f_desafio = f_base + st.session_state.quiz_diff
-        sr = 44100
-        # Usando os sons suaves aqui também
-        w1 = generate_wave(f_base, 4.0, "soft_string", sr)
-        w2 = generate_wave(f_desafio, 4.0, "flute", sr)
-        
-        # Normalização de segurança
-        mix = (w1+w2) * 0.5
-        st.audio(mix, sample_rate=sr)
+        player.audio(prefetch.ready(quiz_clip(st.session_state.quiz_diff)))
 
 with col_q2:
     cols = st.columns(4)
@@ -228,5 +198,7 @@ with col_q2:
         else: st.error("Errou.")
     
     if st.button("Próximo Quiz ➡️"):
-        st.session_state.quiz_diff = np.random.choice([1, 2, 4, 8])
-        st.rerun()
\ No newline at end of file
+        st.session_state.quiz_diff = np.random.choice(quiz_rates)
+        st.rerun()
+
+metrics.finish()
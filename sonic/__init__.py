@@ -0,0 +1 @@
+"""Núcleo compartilhado do Sonic Py-tagoras (síntese, afinação e renderização)."""
@@ -0,0 +1,85 @@
+"""Clipes e figuras pré-renderizados no build (`python -m sonic.prerender`).
+
+O build grava em `static/` (a pasta de arquivos estáticos do Streamlit, ao
+lado do `app.py`) todos os clipes e figuras de parâmetros finitos, mais um
+`manifest.json`. Aqui as páginas só consultam o manifesto: se o clipe ou a
+figura pedida está lá, vai para o navegador uma URL, sem síntese, sem
+matplotlib e sem bytes no WebSocket. O que não está (entradas livres, drones
+longos, `SONIC_SAMPLE_RATE` diferente do build) segue renderizado na hora.
+
+* figuras: `/app/static/...png?v=<hash>`, pelo servidor estático do Streamlit
+  (`server.enableStaticServing`); com o `?v=` o Tornado responde com cache
+  longo;
+* áudio: o servidor estático do Streamlit entrega `.wav` como `text/plain`
+  (com `nosniff`), então os WAV vão pelo `sonic.media`, que os lê do disco
+  sob a mesma URL estável e imutável de um clipe renderizado na hora.
+
+Sem manifesto (ou com `SONIC_ASSETS=0`) tudo funciona como antes.
+"""
+import json
+import os
+import threading
+from urllib.parse import urljoin
+
+from sonic import media
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static")
+MANIFEST = "manifest.json"
+ENABLED = os.environ.get("SONIC_ASSETS", "1") != "0"
+VERSION = 1
+
+_lock = threading.Lock()
+_manifest = None
+
+
+def figure_key(name, args, fmt):
+    return json.dumps([name, list(args), fmt])
+
+
+def manifest():
+    """Manifesto do build ({"audio": {...}, "figures": {...}}), lido uma vez por processo."""
+    global _manifest
+    if _manifest is None:
+        with _lock:
+            if _manifest is None:
+                found = {"audio": {}, "figures": {}}
+                path = os.path.join(STATIC_DIR, MANIFEST)
+                if ENABLED and os.path.exists(path):
+                    with open(path, encoding="utf-8") as fp:
+                        data = json.load(fp)
+                    if data.get("version") == VERSION:
+                        found = data
+                _manifest = found
+    return _manifest
+
+
+def _base_url():
+    """URL da raiz do app no navegador (com o `baseUrlPath`), ou None fora de um servidor."""
+    import streamlit as st
+
+    url = st.context.url
+    if not url:
+        return None
+    return url if url.endswith("/") else url + "/"
+
+
+def audio_url(clip):
+    """URL do WAV pré-renderizado de `clip`, ou None."""
+    from sonic import audio_cache
+
+    entry = manifest()["audio"].get(audio_cache.clip_key(clip))
+    base = entry and _base_url()
+    # Sem o `sonic.media` no runtime (ex.: Streamlit sem as peças internas), a URL daria 404
+    if not base or not media.install():
+        return None
+    media.STORE.register(entry["id"], os.path.join(STATIC_DIR, entry["file"]), "audio/wav")
+    return urljoin(base, f"media/{entry['id']}.wav")
+
+
+def figure_url(name, args, fmt):
+    """URL estática da figura `name(*args)` pré-renderizada, ou None."""
+    entry = manifest()["figures"].get(figure_key(name, args, fmt))
+    base = entry and _base_url()
+    if not base:
+        return None
+    return urljoin(base, f"app/static/{entry['file']}?v={entry['v']}")
@@ -0,0 +1,62 @@
+"""Cache LRU, endereçado por conteúdo, dos clipes WAV entregues ao `st.audio`.
+
+A chave é um hash da especificação de síntese (frequências, timbres, duração,
+taxa de amostragem, envelope). O valor guardado já é o WAV int16 final, então
+um clique repetido (ou o mesmo pedido vindo de outro usuário) não sintetiza
+nem codifica nada de novo.
+"""
+import hashlib
+import json
+import os
+from dataclasses import asdict
+
+from sonic import metrics, pcm, synth
+from sonic.cache import BytesLRU
+
+DEFAULT_MAX_BYTES = int(os.environ.get("SONIC_AUDIO_CACHE_MB", "64")) * 1024 * 1024
+DITHER = os.environ.get("SONIC_DITHER", "1") != "0"
+# Acima disso o clipe é renderizado em blocos direto para o WAV (drones longos)
+STREAM_SECONDS = 10.0
+
+
+def clip_key(clip):
+    """Hash estável da especificação (inclui as parciais de cada timbre usado)."""
+    spec = asdict(clip)
+    spec["timbres"] = {
+        name: [(p.ratio, p.amp) for p in synth.TIMBRES[name]]
+        for name in sorted({v.timbre for v in clip.voices})
+    }
+    payload = json.dumps(spec, sort_keys=True, default=float)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def encode(clip):
+    if synth.frames(clip) > STREAM_SECONDS * clip.sr:
+        with metrics.stage("audio.stream"):
+            return pcm.encode_stream(
+                synth.stream(clip), clip.sr, synth.frames(clip), synth.peak_bound(clip), DITHER
+            )
+    with metrics.stage("audio.synth"):
+        samples = synth.render(clip)
+    with metrics.stage("audio.encode"):
+        return pcm.encode(samples, clip.sr, DITHER)
+
+
+class ClipCache(BytesLRU):
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        super().__init__(max_bytes)
+
+    def get(self, clip):
+        return self.get_or_create(clip_key(clip), lambda: encode(clip))
+
+
+# Uma instância por processo: compartilhada entre reruns e entre sessões
+CACHE = ClipCache()
+
+
+def wav(clip):
+    """WAV pronto para `st.audio(..., format="audio/wav")`."""
+    with metrics.stage("audio"):
+        data = CACHE.get(clip)
+    metrics.sent("audio", len(data))
+    return data
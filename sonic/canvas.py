@@ -0,0 +1,88 @@
+"""Modo de renderização no navegador para os gráficos de onda.
+
+Com `SONIC_PLOTS=canvas`, o "Raio-X da Onda" (página 7), o osciloscópio
+(página 9) e a figura teórica da página 1 deixam de ser rasterizados pelo
+matplotlib: o servidor só envia as amostras (float32 em base64, alguns KB) e
+um `<canvas>` desenha as linhas no cliente. O canvas é a visualização `plot`
+do componente persistente (`sonic.live`, `frontend/plot.js`): montado uma vez
+por página, recebe a cada rerun só os painéis, e só redesenha se eles
+mudaram. O padrão continua sendo `matplotlib`.
+"""
+import base64
+import os
+from functools import lru_cache
+
+import numpy as np
+
+from sonic import live
+from sonic.scope import CHORD_COLORS
+
+MODE = os.environ.get("SONIC_PLOTS", "matplotlib")
+
+
+def enabled():
+    return MODE == "canvas"
+
+
+def _b64(a):
+    return base64.b64encode(np.ascontiguousarray(a, dtype="<f4").tobytes()).decode()
+
+
+def series(y, color, label=None, alpha=1.0, width=1.5, dash=False):
+    return {"y": _b64(y), "color": color, "label": label, "alpha": alpha, "width": width, "dash": dash}
+
+
+def panel(x, lines, title=None, points=None, legend=False):
+    """Um eixo: `lines` vêm de `series`; `points` são nós (x, y) desenhados como bolinhas."""
+    return {"x": _b64(x), "lines": lines, "title": title, "points": points or [], "legend": legend}
+
+
+def plot(key, panels, height):
+    """Mostra `panels` empilhados (`height` px de canvas) no componente `key`."""
+    live.view("plot", key=key, height=height + 10, panels=panels, plotHeight=height)
+
+
+# =========================================
+# PÁGINA 1: SÉRIE HARMÔNICA
+# =========================================
+def string_modes(height=640):
+    plot("plot-string-modes", _string_modes(), height)
+
+
+@lru_cache(maxsize=None)
+def _string_modes():
+    # Não depende de nada: monta os painéis uma vez por processo
+    x_t = np.linspace(0, 1, 400)
+    panels = []
+    for h in range(1, 5):
+        y_t = np.sin(h * np.pi * x_t)
+        nodes = np.linspace(0, 1, h + 1)
+        panels.append(panel(
+            x_t,
+            [series(y_t, '#4CAF50', width=2), series(-y_t, '#4CAF50', alpha=0.3, width=2, dash=True)],
+            title=f"H{h} (Frequência = {h}x) - Divide a corda em {h} partes",
+            points=[[float(n), 0.0] for n in nodes],
+        ))
+    return panels
+
+
+# =========================================
+# PÁGINA 7: INTERFERÊNCIA DO ACORDE
+# =========================================
+def chord_waves(t, waves, labels, y_sum, height=400):
+    lines = [series(w, CHORD_COLORS[i % len(CHORD_COLORS)], label, alpha=0.3, dash=True)
+             for i, (w, label) in enumerate(zip(waves, labels))]
+    lines.append(series(y_sum, 'white', 'Soma Resultante', width=3))
+    plot("plot-chord-waves", [panel(t, lines, title="Interferência das Ondas (Zoom de 40ms)", legend=True)], height)
+
+
+# =========================================
+# PÁGINA 9: OSCILOSCÓPIO
+# =========================================
+def oscilloscope(t, target, user, height=400):
+    lines = [
+        series(target, '#4CAF50', 'Alvo', alpha=0.3),
+        series(user, '#FFC107', 'Você', alpha=0.3),
+        series(target + user, 'white', 'Mix', width=1.5),
+    ]
+    plot("plot-oscilloscope", [panel(t, lines, legend=True)], height)
@@ -0,0 +1,165 @@
+"""Os clipes que os botões das páginas tocam, montados num lugar só.
+
+Cada função devolve o `synth.Clip` de um botão (o `sonic.player` decide como
+ele chega ao navegador). As páginas, o build (`sonic.prerender`) e os
+benchmarks (`bench/`) chamam estas mesmas funções: uma mudança na conta de
+uma página muda também a chave do clipe pré-renderizado, e o build nunca fica
+defasado em silêncio.
+"""
+from sonic import synth, tuning
+
+# Opções dos widgets que o build percorre
+DURATIONS = [3, 10, 30, 60]     # Duração do som (páginas 4 e 5), em segundos
+FIFTH_STEPS = range(1, 13)      # Quintas empilhadas (páginas 3 e 4)
+
+# --- Página 3: escala gerada pelas quintas ---
+
+def fifths_scale(passos):
+    # Ordenar as frequências para tocar em escala (do grave pro agudo) e não na ordem de geração (quintas)
+    # Isso faz soar "musical" (Dó, Ré, Mi...) em vez de "técnico" (Dó, Sol, Ré...)
+    visited_indices = sorted(tuning.stack_fifths(passos))
+
+    # Fórmula do Temperamento Igual: f = f0 * (2^(n/12)), já pré-calculada na tabela (C4 = 261.63 Hz)
+    freqs = tuning.table("12-EDO", 261.63, 60)[[60 + note_idx for note_idx in visited_indices]]
+
+    # Som suave (Seno + Harmônico), 0.4s por nota com envelope curto
+    return synth.sequence(freqs, 0.4, "bright_sine", envelope="click")
+
+
+# --- Página 4: o Coma Pitagórico ---
+
+COMMA_BASE = 100.0  # O Dó de referência (Hz)
+
+
+def comma(passos, freq_base=COMMA_BASE):
+    """(val_nat, divs_nat, val_temp): `passos` quintas puras e temperadas, trazidas para a oitava da base."""
+    # 1. Caminho das Quintas (Natural / Pitagórico). Fórmula: f * 1.5^n
+    freq_natural = freq_base * (1.5 ** passos)
+
+    # 2. Caminho Temperado (Moderno): 2^(7/12) é a quinta temperada (1.498 em vez de 1.5)
+    freq_temperada = freq_base * ((2**(7/12)) ** passos)
+
+    # 3. Normalização (Trazer para a oitava 100-200Hz para comparar)
+    val_nat = freq_natural
+    divs_nat = 0
+    while val_nat >= freq_base * 2:
+        val_nat /= 2
+        divs_nat += 1
+
+    val_temp = freq_temperada
+    while val_temp >= freq_base * 2:
+        val_temp /= 2
+    return val_nat, divs_nat, val_temp
+
+
+def comma_tones(passos, freq_base=COMMA_BASE):
+    """As frequências dos cinco botões da página 4: puro, pitagórico, temperado e os dois mixes."""
+    val_nat, _, val_temp = comma(passos, freq_base)
+    return [(freq_base,), (val_nat,), (val_temp,), (freq_base, val_nat), (freq_base, val_temp)]
+
+
+def tone(*freqs, duration):
+    # Som rico (Dente de Serra suave). Várias frequências = mix num único render.
+    return synth.chord(freqs, duration, "soft_saw")
+
+
+# --- Página 5: o Intervalo do Lobo ---
+
+WOLF_SYSTEMS = ["Pitagórico", "Mesotônico", "Temperado"]
+
+
+def wolf_freqs(root, system):
+    # Frequências baseadas em C4 = 261.63, com as 12 teclas afinadas de Eb até G#.
+    # Retorna: [Freq Fundamental, Freq Terça, Freq Quinta]
+
+    if "Pitagórico" in system:
+        # Quinta = 1.5 (Pura)
+        # Terça = 81/64 (O Ditono Pitagórico, muito brilhante/áspero)
+        # Lobo: a "quinta" G#-Eb sai encurtada (~1.4798)
+        table = tuning.table("pythagorean", 261.63, 60)
+    elif "Mesotônico" in system:
+        # Quinta = 5^(1/4) ≈ 1.4953 (Encurtada propositalmente para consertar a terça)
+        # Terça = 1.25 (Pura/Natural 5:4 - O "Doce" da Renascença)
+        # Lobo: a "quinta" G#-Eb fica muito larga (~1.5312). É feroz!
+        table = tuning.table("meantone", 261.63, 60)
+    else: # Temperado
+        # Quinta = 1.4983 (Quase pura), Terça = 1.2599 (Um meio termo aceitável)
+        table = tuning.table("12-EDO", 261.63, 60)
+    return table[[root, root + 4, root + 7]]
+
+
+def wolf_chord(is_wolf, system_name, duration=3.0):
+    base = 68 if is_wolf else 60 # G#4 (Lobo) ou C4 (Puro), em MIDI
+    freqs = wolf_freqs(base, system_name)
+
+    # Sintetizar Acorde (senoides puras, com Fade In/Out)
+    return synth.chord(freqs, duration, "sine", gain=0.3, envelope="soft")
+
+
+# --- Página 7: Laboratório de Acordes ---
+
+CHORD_TYPES = {
+    "Maior (Feliz/Estável)": [0, 4, 7],
+    "Menor (Triste/Melancólico)": [0, 3, 7],
+    "Diminuto (Tenso/Assustador)": [0, 3, 6],
+    "Aumentado (Misterioso/Onírico)": [0, 4, 8],
+    "Sus4 (Suspenso/Aberto)": [0, 5, 7],
+    "Maior com 7ª (Jazzy/Sofisticado)": [0, 4, 7, 11],
+    "Menor com 7ª (Soul/Profundo)": [0, 3, 7, 10]
+}
+CHORD_OCTAVES = range(2, 6)  # Opções do campo "Oitava" da página
+
+
+def note_freq(note_name, octave):
+    # Tabela MIDI pré-calculada no padrão A4 = 69 = 440Hz
+    return float(tuning.table("12-EDO")[tuning.midi(tuning.NOTE_NAMES.index(note_name), octave)])
+
+
+def chord_notes(root_note, octave, intervals):
+    """Frequências e nomes ("E4", "G4"...) de cada nota do acorde."""
+    notas = tuning.NOTE_NAMES
+    chord_freqs = []
+    chord_notes_names = []
+
+    for interval in intervals:
+        # Achar o nome da nota
+        root_idx = notas.index(root_note)
+        note_idx = (root_idx + interval) % 12
+        note_name = notas[note_idx]
+
+        # Calcular frequencia real (considerando virada de oitava)
+        current_octave = octave + ((root_idx + interval) // 12)
+        chord_freqs.append(note_freq(note_name, current_octave))
+        chord_notes_names.append(f"{note_name}{current_octave}")
+    return chord_freqs, chord_notes_names
+
+
+def chord(chord_freqs):
+    # SINTESE: Cada nota do acorde = fundamental + harmônicos leves (timbre de orgão/piano)
+    # Envelope ADSR Simples (Attack 100ms, Release 300ms) para não dar "pop".
+    # NORMALIZAÇÃO: pico final em 0.8 para evitar distorção nos alto-falantes.
+    return synth.chord(chord_freqs, 2.0, "organ", envelope="pad", peak=0.8)
+
+
+# --- Página 9: Treino Auditivo ---
+
+QUIZ_RATES = [1, 2, 4, 8]  # Batimentos (Hz) do quiz
+
+
+def tuner_mix(target, user, target_instr, user_instr, oscillator):
+    # As duas ondas mixadas num único render, com envelope suave (Fade In/Out
+    # para não dar estalo) e normalizadas a 50% do volume máximo para segurança
+    return synth.chord(
+        [synth.Voice(target, target_instr), synth.Voice(user, user_instr)],
+        3.0, envelope="soft", peak=0.5, oscillator=oscillator,
+    )
+
+
+def beat_quiz(diff, oscillator):
+    f_base = 440
+    f_desafio = f_base + diff
+    # Usando os sons suaves aqui também (com ganho de segurança)
+    return synth.chord(
+        [synth.Voice(f_base, "soft_string", 0.5), synth.Voice(f_desafio, "flute", 0.5)], 4.0,
+        oscillator=oscillator,
+    )
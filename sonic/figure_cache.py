@@ -0,0 +1,82 @@
+"""Cache das figuras de `sonic.plots`, guardando o PNG/SVG final.
+
+A rasterização do matplotlib é o maior custo de CPU por visualização de
+página. Como essas figuras dependem só de poucos parâmetros, cada combinação
+é desenhada uma única vez por processo (e, opcionalmente, todas já na
+subida do servidor com `SONIC_PREWARM=1`).
+
+O matplotlib (~0,5 s de import) só é carregado quando uma figura precisa
+mesmo ser desenhada: acertos no cache não o importam.
+"""
+import io
+import os
+import threading
+
+from sonic import assets, metrics
+from sonic.cache import BytesLRU
+
+DEFAULT_MAX_BYTES = int(os.environ.get("SONIC_FIGURE_CACHE_MB", "32")) * 1024 * 1024
+# Mesmos padrões do st.pyplot
+SAVEFIG = {"bbox_inches": "tight", "dpi": 200}
+
+CACHE = BytesLRU(DEFAULT_MAX_BYTES)
+_prewarm_lock = threading.Lock()
+_prewarm_thread = None
+
+
+def _draw(name, args, fmt):
+    from sonic import plots
+
+    with metrics.stage("figure.draw"):
+        fig = plots.BUILDERS[name](*args)
+        try:
+            buf = io.BytesIO()
+            fig.savefig(buf, format=fmt, **SAVEFIG)
+            return buf.getvalue()
+        finally:
+            fig.clear()  # Quebra os ciclos figura <-> eixos <-> artistas já aqui, sem esperar o GC
+
+
+def image(name, *args, fmt="png"):
+    """Bytes da figura `name(*args)`, prontos para `st.image` (SVG vem como texto).
+
+    Se o build já gravou a figura (`sonic.assets`), devolve a URL estática.
+    """
+    url = assets.figure_url(name, args, fmt)
+    if url:
+        return url
+    with metrics.stage("figure"):
+        data = CACHE.get_or_create((name, args, fmt), lambda: _draw(name, args, fmt))
+    metrics.sent("figure", len(data))
+    return data.decode() if fmt == "svg" else data
+
+
+def cached(key, make):
+    """Bytes de `make()` guardados no mesmo cache, para figuras que não estão em `plots.BUILDERS`.
+
+    `key` precisa identificar a figura por inteiro (ex.: `("chord_waves", raiz, oitava, tipo)`).
+    """
+    with metrics.stage("figure"):
+        data = CACHE.get_or_create(key, make)
+    metrics.sent("figure", len(data))
+    return data
+
+
+def prewarm(fmt="png"):
+    """Desenha a grade inteira de parâmetros de todas as figuras."""
+    from sonic import plots
+
+    for name, grid in plots.GRID.items():
+        for args in grid:
+            image(name, *args, fmt=fmt)
+
+
+def prewarm_async():
+    """Dispara o `prewarm` numa thread de fundo, uma vez por processo (se habilitado)."""
+    global _prewarm_thread
+    if os.environ.get("SONIC_PREWARM", "0") == "0":
+        return
+    with _prewarm_lock:
+        if _prewarm_thread is None:
+            _prewarm_thread = threading.Thread(target=prewarm, name="figure-prewarm", daemon=True)
+            _prewarm_thread.start()
@@ -0,0 +1,151 @@
+// Página 2: figuras de Lissajous + as duas notas tocando no WebAudio.
+// Parâmetros: freqX, freqY, delta, speed, lineWidth, glow, fade.
+Sonic.views.lissajous = function (root, params) {
+    root.innerHTML = `
+        <style>
+            body { font-family: sans-serif; background: #000; }
+            .container { display: flex; flex-direction: column; align-items: center; justify-content: center; height: 500px; }
+            canvas { background: #000; border: 1px solid #333; border-radius: 8px; }
+            .btn {
+                margin-top: 15px; padding: 10px 25px; font-size: 16px;
+                background: #4CAF50; color: white; border: none; border-radius: 5px; cursor: pointer;
+                transition: 0.2s; font-weight: bold;
+            }
+            .btn:hover { background: #45a049; transform: scale(1.05); }
+        </style>
+        <div class="container">
+            <canvas width="600" height="400"></canvas>
+            <button class="btn">🔊 Tocar / Parar Som</button>
+        </div>`;
+    const canvas = root.querySelector('canvas');
+    const ctx = canvas.getContext('2d');
+    const btn = root.querySelector('button');
+
+    const data = Object.assign({}, params);
+
+    // O AudioContext é criado no primeiro clique e reaproveitado daí em diante
+    let audioCtx = null;
+    let gainNode = null;
+    let oscX = null;
+    let oscY = null;
+    let isPlaying = false;
+
+    const width = canvas.width;
+    const height = canvas.height;
+    const centerX = width / 2;
+    const centerY = height / 2;
+    const scale = 150;
+
+    // Rastro num buffer circular de Float32Array: nada de objetos por ponto nem
+    // `shift()` O(n); o ponto mais antigo é simplesmente sobrescrito.
+    const maxTrail = 4096;
+    const trailX = new Float32Array(maxTrail);
+    const trailY = new Float32Array(maxTrail);
+    let head = 0;   // próxima posição a escrever
+    let count = 0;
+    let time = 0;
+
+    // Sub-passos por quadro: nenhum segmento anda mais que MAX_DPHI radianos na
+    // fase mais rápida, então razões altas (ex.: 15:8) fecham a figura lisa na
+    // taxa de quadros da tela em vez de virar um zigue-zague.
+    const MAX_DPHI = 0.05;
+    const MAX_SUBSTEPS = 32;
+
+    function push(x, y) {
+        trailX[head] = x;
+        trailY[head] = y;
+        head = (head + 1) % maxTrail;
+        if (count < maxTrail) count++;
+    }
+
+    function draw() {
+        ctx.fillStyle = `rgba(0, 0, 0, ${data.fade})`;
+        ctx.fillRect(0, 0, width, height);
+
+        const dphi = Math.max(Math.abs(data.freqX), Math.abs(data.freqY)) * data.speed;
+        const steps = Math.min(MAX_SUBSTEPS, Math.max(1, Math.ceil(dphi / MAX_DPHI)));
+        const dt = data.speed / steps;
+
+        let x = 0, y = 0;
+        for (let k = 0; k < steps; k++) {
+            time += dt;
+            x = centerX + Math.sin(data.freqX * time + data.delta) * scale;
+            y = centerY + Math.sin(data.freqY * time) * scale;
+            push(x, y);
+        }
+
+        // Um único path contínuo por quadro (do ponto mais antigo ao mais novo)
+        ctx.beginPath();
+        ctx.strokeStyle = '#00ff00';
+        ctx.lineWidth = data.lineWidth;
+        ctx.shadowBlur = data.glow;
+        ctx.shadowColor = '#00ff00';
+
+        const start = (head - count + maxTrail) % maxTrail;
+        ctx.moveTo(trailX[start], trailY[start]);
+        for (let i = 1; i < count; i++) {
+            const j = (start + i) % maxTrail;
+            ctx.lineTo(trailX[j], trailY[j]);
+        }
+        ctx.stroke();
+
+        ctx.beginPath();
+        ctx.shadowBlur = 0;
+        ctx.fillStyle = '#fff';
+        ctx.arc(x, y, data.lineWidth + 2, 0, Math.PI * 2);
+        ctx.fill();
+
+        requestAnimationFrame(draw);
+    }
+    draw();
+
+    function startAudio() {
+        if (audioCtx === null) {
+            audioCtx = new (window.AudioContext || window.webkitAudioContext)();
+            gainNode = audioCtx.createGain();
+            gainNode.gain.value = 0.1;
+            gainNode.connect(audioCtx.destination);
+        }
+        if (audioCtx.state === 'suspended') audioCtx.resume();
+
+        oscX = audioCtx.createOscillator();
+        oscX.type = 'sine';
+        oscX.frequency.value = data.freqX;
+
+        oscY = audioCtx.createOscillator();
+        oscY.type = 'sine';
+        oscY.frequency.value = data.freqY;
+
+        oscX.connect(gainNode);
+        oscY.connect(gainNode);
+        oscX.start();
+        oscY.start();
+
+        isPlaying = true;
+        btn.innerText = "🛑 Parar Som";
+        btn.style.background = "#e74c3c";
+    }
+
+    function stopAudio() {
+        if (oscX) oscX.stop();
+        if (oscY) oscY.stop();
+        oscX = oscY = null;
+        isPlaying = false;
+        btn.innerText = "🔊 Tocar / Parar Som";
+        btn.style.background = "#4CAF50";
+    }
+
+    btn.onclick = () => (isPlaying ? stopAudio() : startAudio());
+
+    return {
+        update(changed) {
+            Object.assign(data, changed);
+            // Troca de nota com o som tocando: reafina os osciladores sem recriar nada
+            if (isPlaying) {
+                const now = audioCtx.currentTime;
+                if ('freqX' in changed) oscX.frequency.setTargetAtTime(data.freqX, now, 0.01);
+                if ('freqY' in changed) oscY.frequency.setTargetAtTime(data.freqY, now, 0.01);
+            }
+        },
+    };
+};
@@ -0,0 +1,431 @@
+// Página 6: dois pianos (Natural x Temperado) com osciloscópio/espectro ao vivo.
+// Parâmetros: natural, temperado (Hz por tecla), labels, eh_preta, showTiming, showLatency, engine.
+// Não devolve nada ao Python: tocar uma nota não faz o script rodar de novo.
+Sonic.views.piano = function (root, params) {
+    root.innerHTML = `
+        <style>
+            body { font-family: monospace; color: white; background-color: #0e1117; user-select: none; }
+
+            .main-wrapper { display: flex; flex-direction: column; align-items: center; gap: 10px; width: 100%; }
+
+            .top-bar {
+                display: flex; gap: 20px; align-items: center; justify-content: center;
+                background: #1f2937; padding: 10px; border-radius: 8px; width: 100%; max-width: 800px;
+            }
+
+            .control-group { display: flex; flex-direction: column; align-items: center; }
+            .control-group label { font-size: 10px; color: #aaa; margin-bottom: 2px; text-transform: uppercase; }
+
+            select { padding: 5px; background: #333; color: white; border: 1px solid #555; border-radius: 4px; }
+
+            .toggle-container { display: flex; background: #111; border-radius: 4px; border: 1px solid #444; overflow: hidden; }
+            .toggle-btn {
+                padding: 5px 15px; cursor: pointer; font-size: 12px; background: #111; color: #888; border: none; transition: 0.2s;
+            }
+            .toggle-btn:hover { color: white; }
+            .toggle-btn.active { background: #333; color: #4CAF50; font-weight: bold; }
+
+            /* CANVAS */
+            .visualizer-container {
+                width: 100%; max-width: 800px; height: 140px;
+                background: #000; border: 1px solid #444; border-radius: 5px; position: relative;
+                box-shadow: 0 4px 15px rgba(0,0,0,0.5);
+            }
+            canvas { width: 100%; height: 100%; display: block; }
+
+            /* PIANO */
+            .piano-group { display: flex; flex-direction: column; gap: 2px; position: relative; margin-top: 5px; }
+            .piano-label { font-size: 10px; color: #aaa; margin-left: 5px; }
+            .piano { position: relative; height: 130px; display: flex; justify-content: center; }
+
+            .key {
+                border: 1px solid #777; border-radius: 0 0 4px 4px; cursor: pointer;
+                box-sizing: border-box; display: flex; flex-direction: column;
+                align-items: center; justify-content: flex-end;
+                padding-bottom: 5px; position: relative;
+            }
+            .white-key { width: 32px; height: 100%; background: white; color: black; z-index: 1; }
+            .white-key .kb { color: #d32f2f; font-weight: bold; font-size: 11px; margin-bottom: 2px; }
+            .white-key .note { font-size: 8px; opacity: 0.6; }
+            .white-key.active { background: #ccc; }
+
+            .black-key {
+                width: 22px; height: 60%; background: #111; color: white;
+                position: absolute; z-index: 2; border: 1px solid #000; border-top: none;
+            }
+            .black-key .kb { color: #4fc3f7; font-weight: bold; font-size: 10px; margin-bottom: 2px; }
+            .black-key.active { background: #444; }
+
+            /* MONITOR DE FREQUÊNCIA */
+            #monitor {
+                margin-top: 15px; font-size: 1.5em; font-weight: bold; color: #4CAF50;
+                text-align: center; height: 30px; font-family: monospace;
+                text-shadow: 0 0 10px rgba(76, 175, 80, 0.3);
+            }
+
+            /* LATÊNCIA (showLatency) */
+            #latency { width: 100%; max-width: 800px; font-size: 12px; color: #ccc; }
+            #latency .title { color: #aaa; text-transform: uppercase; font-size: 10px; margin-bottom: 4px; }
+            #latency table { border-collapse: collapse; }
+            #latency th, #latency td { padding: 2px 8px; border-bottom: 1px solid #333; text-align: right; }
+            #latency th { text-align: left; color: #aaa; font-weight: normal; }
+            #latency .hint { margin-top: 6px; color: #888; }
+        </style>
+        <div class="main-wrapper">
+            <div class="top-bar">
+                <div class="control-group">
+                    <label>Controle do Teclado (PC)</label>
+                    <select id="mode-selector">
+                        <option value="both">Tocar Ambos</option>
+                        <option value="natural">Apenas Natural</option>
+                        <option value="temperado">Apenas Temperado</option>
+                    </select>
+                </div>
+                <div class="control-group">
+                    <label>Tipo de Gráfico</label>
+                    <div class="toggle-container">
+                        <button class="toggle-btn active" data-mode="wave">🌊 Onda</button>
+                        <button class="toggle-btn" data-mode="bar">📊 Barras</button>
+                        <button class="toggle-btn" data-mode="log">📈 Log</button>
+                    </div>
+                </div>
+            </div>
+
+            <div class="visualizer-container">
+                <canvas id="scope"></canvas>
+            </div>
+
+            <div class="piano-group">
+                <div class="piano-label">Natural (Just Intonation)</div>
+                <div class="piano" id="piano-nat"></div>
+            </div>
+
+            <div class="piano-group">
+                <div class="piano-label">Temperado (Equal Temperament)</div>
+                <div class="piano" id="piano-temp"></div>
+            </div>
+
+            <div id="monitor">Clique no piano para ativar...</div>
+
+            <div id="latency">
+                <div class="title">⏱️ Latência: tecla → som</div>
+                <table></table>
+                <div class="hint"></div>
+            </div>
+        </div>`;
+
+    const data = Object.assign({}, params);
+
+    // Um único AudioContext (e um único par de analisadores) pela vida do componente
+    const AudioContext = window.AudioContext || window.webkitAudioContext;
+    const ctx = new AudioContext();
+
+    const analyserNat = ctx.createAnalyser();
+    const analyserTemp = ctx.createAnalyser();
+    analyserNat.fftSize = 2048;
+    analyserTemp.fftSize = 2048;
+
+    const masterGain = ctx.createGain();
+    masterGain.gain.value = 0.4;
+    masterGain.connect(ctx.destination);
+
+    analyserNat.connect(masterGain);
+    analyserTemp.connect(masterGain);
+
+    const canvas = document.getElementById('scope');
+    const cCtx = canvas.getContext('2d');
+    let visualMode = 'wave';
+
+    root.querySelectorAll('.toggle-btn').forEach(btn => {
+        btn.onclick = () => {
+            visualMode = btn.dataset.mode;
+            root.querySelectorAll('.toggle-btn').forEach(b => b.classList.remove('active'));
+            btn.classList.add('active');
+        };
+    });
+
+    // Buffers alocados uma única vez: o loop de desenho não cria nenhum objeto
+    const bufferLength = analyserNat.frequencyBinCount;
+    const dataNat = new Uint8Array(bufferLength);
+    const dataTemp = new Uint8Array(bufferLength);
+
+    // Espectro em bandas logarítmicas (uma oitava ocupa sempre a mesma largura):
+    // bandEdges[k]..bandEdges[k+1] são os bins FFT da banda k, calculados uma vez.
+    const N_BANDS = 96;
+    const F_MIN = 30, F_MAX = 10000;
+    const bandEdges = new Uint16Array(N_BANDS + 1);
+    const binHz = ctx.sampleRate / analyserNat.fftSize;
+    for (let k = 0; k <= N_BANDS; k++) {
+        const f = F_MIN * Math.pow(F_MAX / F_MIN, k / N_BANDS);
+        bandEdges[k] = Math.min(bufferLength - 1, Math.round(f / binHz));
+    }
+
+    // O canvas só é redimensionado quando o tamanho muda de fato (atribuir
+    // width/height realoca e limpa o backing store)
+    let w = 0, h = 0;
+    function resize() {
+        w = canvas.width = canvas.offsetWidth;
+        h = canvas.height = canvas.offsetHeight;
+    }
+    if (window.ResizeObserver) new ResizeObserver(resize).observe(canvas);
+    else window.addEventListener('resize', resize);
+    resize();
+
+    function drawWaveLine(buf, color) {
+        cCtx.beginPath();
+        cCtx.strokeStyle = color;
+        const sliceWidth = w / bufferLength;
+        for (let i = 0; i < bufferLength; i++) {
+            const y = (buf[i] / 128.0) * (h / 2);
+            if (i === 0) cCtx.moveTo(0, y); else cCtx.lineTo(i * sliceWidth, y);
+        }
+        cCtx.stroke();
+    }
+
+    function drawBars() {
+        const barWidth = (w / bufferLength) * 2.5;
+        const limit = bufferLength / 2;
+        cCtx.fillStyle = 'rgba(0, 255, 0, 0.6)';
+        for (let i = 0, x = 0; i < limit; i++, x += barWidth + 1) {
+            const bh = dataNat[i] / 2;
+            cCtx.fillRect(x, h - bh, barWidth, bh);
+        }
+        cCtx.fillStyle = 'rgba(255, 149, 0, 0.6)';
+        for (let i = 0, x = 0; i < limit; i++, x += barWidth + 1) {
+            const bh = dataTemp[i] / 2;
+            cCtx.fillRect(x, h - bh, barWidth, bh);
+        }
+    }
+
+    function drawLogBands(buf, color) {
+        const bandWidth = w / N_BANDS;
+        cCtx.fillStyle = color;
+        for (let k = 0; k < N_BANDS; k++) {
+            // Pico dentro da banda (bandas graves podem ter um único bin)
+            let peak = buf[bandEdges[k]];
+            for (let i = bandEdges[k] + 1; i < bandEdges[k + 1]; i++) if (buf[i] > peak) peak = buf[i];
+            const bh = (peak / 255) * h;
+            cCtx.fillRect(k * bandWidth, h - bh, bandWidth - 1, bh);
+        }
+    }
+
+    // Tempo por quadro (média móvel exponencial), exibido com showTiming
+    let frameMs = 0;
+
+    function draw() {
+        const t0 = performance.now();
+
+        cCtx.globalCompositeOperation = 'source-over';
+        cCtx.fillStyle = '#000';
+        cCtx.fillRect(0, 0, w, h);
+
+        if (visualMode === 'wave') {
+            analyserNat.getByteTimeDomainData(dataNat);
+            analyserTemp.getByteTimeDomainData(dataTemp);
+            cCtx.lineWidth = 2;
+            cCtx.globalCompositeOperation = 'screen';
+            drawWaveLine(dataTemp, '#ff9500');
+            drawWaveLine(dataNat, '#00ff00');
+        } else {
+            analyserNat.getByteFrequencyData(dataNat);
+            analyserTemp.getByteFrequencyData(dataTemp);
+            cCtx.globalCompositeOperation = 'lighter';
+            if (visualMode === 'bar') {
+                drawBars();
+            } else {
+                drawLogBands(dataNat, 'rgba(0, 255, 0, 0.6)');
+                drawLogBands(dataTemp, 'rgba(255, 149, 0, 0.6)');
+            }
+        }
+
+        frameMs += 0.05 * (performance.now() - t0 - frameMs);
+        if (data.showTiming) {
+            cCtx.globalCompositeOperation = 'source-over';
+            cCtx.fillStyle = '#888';
+            cCtx.font = '10px monospace';
+            cCtx.fillText(frameMs.toFixed(2) + ' ms/quadro', w - 95, 12);
+        }
+        requestAnimationFrame(draw);
+    }
+    draw();
+
+    const keyMap = {
+        'z': 0, 's': 1, 'x': 2, 'd': 3, 'c': 4, 'v': 5, 'g': 6, 'b': 7, 'h': 8, 'n': 9, 'j': 10, 'm': 11,
+        'q': 12, '2': 13, 'w': 14, '3': 15, 'e': 16, 'r': 17, '5': 18, 't': 19, '6': 20, 'y': 21, '7': 22, 'u': 23, 'i': 24
+    };
+    const indexToChar = {};
+    for (const [char, idx] of Object.entries(keyMap)) indexToChar[idx] = char.toUpperCase();
+
+    // Motor de vozes (voices.js): um pool fixo por teclado, nada é criado por nota.
+    // Com engine = 'worklet', a síntese roda num AudioWorklet (se o navegador permitir).
+    const engines = {
+        nodes: { nat: new Sonic.VoicePool(ctx, analyserNat), temp: new Sonic.VoicePool(ctx, analyserTemp) },
+    };
+    let engine = engines.nodes;
+
+    function setEngine(name) {
+        if (name !== 'worklet' || !ctx.audioWorklet) { engine = engines.nodes; return; }
+        if (!engines.worklet) {
+            engines.worklet = Promise.all([
+                Sonic.WorkletVoices.create(ctx, analyserNat),
+                Sonic.WorkletVoices.create(ctx, analyserTemp),
+            ]).then(([nat, temp]) => ({ nat, temp }))
+              .catch(() => engines.nodes);  // Sem suporte (ex.: contexto inseguro): fica nos nós
+        }
+        engines.worklet.then(e => { if (data.engine === 'worklet') engine = e; });
+    }
+    setEngine(data.engine);
+
+    // Latência tecla -> som por número de vozes soando (deve ficar plana). A conta
+    // e a tabela ficam no navegador: tocar não manda nada ao servidor, que não
+    // pode virar o gargalo justamente quando as notas se acumulam.
+    const LATENCY_KEEP = 200;  // Últimas amostras guardadas por número de vozes
+    let latencies = [];        // latencies[vozes] = [ms, ...]
+    const latencyPanel = root.querySelector('#latency');
+
+    // Percentil com interpolação linear (o mesmo do pandas `describe`)
+    function quantile(sorted, q) {
+        const pos = q * (sorted.length - 1), lo = Math.floor(pos), hi = Math.ceil(pos);
+        return sorted[lo] + (sorted[hi] - sorted[lo]) * (pos - lo);
+    }
+
+    function renderLatency() {
+        latencyPanel.style.display = data.showLatency ? '' : 'none';
+        if (!data.showLatency) return;
+        const rows = [['Vozes soando'], ['Notas'], ['50% (ms)'], ['95% (ms)'], ['Máx (ms)']];
+        latencies.forEach((xs, voices) => {
+            if (!xs) return;
+            const s = Float64Array.from(xs).sort();
+            rows[0].push(voices);
+            rows[1].push(s.length);
+            rows[2].push(quantile(s, 0.5).toFixed(1));
+            rows[3].push(quantile(s, 0.95).toFixed(1));
+            rows[4].push(s[s.length - 1].toFixed(1));
+        });
+        latencyPanel.querySelector('table').innerHTML = rows[0].length > 1
+            ? rows.map(r => '<tr>' + r.map((c, i) => i ? `<td>${c}</td>` : `<th>${c}</th>`).join('') + '</tr>').join('')
+            : '';
+        const motor = data.engine === 'worklet' ? 'AudioWorklet' : 'Nós WebAudio';
+        latencyPanel.querySelector('.hint').innerText = rows[0].length > 1
+            ? `Motor: ${motor}. Toque várias notas juntas: a latência não deve subir com as vozes.`
+            : `Motor: ${motor}. Toque algumas notas para medir.`;
+    }
+
+    function recordLatency(voices, ms) {
+        const xs = latencies[voices] || (latencies[voices] = []);
+        xs.push(ms);
+        if (xs.length > LATENCY_KEEP) xs.shift();
+        renderLatency();
+    }
+
+    function playSound(freq, side) {
+        if (ctx.state === 'suspended') ctx.resume();
+        return engine[side].noteOn(freq);
+    }
+
+    // 'fixedMode' identifica se veio do mouse (cada piano toca só o seu sistema)
+    function createKeys(containerId, prefix, fixedMode) {
+        const container = document.getElementById(containerId);
+        container.innerHTML = '';
+        let leftPos = 0;
+        const whiteWidth = 32; const blackWidth = 22;
+        data.labels.forEach((label, i) => {
+            const isBlack = data.eh_preta[i];
+            const bindChar = indexToChar[i] || "";
+            const key = document.createElement('div');
+            key.id = prefix + '-' + i;
+            key.innerHTML = `<span class="kb">${bindChar}</span><span class="note">${label}</span>`;
+            if (!isBlack) {
+                key.className = 'key white-key'; leftPos += whiteWidth;
+            } else {
+                key.className = 'key black-key';
+                key.style.left = (leftPos - (blackWidth / 2)) + 'px';
+            }
+
+            key.onmousedown = (e) => triggerNote(i, fixedMode, e.timeStamp);
+            key.onmouseup = () => releaseNote(i);
+            key.onmouseleave = () => releaseNote(i);
+            container.appendChild(key);
+        });
+        container.style.width = leftPos + 'px';
+    }
+
+    function buildPianos() {
+        createKeys('piano-nat', 'k-nat', 'natural');
+        createKeys('piano-temp', 'k-temp', 'temperado');
+    }
+
+    function triggerNote(index, forcedMode = null, eventTime = performance.now()) {
+        const globalMode = document.getElementById('mode-selector').value;
+        const monitor = document.getElementById('monitor');
+
+        let playNat = false;
+        let playTemp = false;
+
+        if (forcedMode) {
+            // Se veio do Mouse, obedece o clique independente do combobox
+            if (forcedMode === 'natural') playNat = true;
+            if (forcedMode === 'temperado') playTemp = true;
+        } else {
+            // Se veio do Teclado, obedece o combobox
+            if (globalMode === 'both' || globalMode === 'natural') playNat = true;
+            if (globalMode === 'both' || globalMode === 'temperado') playTemp = true;
+        }
+
+        let txt = data.labels[index] + " | ";
+        const onsets = [];
+        const pools = engine;
+
+        if (playNat) {
+            document.getElementById('k-nat-' + index)?.classList.add('active');
+            onsets.push(playSound(data.natural[index], 'nat'));
+            txt += "Nat: " + data.natural[index].toFixed(1) + "Hz ";
+        }
+
+        if (playTemp) {
+            document.getElementById('k-temp-' + index)?.classList.add('active');
+            onsets.push(playSound(data.temperado[index], 'temp'));
+            txt += "Temp: " + data.temperado[index].toFixed(1) + "Hz";
+        }
+
+        // Diferença da tecla entre os dois sistemas (a mesma nos dois teclados)
+        const cents = 1200 * Math.log2(data.natural[index] / data.temperado[index]);
+        txt += ` (${cents >= 0 ? '+' : ''}${cents.toFixed(1)} cents)`;
+        monitor.innerText = txt;
+
+        // Latência tecla -> som, junto com quantas vozes estavam soando
+        Promise.all(onsets).then(times => {
+            if (!times.length) return;
+            const latencyMs = Sonic.onsetLatency(ctx, Math.min(...times), eventTime);
+            const voices = pools.nat.active() + pools.temp.active();
+            monitor.innerText = txt + ` | ${latencyMs.toFixed(1)} ms (${voices} vozes)`;
+            recordLatency(voices, latencyMs);
+        });
+    }
+
+    function releaseNote(index) {
+        document.getElementById('k-nat-' + index)?.classList.remove('active');
+        document.getElementById('k-temp-' + index)?.classList.remove('active');
+    }
+
+    // Eventos de Teclado (chamam triggerNote SEM forcedMode)
+    window.addEventListener('keydown', (e) => { if (!e.repeat && keyMap.hasOwnProperty(e.key.toLowerCase())) triggerNote(keyMap[e.key.toLowerCase()], null, e.timeStamp); });
+    window.addEventListener('keyup', (e) => { if (keyMap.hasOwnProperty(e.key.toLowerCase())) releaseNote(keyMap[e.key.toLowerCase()]); });
+
+    buildPianos();
+    renderLatency();
+
+    return {
+        update(changed) {
+            Object.assign(data, changed);
+            // Nova afinação base: só as frequências mudam (lidas a cada nota); as teclas
+            // só são refeitas se o próprio teclado mudar
+            if ('labels' in changed || 'eh_preta' in changed) buildPianos();
+            if ('engine' in changed) {
+                setEngine(data.engine);
+                latencies = [];  // Outro motor: as medidas recomeçam do zero
+            }
+            if ('engine' in changed || 'showLatency' in changed) renderLatency();
+        },
+    };
+};
@@ -0,0 +1,110 @@
+// Gráficos de onda desenhados no navegador (SONIC_PLOTS=canvas, ver sonic/canvas.py).
+// Parâmetros: panels (eixos empilhados, amostras em float32/base64), plotHeight.
+//
+// O canvas é montado uma vez por `key`: num rerun que muda o acorde ou o
+// slider só chegam os painéis novos, e o mesmo canvas é redesenhado.
+Sonic.views.plot = function (root, params) {
+    root.innerHTML = `
+        <style>
+            canvas { width: 100%; display: block; }
+        </style>
+        <canvas></canvas>`;
+    const canvas = root.querySelector('canvas');
+    const ctx = canvas.getContext('2d');
+    const BG = '#0e1117';
+
+    let panels = [], height = params.plotHeight;
+
+    // float32 little-endian em base64 -> Float32Array (sem parse de JSON número a número)
+    function decode(s) {
+        const bin = atob(s);
+        const bytes = new Uint8Array(bin.length);
+        for (let i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+        return new Float32Array(bytes.buffer);
+    }
+
+    function load(raw) {
+        panels = raw.map(p => Object.assign({}, p, {
+            x: decode(p.x),
+            lines: p.lines.map(l => Object.assign({}, l, { y: decode(l.y) })),
+        }));
+    }
+
+    function extent(p) {
+        let lo = Infinity, hi = -Infinity;
+        for (const l of p.lines) for (const v of l.y) { if (v < lo) lo = v; if (v > hi) hi = v; }
+        for (const [, v] of p.points) { if (v < lo) lo = v; if (v > hi) hi = v; }
+        const pad = 0.05 * ((hi - lo) || 1);  // Mesma margem de 5% do matplotlib
+        return [lo - pad, hi + pad];
+    }
+
+    function draw() {
+        const dpr = window.devicePixelRatio || 1;
+        const w = root.clientWidth || window.innerWidth, h = height;
+        canvas.style.height = h + 'px';
+        canvas.width = w * dpr; canvas.height = h * dpr;
+        ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+        ctx.fillStyle = BG; ctx.fillRect(0, 0, w, h);
+
+        const ph = h / panels.length;
+        panels.forEach((p, k) => {
+            let top = k * ph + 8, bottom = (k + 1) * ph - 8;
+            if (p.title) {
+                ctx.fillStyle = 'white'; ctx.font = '14px sans-serif'; ctx.textAlign = 'center';
+                ctx.fillText(p.title, w / 2, top + 12);
+                top += 24;
+            }
+            const x0 = p.x[0], x1 = p.x[p.x.length - 1];
+            const [lo, hi] = extent(p);
+            const px = x => 8 + (x - x0) / (x1 - x0) * (w - 16);
+            const py = y => bottom - (y - lo) / (hi - lo) * (bottom - top);
+
+            for (const l of p.lines) {
+                ctx.beginPath();
+                ctx.strokeStyle = l.color; ctx.globalAlpha = l.alpha; ctx.lineWidth = l.width;
+                ctx.setLineDash(l.dash ? [6, 4] : []);
+                for (let i = 0; i < l.y.length; i++) {
+                    const X = px(p.x[i]), Y = py(l.y[i]);
+                    if (i === 0) ctx.moveTo(X, Y); else ctx.lineTo(X, Y);
+                }
+                ctx.stroke();
+            }
+            ctx.setLineDash([]); ctx.globalAlpha = 1.0;
+
+            ctx.fillStyle = 'white';
+            for (const [x, y] of p.points) {
+                ctx.beginPath(); ctx.arc(px(x), py(y), 4, 0, 2 * Math.PI); ctx.fill();
+            }
+
+            if (p.legend) {
+                const labels = p.lines.filter(l => l.label);
+                ctx.font = '12px sans-serif'; ctx.textAlign = 'left';
+                const bw = 40 + Math.max(...labels.map(l => ctx.measureText(l.label).width));
+                const bx = w - bw - 12, by = top + 4;
+                ctx.fillStyle = '#222'; ctx.globalAlpha = 0.8;
+                ctx.fillRect(bx, by, bw, 18 * labels.length + 8);
+                labels.forEach((l, i) => {
+                    const y = by + 16 + 18 * i;
+                    ctx.globalAlpha = Math.max(l.alpha, 0.5);
+                    ctx.strokeStyle = l.color; ctx.lineWidth = Math.min(l.width, 3);
+                    ctx.setLineDash(l.dash ? [6, 4] : []);
+                    ctx.beginPath(); ctx.moveTo(bx + 8, y - 4); ctx.lineTo(bx + 30, y - 4); ctx.stroke();
+                    ctx.setLineDash([]); ctx.globalAlpha = 1.0;
+                    ctx.fillStyle = 'white'; ctx.fillText(l.label, bx + 36, y);
+                });
+            }
+        });
+    }
+
+    load(params.panels);
+    window.addEventListener('resize', draw);
+    draw();
+
+    return {
+        update(changed) {
+            if ('panels' in changed) load(changed.panels);
+            if ('plotHeight' in changed) height = changed.plotHeight;
+            draw();
+        },
+    };
+};
@@ -0,0 +1,56 @@
+// Protocolo de componentes do Streamlit em JS puro (sem build / npm).
+//
+// O iframe é montado uma única vez: a cada rerun o Streamlit manda uma
+// mensagem "streamlit:render" com os argumentos novos, e só os parâmetros
+// que mudaram chegam à visualização (`update(changed)`). O loop de desenho
+// e o grafo de áudio continuam vivos entre reruns.
+const Sonic = {
+    views: {},
+    view: null,
+    params: {},
+    height: 0,
+
+    post(type, data) {
+        window.parent.postMessage(Object.assign({ isStreamlitMessage: true, type: type }, data), '*');
+    },
+
+    // Volta um valor para o Python (o script roda de novo com ele)
+    setValue(value) {
+        this.post('streamlit:setComponentValue', { value: value, dataType: 'json' });
+    },
+
+    setHeight(height) {
+        if (height !== this.height) {
+            this.height = height;
+            this.post('streamlit:setFrameHeight', { height: height });
+        }
+    },
+
+    onRender(args) {
+        // Os parâmetros chegam como texto JSON (ver sonic/live.py)
+        const params = args.params ? JSON.parse(args.params) : {};
+        this.setHeight(args.height);
+
+        if (this.view === null) {
+            this.params = params;
+            this.view = this.views[args.view](this.root, params);
+            return;
+        }
+
+        // Só o que mudou desde o último rerun (comparação por valor, via JSON)
+        const changed = {};
+        for (const [k, v] of Object.entries(params)) {
+            if (JSON.stringify(v) !== JSON.stringify(this.params[k])) changed[k] = v;
+        }
+        this.params = params;
+        if (Object.keys(changed).length) this.view.update(changed);
+    },
+
+    start(root) {
+        this.root = root;
+        window.addEventListener('message', (event) => {
+            if (event.data && event.data.type === 'streamlit:render') this.onRender(event.data.args || {});
+        });
+        this.post('streamlit:componentReady', { apiVersion: 1 });
+    },
+};
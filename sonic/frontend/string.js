@@ -0,0 +1,140 @@
+// Página 1 ("Corda Viva"): harmônicos da corda vibrando, com pausa e velocidade.
+// Parâmetros: amps (um por harmônico, 6 a 64), showSum, isPaused, speed.
+//
+// A forma de cada modo, amp·sin(h·π·x), só muda quando um slider muda: fica
+// pré-calculada em Float32Array e cada quadro só multiplica por cos(time·h).
+// Os "fantasmas" tracejados (a forma estática) são desenhados uma vez numa
+// camada fora da tela e copiados com um único drawImage por quadro.
+Sonic.views.string = function (root, params) {
+    root.innerHTML = `
+        <style>
+            canvas { width: 100%; height: 400px; border-radius: 8px; border: 1px solid #333; box-sizing: border-box; display: block; }
+        </style>
+        <canvas></canvas>`;
+    const canvas = root.querySelector('canvas');
+    const ctx = canvas.getContext('2d');
+    const ghost = document.createElement('canvas');
+    const gctx = ghost.getContext('2d');
+
+    const data = Object.assign({}, params);
+    // H1–H6 com cor própria; do H7 em diante, um único traço cinza em lote
+    const colors = ['#ff00ff', '#ffff00', '#00ff00', '#00ffff', '#ff9900', '#ff3333'];
+    const EXTRA = '#888888';
+
+    // O tempo da animação vive aqui: sobrevive a qualquer mudança de slider
+    let time = 0;
+
+    let numPoints = 0, active = [], modes = null, xPix = null, sumY = null;
+    const H = 400, centerY = H / 2, scaleY = H / 5;
+
+    // Recalcula as formas dos modos (só quando amps ou o tamanho mudam)
+    function prepare() {
+        const n = data.amps.length;
+        numPoints = Math.max(300, 8 * n);  // ≥ 8 pontos por meia-onda no harmônico mais alto
+        xPix = new Float32Array(numPoints);
+        sumY = new Float32Array(numPoints);
+        for (let i = 0; i < numPoints; i++) xPix[i] = i / (numPoints - 1) * canvas.width;
+
+        active = [];
+        for (let h = 0; h < n; h++) if (data.amps[h] >= 0.01) active.push(h);
+        modes = new Float32Array(active.length * numPoints);
+        active.forEach((h, k) => {
+            const amp = data.amps[h];
+            for (let i = 0; i < numPoints; i++) {
+                modes[k * numPoints + i] = amp * Math.sin((h + 1) * Math.PI * i / (numPoints - 1));
+            }
+        });
+        drawGhosts();
+    }
+
+    function tracePath(c, k, scale) {
+        const row = k * numPoints;
+        c.moveTo(xPix[0], centerY - modes[row] * scale * scaleY);
+        for (let i = 1; i < numPoints; i++) c.lineTo(xPix[i], centerY - modes[row + i] * scale * scaleY);
+    }
+
+    function drawGhosts() {
+        ghost.width = canvas.width;
+        ghost.height = canvas.height;
+        gctx.clearRect(0, 0, ghost.width, ghost.height);
+
+        // Eixo
+        gctx.beginPath(); gctx.strokeStyle = '#333'; gctx.lineWidth = 1;
+        gctx.moveTo(0, centerY); gctx.lineTo(ghost.width, centerY); gctx.stroke();
+
+        gctx.setLineDash([2, 4]); gctx.lineWidth = 0.5; gctx.globalAlpha = 0.3;
+        let extra = false;
+        active.forEach((h, k) => {
+            if (h < colors.length) {
+                gctx.beginPath(); gctx.strokeStyle = colors[h];
+                tracePath(gctx, k, 1); gctx.stroke();
+            } else {
+                extra = true;
+            }
+        });
+        if (extra) {
+            gctx.beginPath(); gctx.strokeStyle = EXTRA;
+            active.forEach((h, k) => { if (h >= colors.length) tracePath(gctx, k, 1); });
+            gctx.stroke();
+        }
+        gctx.setLineDash([]); gctx.globalAlpha = 1.0;
+    }
+
+    function resize() {
+        canvas.width = window.innerWidth;
+        canvas.height = H;
+        prepare();
+    }
+    window.addEventListener('resize', resize);
+    resize();
+
+    function draw() {
+        const w = canvas.width;
+        ctx.clearRect(0, 0, w, H);
+        ctx.drawImage(ghost, 0, 0);
+
+        sumY.fill(0);
+        ctx.lineWidth = 1.5;
+        ctx.globalAlpha = 0.6;
+
+        let extraPath = false;
+        active.forEach((h, k) => {
+            const c = Math.cos(time * (h + 1));
+            const row = k * numPoints;
+            for (let i = 0; i < numPoints; i++) sumY[i] += modes[row + i] * c;
+
+            if (h < colors.length) {
+                ctx.beginPath(); ctx.strokeStyle = colors[h];
+                tracePath(ctx, k, c); ctx.stroke();
+            } else {
+                // Harmônicos altos num único path (um stroke só para todos)
+                if (!extraPath) { ctx.beginPath(); extraPath = true; }
+                tracePath(ctx, k, c);
+            }
+        });
+        if (extraPath) {
+            ctx.strokeStyle = EXTRA; ctx.lineWidth = 1; ctx.globalAlpha = 0.35;
+            ctx.stroke();
+        }
+
+        if (data.showSum) {
+            ctx.beginPath(); ctx.strokeStyle = '#ffffff'; ctx.lineWidth = 3; ctx.globalAlpha = 1.0;
+            ctx.moveTo(xPix[0], centerY - sumY[0] * scaleY);
+            for (let i = 1; i < numPoints; i++) ctx.lineTo(xPix[i], centerY - sumY[i] * scaleY);
+            ctx.stroke();
+        }
+        ctx.globalAlpha = 1.0;
+
+        if (!data.isPaused) time += data.speed;
+
+        requestAnimationFrame(draw);
+    }
+    draw();
+
+    return {
+        update(changed) {
+            Object.assign(data, changed);
+            if ('amps' in changed) prepare();
+        },
+    };
+};
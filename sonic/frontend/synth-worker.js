@@ -0,0 +1,10 @@
+// Worker da síntese do modo cliente (ver synth.js): a mesma conta, fora do thread da página.
+// Recebe {id, spec}; devolve {id, wav} com o ArrayBuffer do WAV transferido (sem cópia).
+var Sonic = { views: {} };
+importScripts('synth.js');
+
+onmessage = function (event) {
+    const { id, spec } = event.data;
+    const wav = Sonic.wav(Sonic.renderClip(spec), spec.sr);
+    postMessage({ id: id, wav: wav }, [wav]);
+};
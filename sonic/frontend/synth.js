@@ -0,0 +1,120 @@
+// Players de áudio com SONIC_AUDIO=client (páginas 3, 4, 5, 7 e 9).
+// Parâmetros: spec (ver sonic/player.py).
+//
+// O servidor manda só a especificação do clipe; a conta é a do oscilador de
+// referência de sonic/synth.py (soma de senos por parcial, com a fase pelo
+// índice absoluto), com o mesmo envelope linear nas pontas e a mesma
+// normalização de pico de sonic/pcm.py. O resultado vira um WAV em memória
+// num <audio controls>: o player é o mesmo do st.audio (play, pausa, posição).
+//
+// A conta roda num Worker (synth-worker.js, que carrega este mesmo arquivo):
+// os drones de 60 s da página 4 são milhões de senos, e no thread da página
+// travariam a interface enquanto isso. O OfflineAudioContext não serve aqui:
+// os osciladores do WebAudio não reproduzem o sinal do servidor amostra a
+// amostra (python -m bench.client_audio). Sem Worker, a conta volta para o
+// thread da página.
+
+// Sinal final em [-1, 1], amostra a amostra equivalente ao WAV do servidor
+Sonic.renderClip = function (spec) {
+    const sr = spec.sr;
+    const n = Math.floor(sr * spec.duration);
+    const groups = spec.sequence ? spec.voices.map((v) => [v]) : [spec.voices];
+    const out = new Float32Array(n * groups.length);
+    const a = Math.min(Math.round(spec.attack * sr), n);
+    const r = Math.min(Math.round(spec.release * sr), n - a);
+
+    groups.forEach((voices, g) => {
+        const seg = out.subarray(g * n, (g + 1) * n);
+        for (const v of voices) {
+            for (const [ratio, amp] of spec.timbres[v.timbre]) {
+                // Parciais acima de Nyquist não existem no servidor (viram aliasing)
+                if (!(v.base * ratio < sr / 2)) continue;
+                const inc = v.freq * ratio / sr, gain = v.gain * amp;
+                for (let i = 0; i < n; i++) seg[i] += gain * Math.sin(2 * Math.PI * ((inc * i) % 1));
+            }
+        }
+        for (let i = 0; i < a; i++) seg[i] *= i / Math.max(a - 1, 1);
+        for (let i = n - r; i < n; i++) seg[i] *= 1 - (i - (n - r)) / Math.max(r - 1, 1);
+    });
+
+    // Pico medido (clipe inteiro) ou limite conhecido de antemão (clipes longos, em blocos)
+    let peak = spec.bound;
+    if (!peak) {
+        peak = 0;
+        for (let i = 0; i < out.length; i++) peak = Math.max(peak, Math.abs(out[i]));
+    }
+    if (peak > 0) for (let i = 0; i < out.length; i++) out[i] /= peak;
+    return out;
+};
+
+// WAV mono 16 bits, como sonic.pcm.to_wav
+Sonic.wav = function (samples, sr) {
+    const buf = new ArrayBuffer(44 + 2 * samples.length);
+    const view = new DataView(buf);
+    const text = (pos, s) => { for (let i = 0; i < s.length; i++) view.setUint8(pos + i, s.charCodeAt(i)); };
+    text(0, 'RIFF'); view.setUint32(4, 36 + 2 * samples.length, true); text(8, 'WAVE');
+    text(12, 'fmt '); view.setUint32(16, 16, true); view.setUint16(20, 1, true); view.setUint16(22, 1, true);
+    view.setUint32(24, sr, true); view.setUint32(28, 2 * sr, true); view.setUint16(32, 2, true); view.setUint16(34, 16, true);
+    text(36, 'data'); view.setUint32(40, 2 * samples.length, true);
+    for (let i = 0; i < samples.length; i++) {
+        view.setInt16(44 + 2 * i, Math.max(-32768, Math.min(32767, Math.round(samples[i] * 32767))), true);
+    }
+    return buf;
+};
+
+// Um Worker por iframe, criado no primeiro clipe (null se o navegador não deixar)
+Sonic.synthWorker = function () {
+    if (this._synthWorker === undefined) {
+        try {
+            this._synthWorker = new Worker('synth-worker.js');
+        } catch (e) {
+            this._synthWorker = null;
+        }
+    }
+    return this._synthWorker;
+};
+
+Sonic.views.synth = function (root, params) {
+    root.innerHTML = `
+        <style>
+            audio { width: 100%; display: block; }
+        </style>
+        <audio controls preload="auto"></audio>`;
+    const audio = root.querySelector('audio');
+    let url = null;
+    let pending = 0, pendingSpec = null;  // Só o último clipe pedido chega ao player
+
+    function show(wav) {
+        const blob = new Blob([wav], { type: 'audio/wav' });
+        if (url) URL.revokeObjectURL(url);
+        url = URL.createObjectURL(blob);
+        audio.src = url;
+    }
+
+    function renderHere(spec) {
+        show(Sonic.wav(Sonic.renderClip(spec), spec.sr));
+    }
+
+    function load(spec) {
+        const worker = Sonic.synthWorker();
+        if (!worker) return renderHere(spec);
+        const id = ++pending;
+        pendingSpec = spec;
+        worker.onmessage = (event) => {
+            if (event.data.id === pending) show(event.data.wav);
+        };
+        worker.onerror = () => {
+            // Worker não carregou (ex.: política do navegador): segue no thread da página
+            Sonic._synthWorker = null;
+            if (id === pending) renderHere(pendingSpec);
+        };
+        worker.postMessage({ id: id, spec: spec });
+    }
+    load(params.spec);
+
+    return {
+        update(changed) {
+            if ('spec' in changed) load(changed.spec);
+        },
+    };
+};
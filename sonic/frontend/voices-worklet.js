@@ -0,0 +1,74 @@
+// Pool de vozes dentro do AudioWorklet (thread de áudio): onda triangular,
+// ataque linear e decaimento exponencial, com roubo da voz mais antiga.
+// Mensagens: {id, freq} -> responde {id, time, active} quando a nota começa.
+class VoicesProcessor extends AudioWorkletProcessor {
+    constructor(options) {
+        super();
+        const o = options.processorOptions;
+        const n = o.polyphony;
+        this.peak = o.peak;
+        this.attackFrames = Math.max(1, Math.round(o.attack * sampleRate));
+        this.decayFrames = Math.max(1, Math.round((o.decay - o.attack) * sampleRate));
+        this.decayMul = Math.pow(0.001 / o.peak, 1 / this.decayFrames);
+
+        this.phase = new Float64Array(n);
+        this.inc = new Float64Array(n);
+        this.level = new Float64Array(n);
+        this.step = new Float64Array(n);      // incremento do ataque
+        this.left = new Int32Array(n);        // quadros restantes no estágio atual
+        this.stage = new Uint8Array(n);       // 0 livre, 1 ataque, 2 decaimento
+        this.started = new Float64Array(n).fill(-Infinity);
+
+        this.queue = [];
+        this.port.onmessage = (e) => this.queue.push(e.data);
+    }
+
+    noteOn(freq) {
+        let v = this.stage.indexOf(0);
+        if (v < 0) {
+            // Sem voz livre: rouba a mais antiga, atacando a partir do nível atual (sem estalo)
+            v = 0;
+            for (let i = 1; i < this.started.length; i++) if (this.started[i] < this.started[v]) v = i;
+        }
+        this.inc[v] = freq / sampleRate;
+        this.step[v] = (this.peak - this.level[v]) / this.attackFrames;
+        this.left[v] = this.attackFrames;
+        this.stage[v] = 1;
+        this.started[v] = currentTime;
+    }
+
+    process(inputs, outputs) {
+        const out = outputs[0][0];
+        while (this.queue.length) {
+            const msg = this.queue.shift();
+            this.noteOn(msg.freq);
+            let active = 0;
+            for (let i = 0; i < this.stage.length; i++) if (this.stage[i]) active++;
+            this.port.postMessage({ id: msg.id, time: currentTime, active });
+        }
+
+        out.fill(0);
+        for (let v = 0; v < this.stage.length; v++) {
+            if (this.stage[v] === 0) continue;
+            let phase = this.phase[v], level = this.level[v], left = this.left[v];
+            const inc = this.inc[v];
+            for (let i = 0; i < out.length; i++) {
+                if (this.stage[v] === 1) {
+                    level += this.step[v];
+                    if (--left === 0) { this.stage[v] = 2; left = this.decayFrames; }
+                } else {
+                    level *= this.decayMul;
+                    if (--left === 0) { this.stage[v] = 0; level = 0; }
+                }
+                out[i] += level * (4 * Math.abs(phase - 0.5) - 1);
+                phase += inc;
+                if (phase >= 1) phase -= 1;
+                if (this.stage[v] === 0) break;
+            }
+            this.phase[v] = phase; this.level[v] = level; this.left[v] = left;
+        }
+        return true;
+    }
+}
+
+registerProcessor('sonic-voices', VoicesProcessor);
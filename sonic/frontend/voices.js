@@ -0,0 +1,118 @@
+// Motor de vozes polifônico para o piano da página 6.
+//
+// Em vez de criar um OscillatorNode + GainNode por tecla (e deixar o grafo
+// crescer com toques rápidos), cada teclado tem um pool fixo de vozes criadas
+// uma única vez: um oscilador sempre ligado e um ganho em zero. Tocar uma nota
+// só reafina e reprograma o envelope de uma voz livre; sem voz livre, a mais
+// antiga é roubada (com uma rampa curta para não estalar). A carga do thread
+// de áudio fica constante, não importa quantas teclas estejam soando.
+//
+// `WorkletVoices` faz o mesmo dentro de um AudioWorklet (voices-worklet.js),
+// com a síntese inteira no thread de áudio.
+const VOICE = { polyphony: 8, attack: 0.05, decay: 2.0, peak: 0.5, steal: 0.005 };
+
+Sonic.VoicePool = class {
+    constructor(ctx, destination, size = VOICE.polyphony) {
+        this.ctx = ctx;
+        this.voices = [];
+        for (let i = 0; i < size; i++) {
+            const osc = ctx.createOscillator();
+            const gain = ctx.createGain();
+            osc.type = 'triangle';
+            gain.gain.value = 0;
+            osc.connect(gain);
+            gain.connect(destination);
+            osc.start();
+            this.voices.push({ osc, gain, start: -Infinity, end: -Infinity });
+        }
+    }
+
+    active() {
+        const now = this.ctx.currentTime;
+        return this.voices.filter(v => v.end > now).length;
+    }
+
+    // Devolve (Promise) o instante, no relógio do AudioContext, em que a nota começa
+    noteOn(freq) {
+        const now = this.ctx.currentTime;
+        let voice = this.voices.find(v => v.end <= now);
+        let t = now;
+
+        if (voice) {
+            voice.gain.gain.cancelScheduledValues(now);
+            voice.gain.gain.setValueAtTime(0, now);
+        } else {
+            // Roubo de voz: a mais antiga desce a zero em `steal` segundos e recomeça
+            voice = this.voices.reduce((a, b) => (a.start <= b.start ? a : b));
+            const sg = voice.gain.gain;
+            sg.cancelScheduledValues(now);
+            sg.setValueAtTime(sg.value, now);
+            sg.linearRampToValueAtTime(0, now + VOICE.steal);
+            t = now + VOICE.steal;
+        }
+
+        const gain = voice.gain.gain;
+        voice.osc.frequency.setValueAtTime(freq, t);
+        gain.linearRampToValueAtTime(VOICE.peak, t + VOICE.attack);
+        gain.exponentialRampToValueAtTime(0.001, t + VOICE.decay);
+        gain.setValueAtTime(0, t + VOICE.decay);
+        voice.start = t;
+        voice.end = t + VOICE.decay;
+        return Promise.resolve(t);
+    }
+};
+
+Sonic.WorkletVoices = class {
+    static async create(ctx, destination, size = VOICE.polyphony) {
+        await Sonic.WorkletVoices.load(ctx);
+        return new Sonic.WorkletVoices(ctx, destination, size);
+    }
+
+    // O módulo é carregado uma vez por AudioContext
+    static load(ctx) {
+        if (!ctx._sonicVoices) ctx._sonicVoices = ctx.audioWorklet.addModule('voices-worklet.js');
+        return ctx._sonicVoices;
+    }
+
+    constructor(ctx, destination, size) {
+        this.ctx = ctx;
+        this.node = new AudioWorkletNode(ctx, 'sonic-voices', {
+            numberOfInputs: 0,
+            outputChannelCount: [1],
+            processorOptions: Object.assign({}, VOICE, { polyphony: size }),
+        });
+        this.node.connect(destination);
+        this.pending = new Map();
+        this.nextId = 0;
+        this.voices = 0;
+        this.node.port.onmessage = (e) => {
+            this.voices = e.data.active;
+            const resolve = this.pending.get(e.data.id);
+            this.pending.delete(e.data.id);
+            if (resolve) resolve(e.data.time);
+        };
+    }
+
+    active() {
+        return this.voices;
+    }
+
+    noteOn(freq) {
+        const id = this.nextId++;
+        return new Promise((resolve) => {
+            this.pending.set(id, resolve);
+            this.node.port.postMessage({ id, freq });
+        });
+    }
+};
+
+// Latência tecla -> som: do `timeStamp` do evento até a amostra sair na saída
+// (getOutputTimestamp converte o relógio de áudio para o de performance.now()).
+Sonic.onsetLatency = function (ctx, audioTime, eventTime) {
+    const ts = ctx.getOutputTimestamp ? ctx.getOutputTimestamp() : null;
+    if (!ts || !ts.performanceTime) {
+        return (audioTime - ctx.currentTime + (ctx.baseLatency || 0) + (ctx.outputLatency || 0)) * 1000
+            + (performance.now() - eventTime);
+    }
+    return ts.performanceTime + (audioTime - ts.contextTime) * 1000 - eventTime;
+};
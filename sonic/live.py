@@ -0,0 +1,32 @@
+"""Componente Streamlit persistente para as animações em canvas/WebAudio.
+
+`components.html` recria o iframe (e re-interpreta o JS) a cada rerun: a
+animação da página 1 voltava ao tempo zero e a página 6 ganhava um
+`AudioContext` novo a cada slider. Este componente é montado uma vez por
+`key`; nos reruns seguintes só chega uma mensagem com os parâmetros, e o JS
+aplica apenas o que mudou (ver `frontend/protocol.js`), mantendo o loop de
+desenho e o grafo de áudio vivos. O frontend é estático, em JS puro.
+"""
+import json
+import os
+
+import streamlit.components.v1 as components
+
+from sonic import metrics
+
+FRONTEND = os.path.join(os.path.dirname(__file__), "frontend")
+
+_component = components.declare_component("sonic_live", path=FRONTEND)
+
+
+def view(name, key, height, default=None, **params):
+    """Monta (ou atualiza) a visualização `name` de `frontend/`.
+
+    Devolve o último valor enviado pelo JS com `Sonic.setValue` (ou `default`).
+    """
+    # Os parâmetros vão como texto JSON: para um dict, o Streamlit testa se é um
+    # "dataframe" e com isso importa o pandas (~0,4 s) só para dizer que não é.
+    # A cada rerun os argumentos são reenviados inteiros (o JS filtra o que mudou).
+    payload = json.dumps(params)
+    metrics.sent("component", len(payload))
+    return _component(view=name, height=height, params=payload, key=key, default=default)
@@ -0,0 +1,284 @@
+"""Armazenamento da mídia de áudio do servidor: um objeto por conteúdo, URL estável.
+
+O armazenamento padrão do Streamlit guarda cada arquivo enquanto alguma
+sessão o referencia e o apaga no fim do rerun que deixa de mostrá-lo. O
+"Tocar Puro" da página 4 (sempre o mesmo tom de 100 Hz) voltava a ser
+registrado a cada clique, com uma URL que o navegador não reaproveita, e a
+RAM da mídia não tinha teto.
+
+`MediaStore` fica na frente desse armazenamento (só para `audio/*`):
+
+* o id é o hash dos bytes codificados: o mesmo clipe, de qualquer sessão, é
+  um objeto só, servido sempre em `/media/sonic-<hash>.wav`;
+* o arquivo continua guardado depois que nenhuma sessão o mostra, e a
+  resposta HTTP leva `Cache-Control: immutable` (o conteúdo de uma URL nunca
+  muda): um segundo clique nem chega ao servidor;
+* a RAM total tem teto (`SONIC_MEDIA_MB`, LRU). Sem `SONIC_MEDIA_SPILL_DIR`,
+  só saem os arquivos que nenhuma sessão mostra; com ele, os mais antigos vão
+  para o disco e voltam à RAM quando pedidos de novo.
+
+`install()` (chamado por `sonic.player`) coloca o `MediaStore` no runtime
+atual; imagens e downloads seguem no armazenamento original. Isso mexe em
+partes internas do Streamlit (`media_file_mgr._storage`, `MediaFileHandler`),
+testadas na versão fixada no `requirements.txt` (1.52). Se alguma delas não
+existir, `install()` avisa no log uma vez, devolve False e tudo segue no
+armazenamento padrão do Streamlit (sem URL estável nem teto de RAM).
+"""
+import hashlib
+import logging
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+try:
+    from streamlit.runtime.media_file_storage import MediaFileKind, MediaFileStorageError
+    from streamlit.runtime.memory_media_file_storage import MemoryFile, get_extension_for_mimetype
+except ImportError:  # Módulos internos mudaram de lugar: `install()` não troca nada
+    MemoryFile = None
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = int(os.environ.get("SONIC_MEDIA_MB", "128")) * 1024 * 1024
+SPILL_DIR = os.environ.get("SONIC_MEDIA_SPILL_DIR")
+PREFIX = "sonic-"
+# A URL é o hash do conteúdo: pode ficar no cache do navegador para sempre
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def content_id(data):
+    """Id (e nome na URL) de um arquivo de mídia: hash dos bytes."""
+    return PREFIX + hashlib.sha256(data).hexdigest()[:40]
+
+
+class MediaStore:
+    """`MediaFileStorage` endereçado por conteúdo, com teto de RAM e disco opcional."""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, spill_dir=SPILL_DIR):
+        self.inner = None  # Armazenamento original do Streamlit (tudo que não é áudio)
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self.media_endpoint = "/media"
+        self._ram = OrderedDict()  # id -> MemoryFile, do menos para o mais recente
+        self._disk = {}            # id -> (caminho, mimetype)
+        self._spilled = set()      # ids de `_disk` gravados por `_spill` (os do build não são nossos)
+        self._live = set()         # ids que alguma sessão mostra (o Streamlit ainda não apagou)
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.spills = 0
+
+    # --- protocolo MediaFileStorage ---
+    def load_and_get_id(self, path_or_data, mimetype, kind, filename=None):
+        if kind != MediaFileKind.MEDIA or not mimetype.startswith("audio/") or isinstance(path_or_data, str):
+            return self.inner.load_and_get_id(path_or_data, mimetype, kind, filename)
+
+        file_id = content_id(path_or_data)
+        with self._lock:
+            self._live.add(file_id)
+            if file_id in self._ram:
+                self._ram.move_to_end(file_id)
+                self.hits += 1
+            elif file_id in self._disk:
+                self.hits += 1
+                self._insert(file_id, MemoryFile(path_or_data, mimetype, kind, filename))
+            else:
+                self.misses += 1
+                self._insert(file_id, MemoryFile(path_or_data, mimetype, kind, filename))
+        return file_id
+
+    def get_file(self, filename):
+        file_id = os.path.splitext(filename)[0]
+        if not file_id.startswith(PREFIX):
+            return self.inner.get_file(filename)
+        with self._lock:
+            media_file = self._ram.get(file_id)
+            if media_file is not None:
+                self._ram.move_to_end(file_id)
+                return media_file
+            if file_id not in self._disk:
+                raise MediaFileStorageError(f"Bad filename '{filename}'. (No media file with id '{file_id}')")
+            path, mimetype = self._disk[file_id]
+
+        # Lê do disco fora do lock e devolve à RAM (o arquivo no disco fica: sair de novo é de graça)
+        try:
+            with open(path, "rb") as fp:
+                media_file = MemoryFile(fp.read(), mimetype, MediaFileKind.MEDIA, None)
+        except OSError as e:
+            raise MediaFileStorageError(f"Error opening '{path}'") from e
+        with self._lock:
+            if file_id not in self._ram:
+                self._insert(file_id, media_file)
+        return media_file
+
+    def get_url(self, file_id):
+        if not file_id.startswith(PREFIX):
+            return self.inner.get_url(file_id)
+        media_file = self.get_file(file_id)
+        return f"{self.media_endpoint}/{file_id}{get_extension_for_mimetype(media_file.mimetype)}"
+
+    def delete_file(self, file_id):
+        if not file_id.startswith(PREFIX):
+            return self.inner.delete_file(file_id)
+        # Nenhuma sessão mostra mais o arquivo: continua guardado, mas já pode sair da RAM
+        with self._lock:
+            self._live.discard(file_id)
+            self._evict()
+
+    def register(self, file_id, path, mimetype):
+        """Arquivo já no disco (ex.: clipes do build, ver `sonic.assets`), servido sob `file_id`."""
+        with self._lock:
+            self._disk.setdefault(file_id, (path, mimetype))
+
+    def get_stats(self):
+        return self.inner.get_stats() if self.inner is not None else []
+
+    # --- LRU ---
+    def _insert(self, file_id, media_file):
+        """Guarda na RAM e devolve o excesso ao teto. Chamar com o lock."""
+        self._ram[file_id] = media_file
+        self.nbytes += media_file.content_size
+        self._evict()
+
+    def _evict(self):
+        """Tira os mais antigos da RAM até caber no teto. Chamar com o lock."""
+        for file_id in list(self._ram):
+            if self.nbytes <= self.max_bytes:
+                break
+            if self.spill_dir:
+                self._spill(file_id, self._ram[file_id])
+            elif file_id in self._live:
+                continue  # Uma sessão ainda mostra: apagar daria 404 no player
+            self.nbytes -= self._ram.pop(file_id).content_size
+            self.evictions += 1
+
+    def _spill(self, file_id, media_file):
+        if file_id in self._disk:
+            return
+        os.makedirs(self.spill_dir, exist_ok=True)
+        path = os.path.join(self.spill_dir, file_id + get_extension_for_mimetype(media_file.mimetype))
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as fp:
+            fp.write(media_file.content)
+        os.replace(tmp, path)
+        self._disk[file_id] = (path, media_file.mimetype)
+        self._spilled.add(file_id)
+        self.spills += 1
+
+    def clear(self):
+        """Esquece tudo: RAM, arquivos vivos e disco (os arquivos do `_spill` são apagados).
+
+        Os arquivos do build (`register`) ficam no disco: o `sonic.assets`
+        os registra de novo no próximo pedido.
+        """
+        with self._lock:
+            spilled = [self._disk[file_id][0] for file_id in self._spilled]
+            self._ram.clear()
+            self._live.clear()
+            self._disk.clear()
+            self._spilled.clear()
+            self.nbytes = 0
+        for path in spilled:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "spills": self.spills,
+                "entries": len(self._ram),
+                "on_disk": len(self._disk),
+                "bytes": self.nbytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+# Uma instância por processo: sobrevive aos runtimes (o AppTest cria um por run)
+STORE = MediaStore()
+_install_lock = threading.Lock()
+_headers_patched = False
+_unsupported = None  # O que faltou no Streamlit instalado (avisado uma vez)
+
+
+def _patch_headers(handler):
+    global _headers_patched
+    if _headers_patched:
+        return
+    original = handler.set_extra_headers
+
+    def set_extra_headers(self, path):
+        original(self, path)
+        if path.startswith(PREFIX):
+            self.set_header("Cache-Control", CACHE_CONTROL)
+
+    handler.set_extra_headers = set_extra_headers
+    _headers_patched = True
+
+
+def _missing(manager, handler):
+    """Nome da peça interna do Streamlit que `install` troca e que não existe aqui, ou None."""
+    if MemoryFile is None:
+        return "streamlit.runtime.memory_media_file_storage.MemoryFile"
+    if not hasattr(manager, "_storage"):
+        return "MediaFileManager._storage"
+    if handler is not None:
+        for attr in ("initialize_storage", "set_extra_headers"):
+            if not callable(getattr(handler, attr, None)):
+                return f"MediaFileHandler.{attr}"
+    return None
+
+
+def _unsupported_version(missing):
+    global _unsupported
+    if _unsupported is None:
+        import streamlit
+
+        _LOGGER.warning(
+            "sonic.media: %s não existe no Streamlit %s (testado na 1.52); "
+            "áudio segue no armazenamento padrão do Streamlit",
+            missing, streamlit.__version__,
+        )
+        _unsupported = missing
+    return False
+
+
+def install():
+    """Põe o `STORE` na frente do armazenamento de mídia do runtime atual (idempotente).
+
+    Devolve True se o `STORE` está servindo a mídia (arquivos do build
+    incluídos); False fora de um runtime ou num Streamlit sem as peças
+    internas esperadas.
+    """
+    from streamlit import runtime
+
+    if _unsupported is not None or not runtime.exists():
+        return False
+    manager = runtime.get_instance().media_file_mgr
+    if getattr(manager, "_storage", None) is STORE:
+        return True
+    with _install_lock:
+        if manager._storage is STORE:
+            return True
+        # Com o servidor de verdade rodando, o handler HTTP de /media tem de ler do mesmo armazenamento
+        server = sys.modules.get("streamlit.web.server.media_file_handler")
+        handler = getattr(server, "MediaFileHandler", None) if server is not None else None
+        if server is not None and handler is None:
+            return _unsupported_version("streamlit.web.server.media_file_handler.MediaFileHandler")
+        missing = _missing(manager, handler)
+        if missing:
+            return _unsupported_version(missing)
+
+        STORE.inner = manager._storage
+        STORE.media_endpoint = getattr(STORE.inner, "_media_endpoint", STORE.media_endpoint)
+        manager._storage = STORE
+        if handler is not None and getattr(handler, "_storage", None) is STORE.inner:
+            handler.initialize_storage(STORE)
+            _patch_headers(handler)
+        return True
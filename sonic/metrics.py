@@ -0,0 +1,192 @@
+"""Instrumentação opcional por rerun: tempo por etapa e bytes enviados por elemento.
+
+Desligada por padrão (custo zero: `stage` devolve um contexto vazio e `timed`
+devolve a própria função). Com `SONIC_METRICS=1`:
+
+* cada página chama `begin(nome)` no topo e `finish()` no fim;
+* `stage("nome")` / `@timed("nome")` cronometram etapas (síntese, figuras...);
+* `sent("audio", n)` soma os bytes entregues ao navegador por tipo de elemento;
+* `finish()` mostra o painel de debug na sidebar e exporta: uma linha JSON por
+  rerun em `SONIC_METRICS_FILE` e os contadores acumulados do processo, no
+  formato texto do Prometheus, em `SONIC_METRICS_PROM` (para o textfile
+  collector do node_exporter).
+"""
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+
+ENABLED = os.environ.get("SONIC_METRICS", "0") != "0"
+JSONL_PATH = os.environ.get("SONIC_METRICS_FILE")
+PROM_PATH = os.environ.get("SONIC_METRICS_PROM")
+
+_current = contextvars.ContextVar("sonic_rerun", default=None)
+_lock = threading.Lock()
+_NULL = nullcontext()
+
+# Acumulado do processo: (página, etapa) -> [chamadas, segundos]; (página, elemento) -> bytes
+_stages = defaultdict(lambda: [0, 0.0])
+_bytes = defaultdict(int)
+_reruns = defaultdict(lambda: [0, 0.0])
+
+
+class Rerun:
+    def __init__(self, page):
+        self.page = page
+        self.start = time.perf_counter()
+        self.stages = defaultdict(lambda: [0, 0.0])
+        self.bytes = defaultdict(int)
+
+    def record(self):
+        return {
+            "ts": time.time(),
+            "page": self.page,
+            "seconds": time.perf_counter() - self.start,
+            "stages": {k: {"calls": n, "seconds": s} for k, (n, s) in self.stages.items()},
+            "bytes": dict(self.bytes),
+        }
+
+
+def begin(page):
+    if ENABLED:
+        _current.set(Rerun(page))
+
+
+@contextmanager
+def _timer(run, name):
+    t = time.perf_counter()
+    try:
+        yield
+    finally:
+        entry = run.stages[name]
+        entry[0] += 1
+        entry[1] += time.perf_counter() - t
+
+
+def stage(name):
+    """Contexto que cronometra `name` no rerun atual (nada, se desligado)."""
+    run = _current.get() if ENABLED else None
+    return _timer(run, name) if run is not None else _NULL
+
+
+def timed(name):
+    """Decorador: cada chamada da função conta como a etapa `name`."""
+    def wrap(fn):
+        if not ENABLED:
+            return fn
+
+        @functools.wraps(fn)
+        def inner(*args, **kwargs):
+            with stage(name):
+                return fn(*args, **kwargs)
+        return inner
+    return wrap
+
+
+def sent(element, nbytes):
+    run = _current.get() if ENABLED else None
+    if run is not None:
+        run.bytes[element] += nbytes
+
+
+def finish():
+    """Fecha o rerun: acumula, exporta e desenha o painel na sidebar."""
+    run = _current.get() if ENABLED else None
+    if run is None:
+        return
+    _current.set(None)
+    rec = run.record()
+
+    with _lock:
+        for name, (n, s) in run.stages.items():
+            entry = _stages[(run.page, name)]
+            entry[0] += n
+            entry[1] += s
+        for element, n in run.bytes.items():
+            _bytes[(run.page, element)] += n
+        entry = _reruns[run.page]
+        entry[0] += 1
+        entry[1] += rec["seconds"]
+        if JSONL_PATH:
+            with open(JSONL_PATH, "a") as fp:
+                fp.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        if PROM_PATH:
+            # Escrita atômica: o coletor nunca lê um arquivo pela metade
+            tmp = PROM_PATH + ".tmp"
+            with open(tmp, "w") as fp:
+                fp.write(_prometheus())
+            os.replace(tmp, PROM_PATH)
+
+    _panel(rec)
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _prometheus():
+    from sonic import audio_cache, figure_cache, media
+
+    lines = [
+        "# HELP sonic_reruns_total Reruns por página.",
+        "# TYPE sonic_reruns_total counter",
+    ]
+    lines += [f'sonic_reruns_total{{page="{_label(p)}"}} {n}' for p, (n, _) in _reruns.items()]
+    lines += [
+        "# HELP sonic_rerun_seconds_total Tempo total de script por página.",
+        "# TYPE sonic_rerun_seconds_total counter",
+    ]
+    lines += [f'sonic_rerun_seconds_total{{page="{_label(p)}"}} {s:.6f}' for p, (_, s) in _reruns.items()]
+    lines += [
+        "# HELP sonic_stage_calls_total Chamadas de cada etapa.",
+        "# TYPE sonic_stage_calls_total counter",
+    ]
+    lines += [f'sonic_stage_calls_total{{page="{_label(p)}",stage="{_label(k)}"}} {n}' for (p, k), (n, _) in _stages.items()]
+    lines += [
+        "# HELP sonic_stage_seconds_total Tempo acumulado de cada etapa.",
+        "# TYPE sonic_stage_seconds_total counter",
+    ]
+    lines += [f'sonic_stage_seconds_total{{page="{_label(p)}",stage="{_label(k)}"}} {s:.6f}' for (p, k), (_, s) in _stages.items()]
+    lines += [
+        "# HELP sonic_bytes_sent_total Bytes entregues ao navegador por tipo de elemento.",
+        "# TYPE sonic_bytes_sent_total counter",
+    ]
+    lines += [f'sonic_bytes_sent_total{{page="{_label(p)}",element="{_label(e)}"}} {n}' for (p, e), n in _bytes.items()]
+
+    lines += [
+        "# HELP sonic_cache_bytes Bytes guardados em cada cache.",
+        "# TYPE sonic_cache_bytes gauge",
+    ]
+    caches = {
+        "audio": audio_cache.CACHE.stats(), "figure": figure_cache.CACHE.stats(), "media": media.STORE.stats()
+    }
+    lines += [f'sonic_cache_bytes{{cache="{c}"}} {s["bytes"]}' for c, s in caches.items()]
+    for field in ("hits", "misses", "evictions"):
+        lines += [f"# TYPE sonic_cache_{field}_total counter"]
+        lines += [f'sonic_cache_{field}_total{{cache="{c}"}} {s[field]}' for c, s in caches.items()]
+    return "\n".join(lines) + "\n"
+
+
+def _panel(rec):
+    import streamlit as st
+
+    with st.sidebar.expander("🐞 Desempenho deste rerun"):
+        st.metric("Script", f"{rec['seconds'] * 1e3:.1f} ms")
+        if rec["stages"]:
+            st.dataframe(
+                {
+                    "Etapa": list(rec["stages"]),
+                    "Chamadas": [v["calls"] for v in rec["stages"].values()],
+                    "ms": [round(v["seconds"] * 1e3, 2) for v in rec["stages"].values()],
+                },
+                hide_index=True,
+            )
+        if rec["bytes"]:
+            st.dataframe(
+                {"Elemento": list(rec["bytes"]), "KB": [round(n / 1024, 1) for n in rec["bytes"].values()]},
+                hide_index=True,
+            )
@@ -0,0 +1,78 @@
+"""Banco de osciladores recursivo (rotação de fasor complexo).
+
+Cada parcial é um fasor z = e^{iφ}. Dentro de um bloco de B amostras,
+sin(φ + θk) = Im(z · e^{iθk}) = Re(z)·sin(θk) + Im(z)·cos(θk), e as tabelas
+sin(θk)/cos(θk) (parciais × B) são calculadas uma única vez por clipe. Cada
+bloco vira então dois produtos matriz-vetor, sem nenhum `sin` por amostra.
+Entre blocos o fasor gira por e^{iθB} (calculado direto, em float64) e é
+renormalizado para |z| = 1, o que mantém o oscilador estável por horas.
+"""
+import numpy as np
+
+DTYPE = np.float32
+
+
+class PhasorBank:
+    def __init__(self, freqs, amps, sr, block):
+        self.amps = np.asarray(amps, dtype=np.float64)
+        self.inc = np.asarray(freqs, dtype=np.float64) / sr  # ciclos por amostra
+        self.block = block
+        theta = 2 * np.pi * np.outer(self.inc, np.arange(block)) % (2 * np.pi)
+        self._sin = np.sin(theta).astype(DTYPE)
+        self._cos = np.cos(theta).astype(DTYPE)
+        self._step = np.exp(2j * np.pi * self.inc * block)
+        self.seek(0)
+
+    def seek(self, start):
+        # Fase absoluta direto do índice (usado no início ou em saltos)
+        self._z = np.exp(2j * np.pi * ((self.inc * start) % 1.0))
+        self._next = start
+
+    def __call__(self, start, stop):
+        n = stop - start
+        if n > self.block:
+            raise ValueError(f"bloco de {n} amostras maior que a tabela ({self.block})")
+        if start != self._next:
+            self.seek(start)
+
+        re = (self.amps * self._z.real).astype(DTYPE)
+        im = (self.amps * self._z.imag).astype(DTYPE)
+        out = re @ self._sin[:, :n]
+        out += im @ self._cos[:, :n]
+
+        if n == self.block:
+            self._z *= self._step
+            self._z /= np.abs(self._z)  # Renormaliza: sem deriva de amplitude
+            self._next = stop
+        else:
+            self.seek(stop)
+        return out
+
+
+def accuracy(freqs, seconds, sr, block):
+    """Pior erro do banco contra `np.sin` em float64.
+
+    Devolve (erro de amplitude em dB relativo à amplitude, erro de frequência
+    em cents medido pela deriva de fase no fim do clipe).
+    """
+    n = int(seconds * sr)
+    worst_db, worst_cents = 0.0, 0.0
+    for f in np.asarray(freqs, dtype=np.float64):
+        bank = PhasorBank([f], [1.0], sr, block)
+        err = 0.0
+        for start in range(0, n, block):
+            stop = min(start + block, n)
+            ref = np.sin(2 * np.pi * ((f / sr * np.arange(start, stop)) % 1.0))
+            err = max(err, float(np.max(np.abs(bank(start, stop) - ref))))
+        worst_db = max(worst_db, 20 * np.log10(1 + err))
+
+        # Deriva de fase acumulada até o último bloco completo
+        last = (n // block) * block
+        if last:
+            bank.seek(0)
+            for start in range(0, last, block):
+                bank(start, start + block)
+            drift = abs(float(np.angle(bank._z[0] * np.exp(-2j * np.pi * ((f / sr * last) % 1.0)))))
+            rel = drift / (2 * np.pi * f * last / sr)
+            worst_cents = max(worst_cents, 1200 * np.log2(1 + rel))
+    return worst_db, worst_cents
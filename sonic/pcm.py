@@ -0,0 +1,89 @@
+"""Ponto único de quantização: float32 → int16 (com dither TPDF opcional) → WAV.
+
+Toda a síntese roda em float32; só aqui, imediatamente antes da entrega,
+o sinal vira PCM de 16 bits.
+"""
+import io
+import wave
+
+import numpy as np
+
+FULL_SCALE = 32767
+
+
+def quantize(samples, dither=True, rng=None, scale=None):
+    """Converte para int16, normalizando pelo pico (como o `st.audio` faz com arrays).
+
+    Trabalha em cima do próprio buffer (in-place) para não copiar o clipe de novo.
+    O dither TPDF (soma de dois ruídos uniformes de ±½ LSB) troca a distorção
+    de quantização por um chiado branco ~-96 dBFS, inaudível. Com `scale`
+    fixo (renderização em blocos) o pico não é medido.
+    """
+    samples = np.asarray(samples, dtype=np.float32)
+    if scale is None:
+        peak = np.max(np.abs(samples)) if samples.size else 0
+        scale = FULL_SCALE / peak if peak > 0 else 1.0
+    samples *= scale
+    if dither:
+        rng = rng if rng is not None else np.random.default_rng(0)
+        samples += rng.random(samples.size, dtype=np.float32)
+        samples -= rng.random(samples.size, dtype=np.float32)
+    np.rint(samples, out=samples)
+    np.clip(samples, -FULL_SCALE - 1, FULL_SCALE, out=samples)
+    return samples.astype(np.int16)
+
+
+def to_wav(pcm, sr):
+    with io.BytesIO() as fp:
+        with wave.open(fp, mode="wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(sr)
+            wav.writeframes(pcm.tobytes())
+        return fp.getvalue()
+
+
+def encode(samples, sr, dither=True):
+    return to_wav(quantize(samples, dither), sr)
+
+
+class WavSink:
+    """Recebe blocos float32 e escreve WAV int16 em `fp` à medida que chegam.
+
+    O número de amostras é declarado no cabeçalho de antemão, então `fp`
+    não precisa ser "seekable" (arquivo, socket, resposta HTTP...). O ganho
+    é fixo (`peak` = limite superior do sinal), já que o pico real só seria
+    conhecido no fim.
+    """
+
+    def __init__(self, fp, sr, nframes, peak, dither=True):
+        self._wav = wave.open(fp, mode="wb")
+        self._wav.setnchannels(1)
+        self._wav.setsampwidth(2)
+        self._wav.setframerate(sr)
+        self._wav.setnframes(nframes)
+        self.scale = FULL_SCALE / peak if peak > 0 else 1.0
+        self.dither = dither
+        self._rng = np.random.default_rng(0)
+
+    def write(self, block):
+        pcm = quantize(block, self.dither, self._rng, self.scale)
+        self._wav.writeframesraw(pcm.tobytes())
+
+    def close(self):
+        self._wav.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def encode_stream(blocks, sr, nframes, peak, dither=True):
+    """Monta o WAV final a partir de blocos, sem nunca ter o sinal float inteiro na memória."""
+    with io.BytesIO() as fp:
+        with WavSink(fp, sr, nframes, peak, dither) as sink:
+            for block in blocks:
+                sink.write(block)
+        return fp.getvalue()
@@ -0,0 +1,66 @@
+"""Entrega dos clipes de áudio: WAV do servidor ou síntese no navegador.
+
+Por padrão (`SONIC_AUDIO=server`) o clipe é sintetizado em NumPy, vira WAV
+(`sonic.audio_cache`) e vai para o `st.audio`. Com `SONIC_AUDIO=client`, o
+servidor manda só a especificação (vozes, timbres, envelope: algumas
+centenas de bytes) para a visualização `synth` de `frontend/`, que faz a
+mesma conta em JS e toca num `<audio>` igual ao do `st.audio`. Aí o custo
+de síntese do servidor e os bytes de áudio caem a zero. O caminho do
+servidor continua sendo a referência (`python -m bench.client_audio`).
+
+No modo servidor, o WAV é entregue pelo `sonic.media` (um arquivo por
+conteúdo, com URL estável e cache no navegador); os clipes que o build já
+renderizou (`sonic.assets`) vão direto como URL.
+"""
+import os
+
+import streamlit as st
+
+from sonic import assets, audio_cache, live, media, synth, wavetable
+
+MODE = os.environ.get("SONIC_AUDIO", "server")
+HEIGHT = 60
+
+
+def enabled():
+    return MODE == "client"
+
+
+def spec(clip):
+    """Especificação JSON do clipe, com tudo o que o JS precisa para reproduzir o `render`."""
+    # Clipes longos vão em blocos com ganho fixo pelo limite de pico (ver audio_cache.encode)
+    streamed = synth.frames(clip) > audio_cache.STREAM_SECONDS * clip.sr
+    timbres = sorted({v.timbre for v in clip.voices})
+    return {
+        "sr": int(clip.sr),
+        "duration": float(clip.duration),
+        "sequence": clip.sequence,
+        "attack": clip.envelope.attack,
+        "release": clip.envelope.release,
+        "bound": synth.peak_bound(clip) if streamed else None,
+        "timbres": {name: [[p.ratio, p.amp] for p in synth.TIMBRES[name]] for name in timbres},
+        # `base`: frequência que decide quais parciais cabem abaixo de Nyquist
+        # (na wavetable é o topo da oitava da nota, não a nota)
+        "voices": [
+            {
+                # float(): as páginas às vezes passam escalares do NumPy, que o json recusa
+                "freq": float(v.freq),
+                "timbre": v.timbre,
+                "gain": float(v.gain),
+                "base": float(wavetable.level_top(v.freq) if clip.oscillator == "wavetable" else v.freq),
+            }
+            for v in clip.voices
+        ],
+    }
+
+
+def audio(clip, key=None):
+    """Mostra um player para `clip`, como `st.audio(audio_cache.wav(clip))`."""
+    if enabled():
+        # Um player por som diferente, como um `st.audio` novo
+        live.view("synth", key=key or f"synth-{audio_cache.clip_key(clip)[:16]}", height=HEIGHT, spec=spec(clip))
+    elif url := assets.audio_url(clip):
+        st.audio(url, format="audio/wav")  # Renderizado no build: nada a fazer aqui
+    else:
+        media.install()  # Mesmo clipe = mesmo arquivo e mesma URL, para todas as sessões
+        st.audio(audio_cache.wav(clip), format="audio/wav")
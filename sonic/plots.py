@@ -0,0 +1,217 @@
+"""Figuras matplotlib das páginas que dependem só de poucos parâmetros.
+
+Cada função recebe apenas os parâmetros que mudam o desenho e devolve a
+figura; quem transforma em PNG/SVG (e guarda o resultado) é o
+`sonic.figure_cache`. As figuras são criadas direto pela API orientada a
+objetos (`Figure`), sem o pyplot: nada fica registrado no estado global, e a
+figura é liberada assim que sai de escopo. `GRID` lista todos os valores possíveis de cada uma,
+para o pré-aquecimento.
+"""
+import matplotlib.patches as patches
+import numpy as np
+from matplotlib.figure import Figure
+
+from sonic import tuning
+
+# Página 1 ("No Violão"): casa -> (harmônico, posição do nó na corda)
+GUITAR_NODES = {"12ª": (2, 0.5), "7ª": (3, 0.333), "5ª": (4, 0.25), "9ª": (5, 0.4), "4ª": (5, 0.2), "3ª": (6, 0.166)}
+
+
+# =========================================
+# PÁGINA 1: SÉRIE HARMÔNICA
+# =========================================
+def string_modes():
+    # Como a corda se divide? (H1 a H4)
+    fig_theory = Figure(figsize=(10, 8))
+    axs = fig_theory.subplots(4, 1)
+    fig_theory.patch.set_facecolor('#0e1117')
+    fig_theory.subplots_adjust(hspace=0.6)
+
+    for i in range(4):
+        h = i + 1
+        x_t = np.linspace(0, 1, 400)
+        y_t = np.sin(h * np.pi * x_t)
+
+        ax = axs[i]
+        ax.set_facecolor('#0e1117')
+        ax.set_title(f"H{h} (Frequência = {h}x) - Divide a corda em {h} partes", color='white', fontsize=12, pad=10)
+        ax.plot(x_t, y_t, color='#4CAF50', lw=2)
+        ax.plot(x_t, -y_t, color='#4CAF50', lw=2, alpha=0.3, ls='--')
+        ax.axis('off')
+
+        nodes = np.linspace(0, 1, h+1)
+        ax.scatter(nodes, np.zeros_like(nodes), color='white', s=30, zorder=5)
+    return fig_theory
+
+
+def guitar_string(h_val, finger_pos):
+    fig = Figure(figsize=(12, 3), dpi=100)
+    ax = fig.subplots()
+    fig.patch.set_facecolor('#222'); ax.set_facecolor('#222')
+
+    x_v = np.linspace(0, 1, 800)
+    y_v = np.sin(h_val * np.pi * x_v)
+
+    ax.axhline(0, color='#666', lw=1)
+    ax.plot(x_v, y_v, color='#00ff00', lw=2.5, label='Vibração')
+    ax.plot(x_v, -y_v, color='#00ff00', lw=2.5, alpha=0.3, ls='--')
+
+    for i in range(1, 13):
+        fret_pos = 1 - (1 / (2 ** (i / 12)))
+        ax.axvline(fret_pos, color='#444', lw=1.5, zorder=1)
+        ax.text(fret_pos, -1.3, str(i), color='#888', ha='center', fontsize=9, fontweight='bold')
+    ax.axvline(0, color='#888', lw=3)
+
+    ax.scatter([finger_pos], [0], s=250, color='white', edgecolor='red', lw=2, zorder=10)
+    ax.text(finger_pos, 0.7, "👇 Dedo aqui", color='white', ha='center', fontweight='bold', fontsize=10)
+
+    ax.axis('off'); ax.set_ylim(-1.4, 1.4); ax.set_xlim(-0.02, 1.02)
+    return fig
+
+
+# =========================================
+# PÁGINA 3: GEOMETRIA MUSICAL
+# =========================================
+def circle_of_fifths(passos):
+    # Configuração do Gráfico Polar
+    fig = Figure(figsize=(8, 8))
+    ax = fig.subplots(subplot_kw={'projection': 'polar'})
+    fig.patch.set_facecolor('#0e1117')
+    ax.set_facecolor('#0e1117')
+
+    # Notas Cromáticas (Posições fixas no círculo)
+    angles = np.linspace(0, 2*np.pi, 12, endpoint=False)
+
+    # Plota os pontos base (As 12 notas possíveis)
+    ax.scatter(angles, [1]*12, color='#333', s=100, zorder=1)
+
+    # Adiciona rótulos
+    for ang, note in zip(angles, tuning.NOTE_NAMES):
+        ax.text(ang, 1.15, note, color='white', ha='center', va='center', fontweight='bold', fontsize=12)
+
+    # A cada passo, somamos 7 semitons (Uma Quinta Justa), na ordem de geração
+    visited_indices = tuning.stack_fifths(passos)
+    path_angles = [angles[i] for i in visited_indices]
+    path_radii = [1.0] * len(visited_indices)
+
+    # Desenhar as LINHAS de conexão (A Geometria)
+    if passos > 1:
+        ax.plot(path_angles, path_radii, color='#FFC107', linewidth=2, linestyle='-', marker='o', markersize=8, zorder=10)
+
+        # Se for 12, fecha o círculo visualmente
+        if passos == 12:
+            ax.plot([path_angles[-1], path_angles[0]], [1, 1], color='#FFC107', linewidth=2)
+
+    # Destacar as notas ativas (tocadas)
+    ax.scatter(path_angles, path_radii, color='#4CAF50', s=250, zorder=20, edgecolors='white')
+
+    ax.set_ylim(0, 1.2)
+    ax.axis('off')
+    return fig
+
+
+# =========================================
+# PÁGINA 4: COMA PITAGÓRICO
+# =========================================
+def comma_spiral(passos):
+    # Gráfico Polar (Estilo Radar)
+    fig = Figure(figsize=(8, 8))
+    ax = fig.subplots(subplot_kw={'projection': 'polar'})
+    fig.patch.set_facecolor('#0e1117')
+    ax.set_facecolor('#0e1117')
+
+    # Ângulo de uma Quinta Justa (Pura): log2(1.5) da oitava, em radianos
+    quinta_pura_rad = np.log2(1.5) * 2 * np.pi
+
+    angles_nat = [0]
+    radii_nat = [1.5]
+    for i in range(passos):
+        angles_nat.append(angles_nat[-1] + quinta_pura_rad)
+        radii_nat.append(1.5 + (i * 0.1))
+
+    # 1. Alvo (Verde) - Sempre no topo
+    ax.plot([0, 0], [0, radii_nat[-1]+0.5], color='#4CAF50', linestyle='--', linewidth=2, label='Alvo (Oitava Perfeita)')
+    ax.text(0, radii_nat[-1]+0.6, "DÓ\n(Puro)", color='#4CAF50', ha='center', fontweight='bold')
+
+    # 2. Caminho Natural (Vermelho/Azul)
+    ax.plot(angles_nat, radii_nat, color='#e74c3c', marker='o', linewidth=1.5, label='Pitagórico (Natural)')
+
+    # Lógica de Fechamento
+    if passos > 0:
+        final_angle_nat = angles_nat[-1] % (2*np.pi)
+
+        # Linha Vermelha (Onde chegamos no natural)
+        ax.plot([0, final_angle_nat], [0, radii_nat[-1]], color='#e74c3c', linewidth=3)
+
+        if passos == 12:
+            # Preenche o ERRO
+            theta = np.linspace(0, final_angle_nat, 50)
+            ax.fill_between(theta, 0, radii_nat[-1], color='#e74c3c', alpha=0.3)
+            ax.text(final_angle_nat, radii_nat[-1]+0.2, "COMA\n(O Excesso)", color='#e74c3c', fontweight='bold')
+
+            # Marca o acerto do temperado
+            ax.text(0.1, radii_nat[-1]-0.5, "Temperado\nfecha aqui!", color='white', fontsize=8, alpha=0.7)
+
+    ax.set_rticks([])
+    ax.set_xticks([])
+    ax.grid(False)
+    ax.legend(loc='lower right', facecolor='#222', labelcolor='white')
+    return fig
+
+
+# =========================================
+# PÁGINA 5: INTERVALO DO LOBO
+# =========================================
+def draw_piano(wolf):
+    # `wolf`: o sistema ainda tem o Lobo (Pitagórico/Mesotônico)? No Temperado, não.
+    fig = Figure(figsize=(10, 3))
+    ax = fig.subplots()
+    fig.patch.set_facecolor('#0e1117')
+    ax.set_facecolor('#0e1117')
+
+    # Teclas Brancas
+    for i in range(8):
+        rect = patches.Rectangle((i, 0), 1, 1, facecolor='white', edgecolor='black')
+        ax.add_patch(rect)
+        ax.text(i+0.5, 0.1, "CDEFGABC"[i], ha='center')
+
+    # Teclas Pretas e Destaques
+    black_pos = [1, 2, 4, 5, 6] # C#, D#, F#, G#, A#
+    labels = ["C#", "D#/Eb", "F#", "G#", "A#"]
+
+    for i, pos in enumerate(black_pos):
+        lbl = labels[i]
+        danger = wolf and (lbl == "G#" or "D#" in lbl)
+        color = '#800000' if danger else 'black' # Vermelho escuro (Perigo)
+
+        rect = patches.Rectangle((pos-0.3, 0.4), 0.6, 0.6, facecolor=color, edgecolor='black', zorder=2)
+        ax.add_patch(rect)
+
+        # Ícones
+        if danger:
+            ax.text(pos, 0.5, "🐺", ha='center', va='center', fontsize=12, zorder=3)
+
+    # Conexão do Lobo
+    if wolf:
+        ax.annotate("", xy=(2, 0.9), xytext=(5, 0.9), arrowprops=dict(arrowstyle="<->", color='red', lw=2))
+        ax.text(3.5, 0.95, "INTERVALO DO LOBO\n(G# a Eb)", ha='center', color='red', fontweight='bold', backgroundcolor='#0e1117')
+
+    ax.set_xlim(0, 8); ax.set_ylim(0, 1.3); ax.axis('off')
+    return fig
+
+
+BUILDERS = {
+    "string_modes": string_modes,
+    "guitar_string": guitar_string,
+    "circle_of_fifths": circle_of_fifths,
+    "comma_spiral": comma_spiral,
+    "draw_piano": draw_piano,
+}
+
+GRID = {
+    "string_modes": [()],
+    "guitar_string": sorted(set(GUITAR_NODES.values())),
+    "circle_of_fifths": [(p,) for p in range(1, 13)],
+    "comma_spiral": [(p,) for p in range(1, 13)],
+    "draw_piano": [(True,), (False,)],
+}
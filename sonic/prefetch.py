@@ -0,0 +1,148 @@
+"""Pré-renderização em segundo plano para o jogo de afinação (página 9).
+
+A mistura tocada na página 9 é a soma de duas vozes: a do alvo (sorteado) e a
+do slider do aluno. Como a síntese é linear, cada voz ("lado") é renderizada
+sozinha, sem envelope, e guardada (`SIDES`); tocar a mistura vira somar dois
+lados prontos, aplicar o envelope e codificar (`ready`). O slider anda em
+passos de 0,5 Hz, então o lado do aluno se repete muito entre cliques.
+
+Os lados são renderizados por um pool de threads fora da thread do script
+(`warm`): a página pede, a cada rerun, o lado do alvo, o do valor atual do
+slider e os vizinhos, e o clique em "Tocar" encontra tudo pronto. `Bank`
+mantém, por nível, os próximos alvos já sorteados e com o lado renderizado,
+para o "Novo Desafio" também começar pronto.
+
+A soma dos lados é a mesma conta do `synth.render` (mesma ordem de somas em
+float32), então o WAV sai igual ao renderizado de uma vez. No modo cliente
+(`SONIC_AUDIO=client`) quem sintetiza é o navegador: aqui nada é feito.
+"""
+import os
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+import numpy as np
+
+from sonic import audio_cache, metrics, pcm, player, synth
+from sonic.cache import BytesLRU
+
+WORKERS = int(os.environ.get("SONIC_PREFETCH_WORKERS", "1"))
+DEFAULT_MAX_BYTES = int(os.environ.get("SONIC_SIDE_CACHE_MB", "32")) * 1024 * 1024
+BANK_SIZE = 3  # Alvos já preparados por nível
+
+# Lados renderizados (float32 em bytes, sem envelope), por chave do clipe de uma voz só
+SIDES = BytesLRU(DEFAULT_MAX_BYTES)
+_pool = ThreadPoolExecutor(WORKERS, thread_name_prefix="sonic-prefetch")
+_pending = {}  # chave -> Future do lado em renderização
+_lock = threading.Lock()
+
+
+def _side_clip(clip, voice):
+    # Uma voz, sem envelope nem normalização: o que é comum a todas as misturas com ela
+    return replace(clip, voices=(voice,), envelope=synth.Envelope(), peak=None, sequence=False)
+
+
+def _render_side(key, side):
+    try:
+        data = synth.render(side).tobytes()
+        SIDES.put(key, data)
+        return data
+    finally:
+        with _lock:
+            _pending.pop(key, None)
+
+
+def _submit(side):
+    """Future (ou bytes, se já pronto) do lado `side`, agendando a renderização se preciso."""
+    key = audio_cache.clip_key(side)
+    with _lock:
+        if key in _pending:
+            return _pending[key]
+        if key in SIDES:
+            return None
+        future = _pending[key] = _pool.submit(_render_side, key, side)
+        return future
+
+
+def warm(*clips):
+    """Agenda no pool os lados de `clips` que ainda não estão prontos (não bloqueia)."""
+    if player.enabled():
+        return
+    for clip in clips:
+        for voice in clip.voices:
+            _submit(_side_clip(clip, voice))
+
+
+def side(clip, voice):
+    """Amostras do lado `voice` de `clip`: do cache, esperando o pool, ou renderizadas aqui."""
+    s = _side_clip(clip, voice)
+    key = audio_cache.clip_key(s)
+    data = SIDES.get_or_create(key, lambda: _wait_or_render(key, s))
+    return np.frombuffer(data, dtype=synth.DTYPE)
+
+
+def _wait_or_render(key, s):
+    with _lock:
+        future = _pending.get(key)
+    if future is not None:
+        return future.result()
+    return synth.render(s).tobytes()
+
+
+def _assemble(clip):
+    # Mesma sequência de operações do synth.render: soma das vozes, envelope, pico
+    out = np.zeros(synth.frames(clip), dtype=synth.DTYPE)
+    for voice in clip.voices:
+        out += side(clip, voice)
+    env = clip.envelope.segment(0, out.size, out.size, clip.sr)
+    if env is not None:
+        out *= env
+    if clip.peak is not None and out.size:
+        max_val = np.max(np.abs(out))
+        if max_val > 0:
+            out *= clip.peak / max_val
+    return pcm.encode(out, clip.sr, audio_cache.DITHER)
+
+
+def ready(clip):
+    """Deixa o WAV de `clip` no cache de áudio (montado dos lados) e devolve o clipe.
+
+    Só para misturas simultâneas (`sequence=False`); o `player.audio(clip)`
+    seguinte acha o WAV pronto.
+    """
+    if player.enabled():
+        return clip
+    with metrics.stage("audio.mix"):
+        audio_cache.CACHE.get_or_create(audio_cache.clip_key(clip), lambda: _assemble(clip))
+    return clip
+
+
+class Bank:
+    """Próximos alvos sorteados por nível, com o lado do alvo já em renderização."""
+
+    def __init__(self, low, high, size=BANK_SIZE):
+        self.low = low
+        self.high = high
+        self.size = size
+        self._queues = defaultdict(deque)
+        self._rng = np.random.default_rng()
+        self._lock = threading.Lock()
+
+    def next(self, level, clip_for):
+        """Tira o próximo alvo (Hz, inteiro em [low, high)) do nível `level` e repõe o banco.
+
+        `clip_for(alvo)` monta a mistura do nível com esse alvo (o lado do aluno
+        pode ser qualquer um: só o do alvo importa aqui).
+        """
+        with self._lock:
+            queue = self._queues[level]
+            while len(queue) <= self.size:
+                target = int(self._rng.integers(self.low, self.high))
+                queue.append(target)
+                warm(clip_for(target))
+            return queue.popleft()
+
+
+# Página 9: alvo inteiro sorteado em [430, 450) Hz
+TARGETS = Bank(430, 450)
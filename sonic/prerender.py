@@ -0,0 +1,116 @@
+"""Build: renderiza uma vez todos os clipes e figuras de parâmetros finitos.
+
+    python -m sonic.prerender [--out static] [--workers 4]
+
+As páginas têm espaços de parâmetros pequenos: 12 passos (páginas 3 e 4),
+3 afinações × 2 acordes (página 5), 12 raízes × 4 oitavas × 7 tipos (página
+7) e a grade fixa de figuras (`plots.GRID`). Tudo é renderizado num pool de
+processos e gravado em `static/` (`audio/<chave>.wav`, `figures/*.png`) com o
+`manifest.json` que o `sonic.assets` consulta em tempo de execução.
+
+Os clipes saem das mesmas funções que os botões das páginas chamam
+(`sonic.clips`), e o WAV é o do `audio_cache.encode`: a chave e os bytes batem
+com o que a página geraria na hora. Drones acima de `audio_cache.STREAM_SECONDS` (30 s e 60 s) não entram:
+seriam dezenas de MB de imagem para o caminho menos usado, e já saem em
+blocos com memória constante.
+"""
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from sonic import assets, audio_cache, tuning
+from sonic import clips as page_clips
+
+
+def clips():
+    """Todos os clipes de parâmetros finitos das páginas, como as páginas os montam."""
+    durations = [d for d in page_clips.DURATIONS if d <= audio_cache.STREAM_SECONDS]
+
+    found = []
+    for passos in page_clips.FIFTH_STEPS:
+        # Página 3: a escala gerada por `passos` quintas; página 4: os cinco botões
+        found.append(page_clips.fifths_scale(passos))
+        for d in durations:
+            for freqs in page_clips.comma_tones(passos):
+                found.append(page_clips.tone(*freqs, duration=d))
+
+    # Página 5: só o nome da afinação importa para `wolf_freqs`
+    for era in page_clips.WOLF_SYSTEMS:
+        for wolf in [False, True]:
+            for d in durations:
+                found.append(page_clips.wolf_chord(wolf, era, d))
+
+    # Página 7
+    for root in tuning.NOTE_NAMES:
+        for octave in page_clips.CHORD_OCTAVES:
+            for intervals in page_clips.CHORD_TYPES.values():
+                found.append(page_clips.chord(page_clips.chord_notes(root, octave, intervals)[0]))
+
+    # Chave por conteúdo: a página 4 repete o Dó puro em todos os passos
+    return list({audio_cache.clip_key(c): c for c in found}.items())
+
+
+def figures(fmt="png"):
+    from sonic import plots
+
+    return [(name, args, fmt) for name, grid in plots.GRID.items() for args in grid]
+
+
+def _write(out, relpath, data):
+    path = os.path.join(out, relpath)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as fp:
+        fp.write(data)
+
+
+def render_clip(out, key, clip):
+    from sonic import media
+
+    data = audio_cache.encode(clip)
+    relpath = f"audio/{key[:32]}.wav"
+    _write(out, relpath, data)
+    return key, {"file": relpath, "id": media.content_id(data), "bytes": len(data)}
+
+
+def render_figure(out, name, args, fmt):
+    from sonic import figure_cache
+
+    data = figure_cache._draw(name, args, fmt)
+    digest = hashlib.sha256(data).hexdigest()[:16]
+    relpath = f"figures/{name}-{digest}.{fmt}"
+    _write(out, relpath, data)
+    return assets.figure_key(name, args, fmt), {"file": relpath, "v": digest, "bytes": len(data)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default=assets.STATIC_DIR, help="pasta de saída (a `static/` do app)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="processos do pool")
+    opts = parser.parse_args()
+
+    start = time.perf_counter()
+    manifest = {"version": assets.VERSION, "audio": {}, "figures": {}}
+    with ProcessPoolExecutor(opts.workers) as pool:
+        audio = [pool.submit(render_clip, opts.out, key, clip) for key, clip in clips()]
+        figs = [pool.submit(render_figure, opts.out, *job) for job in figures()]
+        manifest["audio"] = dict(f.result() for f in audio)
+        manifest["figures"] = dict(f.result() for f in figs)
+
+    # O manifesto por último: um build interrompido não aponta para arquivos que faltam
+    tmp = os.path.join(opts.out, assets.MANIFEST + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as fp:
+        json.dump(manifest, fp, indent=1, sort_keys=True)
+    os.replace(tmp, os.path.join(opts.out, assets.MANIFEST))
+
+    size = sum(e["bytes"] for kind in ("audio", "figures") for e in manifest[kind].values())
+    print(
+        f"{len(manifest['audio'])} clipes e {len(manifest['figures'])} figuras em {opts.out} "
+        f"({size / 2**20:.1f} MB, {time.perf_counter() - start:.1f} s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
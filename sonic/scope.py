@@ -0,0 +1,125 @@
+"""Figuras de onda de layout fixo, recicladas entre reruns.
+
+O osciloscópio da página 9 muda a cada rerun (depende de sliders contínuos),
+então não dá para cachear o PNG como em `sonic.figure_cache`; o gráfico de
+interferência da página 7 é cacheado pela página por acorde, mas cada acorde
+novo ainda desenha. Em vez de montar uma figura nova a cada vez,
+um pool guarda figuras já prontas: por rerun só os dados das linhas mudam
+(`set_data`) e a figura volta para o pool depois do `savefig`. O número de
+figuras vivas fica limitado ao de reruns simultâneos, e nada passa pelo
+estado global do pyplot.
+"""
+import io
+import threading
+from contextlib import contextmanager
+
+from sonic import metrics
+from sonic.figure_cache import SAVEFIG
+
+BG = '#0e1117'
+
+
+class WavePlot:
+    """Um eixo com uma linha por estilo; `update` troca dados, rótulos e visibilidade."""
+
+    def __init__(self, figsize, styles, title=None, legend_loc="best"):
+        from matplotlib.figure import Figure  # Só no modo imagem (no canvas, nem carrega)
+
+        self.fig = Figure(figsize=figsize)
+        self.fig.patch.set_facecolor(BG)
+        self.ax = self.fig.subplots()
+        self.ax.set_facecolor(BG)
+        if title:
+            self.ax.set_title(title, color='white')
+        self.ax.axis('off')
+        self.lines = [self.ax.plot([], [], **style)[0] for style in styles]
+        self.legend_loc = legend_loc
+        self._labels = None
+
+    def update(self, x, series):
+        """`series`: um `(y, rótulo)` por linha, ou `None` para esconder a linha."""
+        labels = []
+        for line, item in zip(self.lines, series):
+            line.set_visible(item is not None)
+            if item is not None:
+                y, label = item
+                line.set_data(x, y)
+                line.set_label(label)
+                labels.append(label)
+
+        # A legenda só é refeita quando os rótulos mudam (ex.: outro acorde)
+        if labels != self._labels:
+            handles = [line for line in self.lines if line.get_visible()]
+            self.ax.legend(handles=handles, loc=self.legend_loc, facecolor='#222', labelcolor='white')
+            self._labels = labels
+
+        self.ax.relim(visible_only=True)
+        self.ax.autoscale_view()
+
+    def png(self):
+        buf = io.BytesIO()
+        self.fig.savefig(buf, format="png", **SAVEFIG)
+        return buf.getvalue()
+
+
+class Pool:
+    """Figuras montadas por `factory`, emprestadas a uma sessão por vez."""
+
+    def __init__(self, factory):
+        self.factory = factory
+        self._free = []
+        self._lock = threading.Lock()
+        self.created = 0
+
+    @contextmanager
+    def borrow(self):
+        with self._lock:
+            plot = self._free.pop() if self._free else None
+        if plot is None:
+            plot = self.factory()
+            self.created += 1
+        try:
+            yield plot
+        finally:
+            with self._lock:
+                self._free.append(plot)
+
+    def render(self, x, series):
+        with metrics.stage("scope"), self.borrow() as plot:
+            plot.update(x, series)
+            data = plot.png()
+        metrics.sent("figure", len(data))
+        return data
+
+
+# =========================================
+# PÁGINA 7: INTERFERÊNCIA DO ACORDE
+# =========================================
+CHORD_COLORS = ['#FFC107', '#03A9F4', '#4CAF50', '#E91E63']
+
+# Até 4 notas (acordes de 7ª) + a soma resultante
+CHORD_WAVES = Pool(lambda: WavePlot(
+    (10, 4),
+    [dict(alpha=0.3, linestyle='--', color=c) for c in CHORD_COLORS] + [dict(color='white', linewidth=3)],
+    title="Interferência das Ondas (Zoom de 40ms)",
+    legend_loc='upper right',
+))
+
+
+def chord_waves(t, waves, labels, y_sum):
+    series = [None] * len(CHORD_COLORS)
+    series[:len(waves)] = zip(waves, labels)
+    return CHORD_WAVES.render(t, series + [(y_sum, 'Soma Resultante')])
+
+
+# =========================================
+# PÁGINA 9: OSCILOSCÓPIO
+# =========================================
+OSCILLOSCOPE = Pool(lambda: WavePlot(
+    (6, 4),
+    [dict(color='#4CAF50', alpha=0.3), dict(color='#FFC107', alpha=0.3), dict(color='white', lw=1.5)],
+))
+
+
+def oscilloscope(t, target, user):
+    return OSCILLOSCOPE.render(t, [(target, 'Alvo'), (user, 'Você'), (target + user, 'Mix')])
@@ -0,0 +1,262 @@
+"""Motor de síntese aditiva compartilhado pelas páginas.
+
+Timbres e envelopes são declarados como dados. Um `Clip` descreve o que tocar
+(vozes × parciais) e `render` transforma tudo em amostras numa única chamada
+vetorizada, em vez de um `np.sin` por nota e por harmônico.
+
+A taxa de amostragem é escolhida por clipe: a menor taxa padrão cuja Nyquist
+cobre a parcial mais aguda com folga (`rate_for`). Um tom de 100 Hz não
+precisa de 44,1 kHz; a 16 kHz sai com ~1/3 da CPU, da memória e dos bytes.
+"""
+import os
+from dataclasses import dataclass
+
+import numpy as np
+
+from sonic import wavetable
+from sonic.oscillator import PhasorBank
+
+SAMPLE_RATE = 44100
+# Taxas padrão candidatas, da menor para a maior (16 kHz é o piso seguro para os navegadores)
+RATES = (16000, 22050, 32000, 44100)
+HEADROOM = 1.25  # Nyquist ≥ 1,25 × parcial mais aguda: espaço para o filtro do resampler
+# Número fixo (ex.: 44100) desliga a escolha automática em todo o app
+FIXED_RATE = os.environ.get("SONIC_SAMPLE_RATE")
+DTYPE = np.float32  # Todo o caminho de síntese; a conversão para int16 fica em sonic.pcm
+CHUNK = 16384       # Amostras por bloco do renderizador (memória constante)
+
+
+# --- TIMBRES (DADOS) ---
+@dataclass(frozen=True)
+class Partial:
+    ratio: float  # Múltiplo da fundamental (1 = fundamental, 2 = oitava...)
+    amp: float
+
+
+def _triangle(amp, n_partials):
+    # Série de Fourier da triangular: só harmônicos ímpares, caindo com 1/n²
+    # e alternando o sinal. Limitada em banda (não gera aliasing).
+    return tuple(
+        Partial(n, amp * (8 / np.pi**2) * (-1) ** k / n**2)
+        for k, n in enumerate(range(1, 2 * n_partials, 2))
+    )
+
+
+TIMBRES = {
+    "sine": (Partial(1, 1.0),),
+    # Página 9 (Treino Auditivo)
+    "flute": (Partial(1, 0.4),),
+    "electric_piano": (Partial(1, 0.4), Partial(2, 0.2), Partial(4, 0.1)),
+    "soft_string": _triangle(0.4, 16),
+    # Página 4 (Coma): "Dente de Serra suave"
+    "soft_saw": (Partial(1, 0.5), Partial(2, 0.125)),
+    # Página 3 (Escalas): Seno + Harmônico
+    "bright_sine": (Partial(1, 0.5), Partial(2, 0.2)),
+    # Página 7 (Acordes): timbre de órgão/piano
+    "organ": (Partial(1, 0.6), Partial(2, 0.2), Partial(3, 0.1)),
+}
+
+
+# --- ENVELOPES (DADOS) ---
+@dataclass(frozen=True)
+class Envelope:
+    attack: float = 0.0   # segundos
+    release: float = 0.0  # segundos
+
+    def segment(self, start, stop, n, sr):
+        """Trecho [start, stop) da curva de um clipe com `n` amostras.
+
+        Rampa linear de entrada e saída (evita o "pop" nas pontas). Devolve
+        None quando o trecho inteiro está no sustain (ganho 1).
+        """
+        a = min(int(round(self.attack * sr)), n)
+        r = min(int(round(self.release * sr)), n - a)
+        if a <= start and stop <= n - r:
+            return None
+        idx = np.arange(start, stop)
+        env = np.ones(stop - start, dtype=DTYPE)
+        if a:
+            head = idx < a
+            env[head] = idx[head] / max(a - 1, 1)
+        if r:
+            tail = idx >= n - r
+            env[tail] = 1 - (idx[tail] - (n - r)) / max(r - 1, 1)
+        return env
+
+
+ENVELOPES = {
+    "none": Envelope(),
+    "click": Envelope(500 / SAMPLE_RATE, 500 / SAMPLE_RATE),   # Notas curtas (escalas)
+    "soft": Envelope(2000 / SAMPLE_RATE, 2000 / SAMPLE_RATE),  # Fade In/Out sem estalo
+    "pad": Envelope(0.1, 0.3),                                 # Attack 100ms, Release 300ms
+}
+
+
+# --- ESPECIFICAÇÃO DO CLIPE ---
+@dataclass(frozen=True)
+class Voice:
+    freq: float
+    timbre: str = "sine"
+    gain: float = 1.0
+
+
+@dataclass(frozen=True)
+class Clip:
+    voices: tuple
+    duration: float                    # segundos (por nota, se `sequence`)
+    envelope: Envelope = Envelope()
+    peak: float | None = None          # Normaliza o pico final para este valor
+    sequence: bool = False             # True: vozes tocam uma após a outra
+    sr: int = SAMPLE_RATE
+    oscillator: str = "additive"       # "additive" (fasores), "sin" (referência) ou "wavetable"
+
+
+def _voices(freqs, timbre, gain):
+    return tuple(
+        f if isinstance(f, Voice) else Voice(float(f), timbre, gain)
+        for f in freqs
+    )
+
+
+def _envelope(envelope):
+    return ENVELOPES[envelope] if isinstance(envelope, str) else envelope
+
+
+def highest_partial(voices, oscillator="additive"):
+    """Frequência (Hz) da parcial mais aguda que o oscilador vai gerar."""
+    top = 0.0
+    for v in voices:
+        # A wavetable escolhe as parciais pelo topo da oitava da nota, não pela nota
+        f = wavetable.level_top(v.freq) if oscillator == "wavetable" else v.freq
+        top = max([top] + [f * p.ratio for p in TIMBRES[v.timbre]])
+    return top
+
+
+def rate_for(voices, oscillator="additive"):
+    """Menor taxa de `RATES` que cobre a parcial mais aguda com `HEADROOM`."""
+    if FIXED_RATE:
+        return int(FIXED_RATE)
+    need = 2 * HEADROOM * highest_partial(voices, oscillator)
+    return next((sr for sr in RATES if sr >= need), SAMPLE_RATE)
+
+
+def chord(freqs, duration, timbre="sine", *, gain=1.0, envelope="none", peak=None, sr=None,
+          oscillator="additive"):
+    """Todas as vozes soando juntas. `freqs` aceita números ou `Voice`.
+
+    `sr=None` escolhe a taxa pelo conteúdo (`rate_for`); um número força a taxa.
+    """
+    voices = _voices(freqs, timbre, gain)
+    sr = sr or rate_for(voices, oscillator)
+    return Clip(voices, float(duration), _envelope(envelope), peak, False, sr, oscillator)
+
+
+def sequence(freqs, note_duration, timbre="sine", *, gain=1.0, envelope="none", peak=None, sr=None,
+             oscillator="additive"):
+    """Uma voz depois da outra, cada uma com `note_duration` segundos e seu próprio envelope."""
+    voices = _voices(freqs, timbre, gain)
+    sr = sr or rate_for(voices, oscillator)
+    return Clip(voices, float(note_duration), _envelope(envelope), peak, True, sr, oscillator)
+
+
+# --- RENDERIZAÇÃO ---
+def partials(voices, sr):
+    """Achata as vozes em vetores (freq, amp) de todas as parciais audíveis."""
+    nyquist = sr / 2
+    freqs, amps = [], []
+    for v in voices:
+        for p in TIMBRES[v.timbre]:
+            f = v.freq * p.ratio
+            if 0 < f < nyquist:  # Parciais acima de Nyquist viram aliasing: descarta
+                freqs.append(f)
+                amps.append(v.gain * p.amp)
+    return np.array(freqs), np.array(amps, dtype=DTYPE)
+
+
+def _direct(voices, sr, size):
+    freqs, amps = partials(voices, sr)
+    inc = freqs / sr  # Ciclos por amostra
+
+    def block(start, stop):
+        # Referência: um np.sin por bloco cobrindo todas as parciais de todas as notas.
+        # A fase vem do índice absoluto em float64, dobrada em [0, 1) antes de
+        # cair para float32: continuidade entre blocos e precisão em clipes longos.
+        phase = np.outer(inc, np.arange(start, stop))
+        phase %= 1.0
+        osc = phase.astype(DTYPE)
+        osc *= 2 * np.pi
+        np.sin(osc, out=osc)
+        return amps @ osc
+
+    return block
+
+
+def _additive(voices, sr, size):
+    # Fasores girando: as tabelas de um bloco são calculadas uma vez por clipe
+    freqs, amps = partials(voices, sr)
+    return PhasorBank(freqs, amps, sr, size)
+
+
+def _wavetable(voices, sr, size):
+    timbres = [tuple((p.ratio, p.amp) for p in TIMBRES[v.timbre]) for v in voices]
+
+    def block(start, stop):
+        out = np.zeros(stop - start, dtype=DTYPE)
+        for v, timbre in zip(voices, timbres):
+            w = wavetable.render(timbre, v.freq, start, stop, sr)
+            w *= v.gain
+            out += w
+        return out
+
+    return block
+
+
+OSCILLATORS = {"additive": _additive, "sin": _direct, "wavetable": _wavetable}
+
+
+def frames(clip):
+    """Total de amostras do clipe renderizado."""
+    n = int(clip.sr * clip.duration)
+    return n * len(clip.voices) if clip.sequence else n
+
+
+def stream(clip, block=CHUNK):
+    """Gera o clipe em blocos de até `block` amostras float32.
+
+    Memória constante (só o bloco atual existe) e fase contínua entre blocos,
+    então serve para drones de minutos. Não aplica `peak`: quem consome os
+    blocos decide o ganho (ver `peak_bound`).
+    """
+    n = int(clip.sr * clip.duration)
+    groups = [(v,) for v in clip.voices] if clip.sequence else [clip.voices]
+    make = OSCILLATORS[clip.oscillator]
+    for voices in groups:
+        osc = make(voices, clip.sr, min(block, n))
+        for start in range(0, n, block):
+            stop = min(start + block, n)
+            out = osc(start, stop)
+            env = clip.envelope.segment(start, stop, n, clip.sr)
+            if env is not None:
+                out *= env
+            yield out
+
+
+def peak_bound(clip):
+    """Limite superior do pico (soma das amplitudes), conhecido antes de renderizar."""
+    groups = [(v,) for v in clip.voices] if clip.sequence else [clip.voices]
+    return max((float(np.abs(partials(g, clip.sr)[1]).sum()) for g in groups), default=0.0)
+
+
+def render(clip):
+    """Clipe inteiro num buffer float32, com o pico normalizado se `clip.peak`."""
+    out = np.empty(frames(clip), dtype=DTYPE)
+    pos = 0
+    for b in stream(clip):
+        out[pos:pos + len(b)] = b
+        pos += len(b)
+
+    if clip.peak is not None and out.size:
+        max_val = np.max(np.abs(out))
+        if max_val > 0:
+            out *= clip.peak / max_val
+    return out
@@ -0,0 +1,103 @@
+"""Tabelas de afinação pré-calculadas: MIDI 0–127 × sistemas de afinação.
+
+Cada sistema de 12 notas é declarado como 12 desvios em cents a partir da
+tônica. `table(...)` monta o vetor de 128 frequências uma única vez por
+(sistema, referência) e devolve sempre o mesmo array (somente leitura), então
+as páginas fazem só uma indexação por rerun.
+"""
+import re
+from functools import lru_cache
+
+import numpy as np
+
+NOTE_NAMES = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
+MIDI = np.arange(128)
+
+
+def _cents(ratios):
+    return tuple(1200 * np.log2(r) for r in ratios)
+
+
+def _chain_of_fifths(fifth):
+    # Cadeia de quintas de Eb (-3) até G# (+8), dobrada para dentro da oitava.
+    # O "Lobo" fica entre G# e Eb.
+    steps = {0: 0, 7: 1, 2: 2, 9: 3, 4: 4, 11: 5, 6: 6, 1: 7, 8: 8, 3: -3, 10: -2, 5: -1}
+    cents = []
+    for pc in range(12):
+        c = steps[pc] * 1200 * np.log2(fifth)
+        cents.append(c - 1200 * np.floor(c / 1200))
+    return tuple(cents)
+
+
+SYSTEMS = {
+    "12-EDO": tuple(100.0 * k for k in range(12)),
+    # Afinação Justa (5-limit), a mesma das páginas 2, 6 e 8
+    "just": _cents([1/1, 16/15, 9/8, 6/5, 5/4, 4/3, 45/32, 3/2, 8/5, 5/3, 9/5, 15/8]),
+    "pythagorean": _chain_of_fifths(3 / 2),
+    # Mesotônico de 1/4 de coma: quintas de 5^(1/4) para terças puras (5:4)
+    "meantone": _chain_of_fifths(5 ** 0.25),
+    # Temperamentos "bons" (circulantes) do Barroco
+    "werckmeister3": (0.0, 90.225, 192.18, 294.135, 390.225, 498.045, 588.27, 696.09, 792.18, 888.27, 996.09, 1092.18),
+    "kirnberger3": (0.0, 90.225, 193.157, 294.135, 386.314, 498.045, 590.224, 696.578, 792.18, 889.735, 996.09, 1088.269),
+    "vallotti": (0.0, 94.135, 196.09, 298.045, 392.18, 501.955, 592.18, 698.045, 796.09, 894.135, 1000.0, 1090.225),
+}
+
+_EDO = re.compile(r"^(\d+)-EDO$")
+
+
+def ratios(system):
+    """12 razões (a partir da tônica) de um sistema de 12 notas."""
+    return 2.0 ** (np.array(SYSTEMS[system]) / 1200)
+
+
+@lru_cache(maxsize=None)
+def table(system="12-EDO", ref_freq=440.0, ref_midi=69, tonic=0):
+    """Frequência (Hz) de cada nota MIDI 0–127.
+
+    `ref_midi` soa exatamente em `ref_freq` (padrão: Lá4 = 440 Hz) e `tonic` é a
+    classe de altura (0 = C) onde o sistema começa. "N-EDO" divide a oitava em N
+    partes iguais, uma nota MIDI por passo.
+    """
+    edo = _EDO.match(system)
+    if edo:
+        freqs = 2.0 ** ((MIDI - ref_midi) / int(edo.group(1)))
+    else:
+        rel = MIDI - tonic
+        freqs = 2.0 ** (rel // 12) * ratios(system)[rel % 12]
+        freqs /= freqs[ref_midi]
+    freqs = freqs * ref_freq
+    freqs.setflags(write=False)
+    return freqs
+
+
+def midi(pitch_class, octave):
+    """Número MIDI de uma nota (C4 = 60)."""
+    return 12 * (octave + 1) + pitch_class
+
+
+def stack_fifths(passos):
+    """Classes de altura geradas empilhando quintas a partir de C (C, G, D...)."""
+    return [(7 * k) % 12 for k in range(passos)]
+
+
+def frame(ref_freq=440.0, ref_midi=69, tonic=0, systems=None):
+    """DataFrame MIDI × sistemas (colunas em Hz)."""
+    import pandas as pd
+
+    systems = systems or list(SYSTEMS)
+    data = {"midi": MIDI, "note": [f"{NOTE_NAMES[m % 12]}{m // 12 - 1}" for m in MIDI]}
+    for name in systems:
+        data[name] = table(name, ref_freq, ref_midi, tonic)
+    return pd.DataFrame(data)
+
+
+def to_arrow(**kwargs):
+    import pyarrow as pa
+
+    return pa.Table.from_pandas(frame(**kwargs), preserve_index=False)
+
+
+def to_parquet(path, **kwargs):
+    import pyarrow.parquet as pq
+
+    pq.write_table(to_arrow(**kwargs), path)
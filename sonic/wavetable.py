@@ -0,0 +1,59 @@
+"""Banco de osciladores por wavetable, limitado em banda.
+
+Para cada timbre pré-calculamos um ciclo único por oitava ("mip levels"): a
+tabela da oitava só contém as parciais que ficam abaixo de Nyquist mesmo na
+nota mais aguda daquela oitava. Renderizar vira um acumulador de fase
+vetorizado + uma leitura (gather) com interpolação linear, sem nenhum `sin`
+por amostra e sem aliasing.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+TABLE_SIZE = 2048
+BASE_FREQ = 20.0  # Topo da oitava 0 = 40 Hz, oitava 1 = 80 Hz...
+N_LEVELS = 10     # Até 20480 Hz
+
+
+def _level(freq):
+    # Primeira oitava cujo topo ainda cobre a frequência
+    k = int(np.ceil(np.log2(max(freq, BASE_FREQ) / BASE_FREQ))) - 1
+    return min(max(k, 0), N_LEVELS - 1)
+
+
+def level_top(freq):
+    """Topo da oitava usada para `freq`: as parciais da tabela valem para até essa nota."""
+    return BASE_FREQ * 2 ** (_level(freq) + 1)
+
+
+@lru_cache(maxsize=None)
+def tables(partials, sr):
+    """Matriz (oitavas × TABLE_SIZE + 1) com a última amostra repetindo a primeira
+    (guarda para a interpolação não precisar de módulo)."""
+    phase = np.arange(TABLE_SIZE) / TABLE_SIZE
+    nyquist = sr / 2
+    out = np.zeros((N_LEVELS, TABLE_SIZE + 1), dtype=np.float32)
+    for k in range(N_LEVELS):
+        f_top = BASE_FREQ * 2 ** (k + 1)  # = level_top de qualquer nota da oitava k
+        for ratio, amp in partials:
+            if ratio * f_top < nyquist:
+                out[k, :TABLE_SIZE] += amp * np.sin(2 * np.pi * ratio * phase)
+    out[:, TABLE_SIZE] = out[:, 0]
+    out.setflags(write=False)
+    return out
+
+
+def render(partials, freq, start, stop, sr):
+    """Amostras [start, stop) de um timbre (tupla de (ratio, amp)) em `freq` Hz."""
+    table = tables(partials, sr)[_level(freq)]
+    # Acumulador de fase em ciclos, a partir do índice absoluto: blocos
+    # consecutivos continuam a fase (float64 para não perder precisão)
+    pos = ((freq / sr) * np.arange(start, stop)) % 1.0
+    pos *= TABLE_SIZE
+    i0 = pos.astype(np.intp)
+    frac = (pos - i0).astype(np.float32)
+    lo = table[i0]
+    out = table[i0 + 1] - lo
+    out *= frac
+    out += lo
+    return out